@@ -26,6 +26,43 @@ class EmployeeFactory(ABC):
                 expected=f"присутствуют: {', '.join(missing)}"
             )
 
+    @staticmethod
+    def from_dict(data: dict):
+        """
+        Создает сотрудника из словаря (результата to_dict)
+
+        Args:
+            data: Словарь с данными сотрудника
+
+        Returns:
+            Объект сотрудника соответствующего типа
+
+        InvalidDataError: Если тип сотрудника неизвестен или данные некорректны
+        """
+        if 'type' not in data:
+            raise InvalidDataError(
+                field="обязательное поле 'type'",
+                value="отсутствует",
+                expected="присутствует в данных"
+            )
+
+        emp_type = data['type'].lower()
+
+        if emp_type == 'employee':
+            return Employee.from_dict(data)
+        elif emp_type == 'manager':
+            return Manager.from_dict(data)
+        elif emp_type == 'developer':
+            return Developer.from_dict(data)
+        elif emp_type == 'salesperson':
+            return Salesperson.from_dict(data)
+        else:
+            raise InvalidDataError(
+                field="type",
+                value=data['type'],
+                expected="Employee, Manager, Developer или Salesperson"
+            )
+
 
 class DeveloperFactory(EmployeeFactory):
     """Фабрика для создания разработчиков"""
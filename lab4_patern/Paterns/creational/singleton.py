@@ -13,27 +13,27 @@ class DatabaseConnection:
     _connection: Optional[sqlite3.Connection] = None
     
     def __new__(cls):
-      """ создание нового экземпляра"""
+        """ создание нового экземпляра"""
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-      """ инициализация"""
+        """ инициализация"""
         if self._connection is None:
             self._connection = None
     
     @classmethod
     def get_instance(cls) -> 'DatabaseConnection':
-      """
-      Получить единственный экземпляр класса.
-      """
+        """
+        Получить единственный экземпляр класса.
+        """
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
     
     def get_connection(self, db_path: str = "company.db") -> sqlite3.Connection:
-     """ получить подключение к бд""" 
+        """ получить подключение к бд""" 
         if self._connection is None:
             self._connection = sqlite3.connect(db_path)
             self._connection.row_factory = sqlite3.Row
@@ -46,7 +46,7 @@ class DatabaseConnection:
             self._connection = None
     
     def _create_tables(self) -> None:
-      """создание таблицы в бд"""
+        """создание таблицы в бд"""
         if self._connection is None:
             return
         
@@ -76,7 +76,7 @@ class DatabaseConnection:
         self._connection.commit()
     
     def reset_instance(self) -> None:
-      """
+        """
         Сбросить экземпляр
         FOR TEST ONLY
         """
@@ -0,0 +1,806 @@
+import sys
+import os
+import time
+import random
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def print_header(text):
+    """Печатает заголовок раздела"""
+    print("\n" + "=" * 70)
+    print(f"  {text}")
+    print("=" * 70)
+
+
+def build_company(departments: int = 64, employees: int = 10_000, thread_safe: bool = True):
+    """Создает компанию с равномерно распределенными сотрудниками"""
+    from core_OOP.Company import Company
+    from core_OOP.Department import Department
+    from core_OOP.Employee import Employee
+
+    company = Company("Benchmark", thread_safe=thread_safe)
+    for d in range(departments):
+        company.add_department(Department(f"Отдел {d}"))
+
+    names = [dept.name for dept in company.get_departments()]
+    for emp_id in range(1, employees + 1):
+        dept_name = names[emp_id % departments]
+        company.get_department(dept_name).add_employee(
+            Employee(emp_id, f"Сотрудник {emp_id}", dept_name, 1000 + emp_id % 500)
+        )
+    return company
+
+
+def bench_contention(thread_counts=(1, 2, 4, 8, 16, 32), ops_per_thread: int = 20_000):
+    """
+    Конкурентная нагрузка на Company в потокобезопасном режиме
+
+    Каждый поток выполняет смесь операций: 20% переводов между отделами,
+    70% поиска по ID, 10% расчета фонда оплаты отдела.
+    """
+    from core_OOP.exceptions import EmployeeNotFoundError
+
+    print_header("Конкурентный доступ к Company (thread_safe=True)")
+    print(f"{'потоков':>8} {'операций':>10} {'время, с':>10} {'оп/с':>12} {'конфликтов':>11}")
+
+    for threads in thread_counts:
+        company = build_company()
+        names = [dept.name for dept in company.get_departments()]
+        employee_count = len(company)
+        conflicts = [0] * threads
+
+        def worker(n):
+            rnd = random.Random(n)
+            for _ in range(ops_per_thread):
+                roll = rnd.random()
+                emp_id = rnd.randint(1, employee_count)
+                if roll < 0.2:
+                    source = company.get_employee_department(emp_id).name
+                    target = rnd.choice(names)
+                    try:
+                        company.transfer_employee(emp_id, source, target)
+                    except EmployeeNotFoundError:
+                        # сотрудника успел перевести другой поток
+                        conflicts[n] += 1
+                elif roll < 0.9:
+                    company.find_employee_by_id(emp_id)
+                else:
+                    company.get_department(rnd.choice(names)).calculate_total_salary()
+
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        assert len(company) == employee_count, "потеряны сотрудники при переводах"
+        total_ops = threads * ops_per_thread
+        print(f"{threads:>8} {total_ops:>10} {elapsed:>10.3f} {total_ops / elapsed:>12.0f} {sum(conflicts):>11}")
+
+
+def bench_journal(operations: int = 5_000, employees: int = 10_000):
+    """
+    Журнал изменений: fsync на каждую операцию против group commit
+
+    В режиме "sync" после каждого изменения вызывается flush (один fsync
+    на операцию), в режиме "group" изменения сбрасываются пачками.
+    Отдельно измеряется восстановление из снимка и хвоста журнала.
+    """
+    import shutil
+    import tempfile
+    from data_base.journal import CompanyJournal
+
+    print_header("Журнал изменений: group commit и восстановление")
+    print(f"{'режим':>8} {'операций':>10} {'время, с':>10} {'оп/с':>12} {'восстановление, с':>18}")
+
+    for mode in ("sync", "group"):
+        directory = tempfile.mkdtemp(prefix="journal-bench-")
+        try:
+            company = build_company(employees=employees, thread_safe=False)
+            journal = CompanyJournal(directory)
+            journal.attach(company)
+
+            rnd = random.Random(0)
+            start = time.perf_counter()
+            for _ in range(operations):
+                company.update_salary(rnd.randint(1, employees), rnd.randint(1000, 5000))
+                if mode == "sync":
+                    journal.flush()
+            journal.flush()
+            elapsed = time.perf_counter() - start
+            journal.close()
+
+            start = time.perf_counter()
+            recovered_journal = CompanyJournal(directory)
+            recovered = recovered_journal.recover()
+            recovery = time.perf_counter() - start
+            recovered_journal.close()
+            assert recovered.calculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+
+            print(f"{mode:>8} {operations:>10} {elapsed:>10.3f} {operations / elapsed:>12.0f} {recovery:>18.3f}")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_mixed(threads: int = 8, ops_per_thread: int = 2_000, rows: int = 10_000,
+                   write_share: float = 0.2):
+    """
+    Смешанная нагрузка чтение/запись на SQLite из нескольких потоков
+
+    "naive" - у каждого потока свое соединение в режиме по умолчанию и
+    фиксация после каждой записи; "manager" - DatabaseConnection: читатели
+    в режиме WAL и один поток-писатель, объединяющий записи в транзакции.
+    """
+    import sqlite3
+    import shutil
+    import tempfile
+    from data_base.connection import DatabaseConnection
+
+    print_header(f"SQLite: смешанная нагрузка ({threads} потоков, {write_share:.0%} записей)")
+    print(f"{'режим':>8} {'операций':>10} {'время, с':>10} {'оп/с':>12} {'ошибок':>8}")
+
+    upsert = ("INSERT INTO employees (id, name, department, base_salary, employee_type) "
+              "VALUES (?, ?, ?, ?, 'Employee') "
+              "ON CONFLICT(id) DO UPDATE SET base_salary = excluded.base_salary")
+    select = "SELECT * FROM employees WHERE id = ?"
+
+    for mode in ("naive", "manager"):
+        directory = tempfile.mkdtemp(prefix="db-bench-")
+        db_path = os.path.join(directory, "company.db")
+        DatabaseConnection.get_instance().reset_instance()
+        db = DatabaseConnection.get_instance()
+        db.configure(db_path)
+        db.executemany_write(upsert, ((i, f"Сотрудник {i}", "Отдел", 1000) for i in range(1, rows + 1)))
+        if mode == "naive":
+            db.reset_instance()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("PRAGMA journal_mode = DELETE")
+
+        errors = [0] * threads
+
+        def worker(n):
+            rnd = random.Random(n)
+            conn = sqlite3.connect(db_path) if mode == "naive" else None
+            for _ in range(ops_per_thread):
+                emp_id = rnd.randint(1, rows)
+                try:
+                    if rnd.random() < write_share:
+                        if conn is None:
+                            db.execute_write(upsert, (emp_id, "x", "Отдел", rnd.randint(1000, 5000)))
+                        else:
+                            conn.execute(upsert, (emp_id, "x", "Отдел", rnd.randint(1000, 5000)))
+                            conn.commit()
+                    elif conn is None:
+                        db.get_connection().execute(select, (emp_id,)).fetchone()
+                    else:
+                        conn.execute(select, (emp_id,)).fetchone()
+                except sqlite3.OperationalError:
+                    # "database is locked"
+                    errors[n] += 1
+            if conn is not None:
+                conn.close()
+
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        total_ops = threads * ops_per_thread
+        print(f"{mode:>8} {total_ops:>10} {elapsed:>10.3f} {total_ops / elapsed:>12.0f} {sum(errors):>8}")
+        DatabaseConnection.get_instance().reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def make_employee(emp_id: int):
+    """Сотрудник одного из четырех классов в зависимости от ID"""
+    from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+
+    kind = emp_id % 4
+    if kind == 0:
+        return Employee(emp_id, f"Сотрудник {emp_id}", "Отдел", 1000 + emp_id % 500)
+    if kind == 1:
+        return Manager(emp_id, f"Менеджер {emp_id}", "Управление", 2000 + emp_id % 500, 300)
+    if kind == 2:
+        return Developer(emp_id, f"Разработчик {emp_id}", "Разработка", 1500 + emp_id % 500,
+                         ["Python", "SQL"], "middle")
+    return Salesperson(emp_id, f"Продавец {emp_id}", "Продажи", 900 + emp_id % 500, 0.1, 5000)
+
+
+def bench_db_bulk(rows: int = 100_000, single_rows: int = 2_000):
+    """
+    Сохранение сотрудников в SQLite: по одному против save_employees
+
+    Для построчного сохранения берется single_rows сотрудников (иначе
+    слишком долго), скорость сравнивается в строках в секунду.
+    """
+    import shutil
+    import tempfile
+    from data_base.connection import DatabaseConnection
+
+    print_header(f"SQLite: пакетное сохранение и загрузка ({rows} сотрудников)")
+    print(f"{'операция':>16} {'строк':>10} {'время, с':>10} {'строк/с':>12}")
+
+    employees = [make_employee(emp_id) for emp_id in range(1, rows + 1)]
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+
+        def report(operation, count, elapsed):
+            print(f"{operation:>16} {count:>10} {elapsed:>10.3f} {count / elapsed:>12.0f}")
+
+        start = time.perf_counter()
+        for employee in employees[:single_rows]:
+            db.save_employee(employee.to_dict())
+        report("save_employee", single_rows, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        saved = db.save_employees(employees)
+        report("save_employees", saved, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        loaded = db.load_employees()
+        report("load_employees", len(loaded), time.perf_counter() - start)
+        assert len(loaded) == rows
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_indexes(rows: int = 100_000, repeats: int = 50):
+    """
+    Частые запросы репозитория до и после миграции с индексами
+
+    Схема сначала доводится до версии 1 (без индексов), затем до последней.
+    План каждого запроса проверяется через EXPLAIN QUERY PLAN: поиск по
+    индексу и сортировка без временного B-дерева.
+    """
+    import sqlite3
+    import shutil
+    import tempfile
+    from data_base.connection import DatabaseConnection
+    from data_base.migrations import SchemaMigrator
+    from data_base.repository import EmployeeRepository
+
+    queries = {
+        "по отделу": (EmployeeRepository.BY_DEPARTMENT_SQL, ("Отдел 7",)),
+        "по типу": (EmployeeRepository.BY_TYPE_SQL, ("Manager",)),
+        "тип+зарплата": (EmployeeRepository.BY_TYPE_SALARY_SQL, ("Developer", 1600, 1700)),
+    }
+
+    print_header(f"SQLite: индексы и планы запросов ({rows} сотрудников)")
+    print(f"{'запрос':>14} {'без индекса, мс':>16} {'с индексом, мс':>15}  план")
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    connection = sqlite3.connect(os.path.join(directory, "company.db"), isolation_level=None)
+    try:
+        migrator = SchemaMigrator()
+        migrator.migrate(connection, target=1)
+        connection.execute("BEGIN")
+        connection.executemany(DatabaseConnection.EMPLOYEE_UPSERT,
+                               (DatabaseConnection.employee_row(make_employee(emp_id))
+                                for emp_id in range(1, rows + 1)))
+        # 64 отдела вместо четырех у make_employee - ближе к реальной избирательности
+        connection.execute("UPDATE employees SET department = 'Отдел ' || (id % 64)")
+        connection.execute("COMMIT")
+
+        def measure(sql, params):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                connection.execute(sql, params).fetchall()
+            return (time.perf_counter() - start) / repeats * 1000
+
+        before = {name: measure(*query) for name, query in queries.items()}
+        migrator.migrate(connection)
+
+        for name, (sql, params) in queries.items():
+            plan = " / ".join(row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + sql, params))
+            assert "USING INDEX" in plan or "USING COVERING INDEX" in plan, f"{name}: {plan}"
+            # ORDER BY должен обслуживаться индексом, без сортировки результата
+            assert "TEMP B-TREE" not in plan, f"{name}: {plan}"
+            print(f"{name:>14} {before[name]:>16.2f} {measure(sql, params):>15.2f}  {plan}")
+    finally:
+        connection.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_payroll(rows: int = 100_000):
+    """
+    Фонд оплаты труда: SQL-агрегат против загрузки объектов
+
+    Итог SQL сверяется с Company.calculate_total_monthly_cost по тем же
+    сотрудникам, а разбивка по отделам - с Department.calculate_total_salary.
+    """
+    import math
+    import shutil
+    import tempfile
+    from core_OOP.Company import Company
+    from core_OOP.Department import Department
+    from data_base.connection import DatabaseConnection
+    from data_base.repository import EmployeeRepository
+
+    print_header(f"SQLite: фонд оплаты труда ({rows} сотрудников)")
+    print(f"{'способ':>22} {'время, с':>10} {'сумма':>18}")
+
+    company = Company("Benchmark")
+    for emp_id in range(1, rows + 1):
+        employee = make_employee(emp_id)
+        if employee.department not in {dept.name for dept in company.get_departments()}:
+            company.add_department(Department(employee.department))
+        company.get_department(employee.department).add_employee(employee)
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees(company.iter_employees())
+        repository = EmployeeRepository(db)
+
+        def report(method, func):
+            start = time.perf_counter()
+            value = func()
+            print(f"{method:>22} {time.perf_counter() - start:>10.3f} {value:>18.2f}")
+            return value
+
+        expected = report("Company (в памяти)", company.calculate_total_monthly_cost)
+        loaded = report("загрузка объектов", lambda: sum(
+            (employee.calculate_salary() for employee in db.load_employees()), 0.0))
+        total = report("SQL total_payroll", repository.total_payroll)
+
+        assert math.isclose(total, expected, rel_tol=1e-12), (total, expected)
+        assert math.isclose(loaded, expected, rel_tol=1e-12), (loaded, expected)
+        by_department: dict = {}
+        for row in repository.payroll_by_department():
+            by_department[row.department] = by_department.get(row.department, 0.0) + row.total
+        for department in company.get_departments():
+            assert math.isclose(by_department[department.name], department.calculate_total_salary(),
+                                rel_tol=1e-12), department.name
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_cache(rows: int = 100_000, hot: int = 2_000, lookups: int = 200_000,
+                   write_every: int = 1_000):
+    """
+    Поиск сотрудника по ID: get_employee против EmployeeCache
+
+    Запросы идут к hot "популярным" сотрудникам; каждые write_every
+    запросов один из них перезаписывается, и кэш обязан вернуть новое
+    значение.
+    """
+    import shutil
+    import tempfile
+    from data_base.cache import EmployeeCache
+    from data_base.connection import DatabaseConnection
+
+    print_header(f"SQLite: кэш сотрудников ({lookups} запросов к {hot} из {rows})")
+    print(f"{'способ':>14} {'время, с':>10} {'запросов/с':>12} {'попадания':>10}")
+
+    rng = random.Random(42)
+    ids = [rng.randint(1, hot) for _ in range(lookups)]
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees(make_employee(emp_id) for emp_id in range(1, rows + 1))
+        cache = EmployeeCache(db, max_size=hot)
+
+        def run(method, lookup):
+            start = time.perf_counter()
+            for number, emp_id in enumerate(ids, start=1):
+                lookup(emp_id)
+                if number % write_every == 0:
+                    updated = make_employee(emp_id)
+                    updated.name = f"Сотрудник {emp_id} ({number})"
+                    db.save_employee(updated)
+                    assert cache.get(emp_id).name == updated.name
+            elapsed = time.perf_counter() - start
+            rate = f"{cache.stats().hit_rate:.1%}" if method == "EmployeeCache" else "-"
+            print(f"{method:>14} {elapsed:>10.3f} {lookups / elapsed:>12.0f} {rate:>10}")
+
+        run("get_employee", db.get_employee)
+        cache.reset_stats()
+        run("EmployeeCache", cache.get)
+        assert cache.get(1) is cache.get(1)
+        cache.close()
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_stream(rows: int = 500_000, batch_size: int = 1_000):
+    """
+    Обход всей таблицы employees: EmployeeRepository.stream против load_employees
+
+    Память - прирост пикового RSS процесса (ru_maxrss) после каждого
+    способа; потоковые обходы идут первыми, поэтому их прирост не
+    маскируется загрузкой всей таблицы.
+    """
+    import resource
+    import shutil
+    import tempfile
+    from data_base.connection import DatabaseConnection
+    from data_base.repository import EmployeeRepository
+
+    def peak_rss_mb():
+        # Linux возвращает килобайты, macOS - байты
+        scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+    print_header(f"SQLite: потоковый обход ({rows} сотрудников, страница {batch_size})")
+    print(f"{'способ':>22} {'строк':>10} {'время, с':>10} {'строк/с':>10} {'+RSS, МБ':>10}")
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees((make_employee(emp_id) for emp_id in range(1, rows + 1)),
+                          batch_size=batch_size * 10)
+        repository = EmployeeRepository(db)
+
+        def report(method, func):
+            before = peak_rss_mb()
+            start = time.perf_counter()
+            count = func()
+            elapsed = time.perf_counter() - start
+            print(f"{method:>22} {count:>10} {elapsed:>10.3f} {count / elapsed:>10.0f} "
+                  f"{peak_rss_mb() - before:>10.1f}")
+            return count
+
+        def count(iterable):
+            return sum(1 for _ in iterable)
+
+        streamed = report("stream (строки)", lambda: count(repository.stream(batch_size=batch_size, rows=True)))
+        report("stream (объекты)", lambda: count(repository.stream(batch_size=batch_size)))
+        filtered = report("stream (отдел, оклад)", lambda: count(repository.stream(
+            department="Разработка", min_salary=1700, max_salary=1800, batch_size=batch_size)))
+        loaded = report("load_employees", lambda: len(db.load_employees()))
+
+        assert streamed == loaded == rows
+        assert filtered == sum(1 for employee in db.load_employees(department="Разработка")
+                               if 1700 <= employee.base_salary <= 1800)
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_profiles(rows: int = 100_000, single_rows: int = 1_000, lookups: int = 20_000,
+                      aggregates: int = 20):
+    """
+    Профили хранения SQLite на стандартных нагрузках
+
+    Для каждого профиля из STORAGE_PROFILES - новая БД: построчные
+    вставки (save_employee, транзакция на строку), пакетная вставка
+    (save_employees), поиск по ID (EmployeeRepository.get) и агрегаты
+    (payroll_by_department + total_payroll). Результаты сводятся в таблицу.
+    """
+    import shutil
+    import tempfile
+    from data_base.connection import DatabaseConnection, STORAGE_PROFILES
+    from data_base.repository import EmployeeRepository
+
+    print_header(f"SQLite: профили хранения ({rows} сотрудников)")
+
+    rng = random.Random(42)
+    lookup_ids = [rng.randint(1, rows) for _ in range(lookups)]
+    employees = [make_employee(emp_id) for emp_id in range(1, rows + 1)]
+    results = []
+    for name, profile in STORAGE_PROFILES.items():
+        directory = tempfile.mkdtemp(prefix="db-bench-")
+        db = DatabaseConnection.get_instance()
+        try:
+            db.configure(os.path.join(directory, "company.db"), profile=name)
+            repository = EmployeeRepository(db)
+
+            start = time.perf_counter()
+            for employee in employees[:single_rows]:
+                db.save_employee(employee)
+            single = single_rows / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            db.save_employees(employees[single_rows:])
+            bulk = (rows - single_rows) / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for emp_id in lookup_ids:
+                repository.get(emp_id)
+            point = lookups / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(aggregates):
+                repository.payroll_by_department()
+                repository.total_payroll()
+            aggregate_ms = (time.perf_counter() - start) / aggregates * 1000
+
+            results.append((name, profile, single, bulk, point, aggregate_ms))
+        finally:
+            db.reset_instance()
+            shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{'профиль':>12} {'журнал':>7} {'sync':>7} {'вставка/с':>10} {'пакет, стр/с':>13} "
+          f"{'поиск/с':>10} {'агрегат, мс':>12}")
+    for name, profile, single, bulk, point, aggregate_ms in results:
+        print(f"{name:>12} {profile.journal_mode:>7} {profile.synchronous:>7} {single:>10.0f} "
+              f"{bulk:>13.0f} {point:>10.0f} {aggregate_ms:>12.1f}")
+
+
+def bench_db_skills(rows: int = 100_000, skills: int = 30, repeats: int = 20):
+    """
+    Поиск разработчиков по набору навыков: LIKE по tech_stack против employee_skills
+
+    У каждого разработчика 3-6 случайных навыков из skills. Ищутся
+    сотрудники, у которых есть все навыки запроса; результаты обоих
+    способов сверяются с фильтром по объектам в памяти.
+    """
+    import json
+    import shutil
+    import tempfile
+    from core_OOP.Employee import Developer
+    from data_base.connection import DatabaseConnection
+    from data_base.repository import EmployeeRepository
+
+    print_header(f"SQLite: поиск по навыкам ({rows} сотрудников, {skills} навыков)")
+    print(f"{'запрос':>26} {'найдено':>8} {'LIKE, мс':>10} {'индекс, мс':>11}")
+
+    rng = random.Random(42)
+    pool = [f"Skill{number}" for number in range(skills)]
+    employees = []
+    for emp_id in range(1, rows + 1):
+        employee = make_employee(emp_id)
+        if isinstance(employee, Developer):
+            employee = Developer(emp_id, employee.name, employee.department, employee.base_salary,
+                                 rng.sample(pool, rng.randint(3, 6)), "middle")
+        employees.append(employee)
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees(employees)
+        repository = EmployeeRepository(db)
+        connection = db.get_connection()
+
+        for query in (pool[:1], pool[:2], pool[:3]):
+            like_sql = (f"SELECT {EmployeeRepository.COLUMNS} FROM employees WHERE "
+                        + " AND ".join("tech_stack LIKE ?" for _ in query) + " ORDER BY id")
+            like_params = [f"%{json.dumps(skill)}%" for skill in query]
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                like_ids = [row[0] for row in connection.execute(like_sql, like_params)]
+            like_ms = (time.perf_counter() - start) / repeats * 1000
+
+            # оба способа читают одни и те же строки, объекты не создаются
+            skills_params = (json.dumps(sorted(query)), len(query))
+            start = time.perf_counter()
+            for _ in range(repeats):
+                index_ids = [row[0] for row in connection.execute(EmployeeRepository.BY_SKILLS_SQL,
+                                                                  skills_params)]
+            index_ms = (time.perf_counter() - start) / repeats * 1000
+
+            found = repository.find_by_skills(query)
+            expected = [employee.id for employee in employees
+                        if isinstance(employee, Developer) and set(query) <= set(employee.tech_stack)]
+            assert like_ids == index_ids == [employee.id for employee in found] == expected
+            print(f"{' + '.join(query):>26} {len(found):>8} {like_ms:>10.2f} {index_ms:>11.2f}")
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_fts(rows: int = 1_000_000, repeats: int = 5):
+    """
+    Поиск по части имени: FTS5 (employees_fts) против LIKE
+
+    Имена - случайные "Имя Фамилия" на кириллице. Для каждого запроса
+    сравнивается поиск всех совпадений (FTS по началам слов и LIKE по
+    подстрокам) и ранжированный search_by_name с лимитом 50. Совпадения
+    FTS сверяются с проверкой начал слов в Python.
+    """
+    import re
+    import shutil
+    import tempfile
+    from core_OOP.Employee import Employee
+    from data_base.connection import DatabaseConnection
+    from data_base.repository import EmployeeRepository
+
+    first_names = ["Алексей", "Александр", "Андрей", "Анна", "Борис", "Валентина", "Виктор",
+                   "Галина", "Дмитрий", "Евгений", "Екатерина", "Иван", "Игорь", "Ирина",
+                   "Константин", "Мария", "Михаил", "Наталья", "Николай", "Ольга", "Павел",
+                   "Петр", "Светлана", "Сергей", "Татьяна", "Юлия"]
+    last_names = ["Петров", "Петровский", "Иванов", "Сидоров", "Смирнов", "Кузнецов", "Попов",
+                  "Васильев", "Соколов", "Михайлов", "Новиков", "Федоров", "Морозов", "Волков",
+                  "Алексеев", "Лебедев", "Семенов", "Егоров", "Павлов", "Козлов", "Степанов",
+                  "Николаев", "Орлов", "Андреев", "Макаров", "Никитин", "Захаров", "Зайцев"]
+    rng = random.Random(42)
+    names = [f"{rng.choice(first_names)} {rng.choice(last_names)}" for _ in range(rows)]
+
+    print_header(f"SQLite: поиск по имени ({rows} сотрудников)")
+    print(f"{'запрос':>16} {'найдено':>8} {'LIKE, мс':>10} {'FTS, мс':>9} {'top-50, мс':>11}")
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees(Employee(emp_id, name, "Отдел", 1000)
+                          for emp_id, name in enumerate(names, start=1))
+        repository = EmployeeRepository(db)
+        connection = db.get_connection()
+
+        def timed(func):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                result = func()
+            return result, (time.perf_counter() - start) / repeats * 1000
+
+        for query in ("Петров", "Пет", "Алекс Пет", "Ник Орл"):
+            words = query.split()
+            like_sql = "SELECT id FROM employees WHERE " + " AND ".join("name LIKE ?" for _ in words)
+            like_ids, like_ms = timed(lambda: [row[0] for row in connection.execute(
+                like_sql, [f"%{word}%" for word in words])])
+            match = " ".join(f'"{word}"*' for word in words)
+            fts_ids, fts_ms = timed(lambda: [row[0] for row in connection.execute(
+                "SELECT rowid FROM employees_fts WHERE employees_fts MATCH ?", (match,))])
+            top, top_ms = timed(lambda: repository.search_by_name(query))
+
+            expected = {emp_id for emp_id, name in enumerate(names, start=1)
+                        if all(any(token.startswith(word.lower()) for token in re.findall(r"\w+", name.lower()))
+                               for word in words)}
+            assert set(fts_ids) == expected and set(fts_ids) <= set(like_ids)
+            assert {employee.id for employee in top} <= expected and len(top) == min(50, len(expected))
+            print(f"{query:>16} {len(fts_ids):>8} {like_ms:>10.1f} {fts_ms:>9.1f} {top_ms:>11.1f}")
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_shards(rows: int = 200_000, shard_counts=(1, 2, 4, 8), lookups: int = 20_000):
+    """
+    Шардирование сотрудников по ID: запись, поиск по ID, выборки по всем шардам
+
+    Для каждого числа шардов - новый каталог. Последняя колонка - время
+    rebalance на один шард больше и доля перенесенных строк.
+    """
+    import math
+    import shutil
+    import tempfile
+    from data_base.sharding import ShardedStorage
+
+    print_header(f"SQLite: шардирование ({rows} сотрудников)")
+    print(f"{'шардов':>7} {'запись, стр/с':>14} {'поиск/с':>10} {'загрузка, с':>12} "
+          f"{'ФОТ, мс':>9} {'rebalance, с':>13} {'перенесено':>11}")
+
+    employees = [make_employee(emp_id) for emp_id in range(1, rows + 1)]
+    expected = sum(employee.calculate_salary() for employee in employees)
+    rng = random.Random(42)
+    lookup_ids = [rng.randint(1, rows) for _ in range(lookups)]
+    for shards in shard_counts:
+        directory = tempfile.mkdtemp(prefix="db-bench-")
+        storage = ShardedStorage(directory, shards=shards)
+        try:
+            start = time.perf_counter()
+            storage.save_employees(employees)
+            write_rate = rows / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for emp_id in lookup_ids:
+                storage.get_employee(emp_id)
+            lookup_rate = lookups / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            assert len(storage.load_employees()) == rows
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            assert math.isclose(storage.total_payroll(), expected, rel_tol=1e-12)
+            payroll_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            moved = storage.rebalance(shards + 1)
+            rebalance_time = time.perf_counter() - start
+            assert storage.count() == rows
+            print(f"{shards:>7} {write_rate:>14.0f} {lookup_rate:>10.0f} {load_time:>12.3f} "
+                  f"{payroll_ms:>9.1f} {rebalance_time:>13.3f} {moved / rows:>11.1%}")
+        finally:
+            storage.close()
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_db_backup(rows: int = 200_000, writers: int = 2):
+    """
+    Резервное копирование работающей БД: влияние на записи приложения
+
+    Пока writers потоков сохраняют сотрудников, BackupManager делает
+    копию за один шаг и пошагово с паузами. Скорость записи сравнивается
+    с периодом без копирования такой же длительности.
+    """
+    import shutil
+    import tempfile
+    from data_base.backup import BackupManager
+    from data_base.connection import DatabaseConnection
+
+    print_header(f"SQLite: резервное копирование под нагрузкой ({rows} сотрудников, {writers} писателя)")
+    print(f"{'режим':>22} {'время, с':>9} {'МБ/с':>8} {'повторы':>8} {'записей/с':>10} {'проверка':>9}")
+
+    directory = tempfile.mkdtemp(prefix="db-bench-")
+    db = DatabaseConnection.get_instance()
+    try:
+        db.configure(os.path.join(directory, "company.db"))
+        db.save_employees(make_employee(emp_id) for emp_id in range(1, rows + 1))
+
+        writes = [0]
+        stop = threading.Event()
+
+        def writer(seed):
+            rng = random.Random(seed)
+            while not stop.is_set():
+                db.save_employee(make_employee(rng.randint(1, rows)))
+                writes[0] += 1
+
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(writers)]
+        for thread in threads:
+            thread.start()
+        try:
+            modes = [("один шаг", dict(pages=2 ** 31 - 1, sleep=0)),
+                     ("шаги по 256, 5 мс", dict(pages=256, sleep=0.005)),
+                     ("шаги по 1024, 1 мс", dict(pages=1024, sleep=0.001))]
+            elapsed = 0.5
+            for name, options in [("без копирования", None)] + modes:
+                before = writes[0]
+                if options is None:
+                    time.sleep(elapsed)
+                    result, megabytes, restarts, check = None, 0.0, "-", "-"
+                else:
+                    manager = BackupManager(os.path.join(directory, "backups"), db, keep=2, **options)
+                    result = manager.backup()
+                    elapsed = result.elapsed
+                    megabytes = result.size / elapsed / 2 ** 20
+                    restarts, check = result.restarts, "ok" if manager.verify(result.path) else "ошибка"
+                rate = (writes[0] - before) / elapsed
+                print(f"{name:>22} {elapsed:>9.3f} {megabytes:>8.1f} {restarts!s:>8} {rate:>10.0f} {check:>9}")
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+    finally:
+        db.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+BENCHMARKS = {
+    "contention": bench_contention,
+    "journal": bench_journal,
+    "db_mixed": bench_db_mixed,
+    "db_bulk": bench_db_bulk,
+    "db_indexes": bench_db_indexes,
+    "db_payroll": bench_db_payroll,
+    "db_cache": bench_db_cache,
+    "db_stream": bench_db_stream,
+    "db_profiles": bench_db_profiles,
+    "db_skills": bench_db_skills,
+    "db_fts": bench_db_fts,
+    "db_shards": bench_db_shards,
+    "db_backup": bench_db_backup,
+}
+
+
+def main():
+    """Запуск бенчмарков: python benchmarks.py [имя ...]"""
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        if name not in BENCHMARKS:
+            print(f"Неизвестный бенчмарк: {name}. Доступные: {', '.join(BENCHMARKS)}")
+            continue
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
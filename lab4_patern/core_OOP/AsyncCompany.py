@@ -0,0 +1,225 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable, Callable
+from .Company import Company
+from .exceptions import InvalidDataError
+
+
+class AsyncCompany:
+    """
+    Асинхронный фасад над Company для asyncio-сервисов
+
+    Агрегаты и изменения выполняются в пуле потоков, операции с БД - в
+    отдельном пуле (у каждого потока свое соединение для чтения, записи идут
+    через поток-писатель DatabaseConnection). Быстрые запросы по индексу и
+    снимки у потокобезопасной компании выполняются сразу в потоке цикла
+    событий, у остальных - тоже в пуле. Число одновременных операций
+    ограничено, одинаковые параллельные чтения выполняются один раз.
+
+    Таймаут действует только на чтения. Изменение, переданное в пул, нельзя
+    прервать: к нему таймаут не применяется, а отмена задачи вступает в силу
+    после его завершения (см. __mutate).
+    """
+
+    def __init__(self, company: Company, db=None, max_concurrency: int = 32,
+                 workers: int = 4, timeout: Optional[float] = None):
+        """
+        Args:
+            company: Компания (для workers > 1 - с thread_safe=True)
+            db: Объект DatabaseConnection или None
+            max_concurrency: Максимум одновременно выполняемых операций
+            workers: Потоков для агрегатов и изменений
+            timeout: Таймаут чтения в секундах (None - без таймаута)
+        """
+        if not isinstance(company, Company):
+            raise InvalidDataError(
+                field="company",
+                value=company,
+                expected="объект Company"
+            )
+        if max_concurrency <= 0:
+            raise InvalidDataError(
+                field="max_concurrency",
+                value=max_concurrency,
+                expected="положительное целое число"
+            )
+
+        self.__company = company
+        self.__db = db
+        self.__timeout = timeout
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        # без потокобезопасного режима все обращения к компании, включая поиск
+        # и снимки, идут через этот пул из одного потока
+        self.__executor = ThreadPoolExecutor(
+            max_workers=workers if company.thread_safe else 1,
+            thread_name_prefix="company"
+        )
+        self.__db_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="company-db")
+        self.__inflight: Dict[Any, asyncio.Future] = {}
+
+    @property
+    def company(self) -> Company:
+        """Возвращает исходную компанию"""
+        return self.__company
+
+    # служебные методы
+    async def __run(self, executor, func: Callable, *args, **kwargs):
+        """Выполняет чтение в пуле с ограничением параллельности и таймаутом"""
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            if self.__timeout is None:
+                return await call
+            return await asyncio.wait_for(call, self.__timeout)
+
+    async def __mutate(self, executor, func: Callable, *args, **kwargs):
+        """
+        Выполняет изменение в пуле с ограничением параллельности, без таймаута
+
+        Поток пула нельзя остановить, поэтому отмена ожидающей задачи
+        не прерывает изменение: CancelledError пробрасывается только после
+        его завершения. Отмена до передачи в пул (пока задача ждет
+        семафор) изменение не выполняет; после передачи - изменение
+        применено или завершилось своей ошибкой, и его итог виден в
+        компании (версии, лента изменений), а не продолжается в фоне.
+        """
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            try:
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                while not call.done():
+                    try:
+                        await asyncio.wait({call})
+                    except asyncio.CancelledError:
+                        continue
+                if not call.cancelled():
+                    call.exception()  # итог уже применен, помечаем ошибку как полученную
+                raise
+
+    async def __query(self, func: Callable, *args):
+        """Быстрый запрос к компании: сразу или в ее пуле, если она не потокобезопасна"""
+        if self.__company.thread_safe:
+            return func(*args)
+        return await self.__run(self.__executor, func, *args)
+
+    async def __shared(self, key, executor, func: Callable, *args):
+        """
+        Разделяет результат одинаковых параллельных чтений
+
+        Отмена одного ожидающего не отменяет вычисление для остальных.
+        """
+        future = self.__inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.__run(executor, func, *args))
+            self.__inflight[key] = future
+
+            def _done(f, key=key):
+                if self.__inflight.get(key) is f:
+                    del self.__inflight[key]
+                if not f.cancelled():
+                    f.exception()  # помечаем ошибку как полученную
+
+            future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    # запросы
+    async def find_employee_by_id(self, employee_id: int):
+        """Поиск сотрудника по ID (O(1))"""
+        return await self.__query(self.__company.find_employee_by_id, employee_id)
+
+    async def find_many(self, employee_ids: Iterable[int]) -> Dict[int, Any]:
+        """Пакетный поиск сотрудников по ID"""
+        return await self.__query(self.__company.find_many, list(employee_ids))
+
+    async def get_all_employees(self) -> list:
+        """Список всех сотрудников"""
+        return await self.__shared(("get_all_employees",), self.__executor,
+                                   self.__company.get_all_employees)
+
+    async def calculate_total_monthly_cost(self) -> float:
+        """Фонд оплаты труда компании"""
+        return await self.__shared(("calculate_total_monthly_cost",), self.__executor,
+                                   self.__company.calculate_total_monthly_cost)
+
+    async def calculate_department_salary(self, department_name: str) -> float:
+        """Фонд оплаты труда отдела"""
+        return await self.__shared(("calculate_department_salary", department_name),
+                                   self.__executor, self.__department_salary, department_name)
+
+    def __department_salary(self, department_name: str) -> float:
+        return self.__company.get_department(department_name).calculate_total_salary()
+
+    async def get_company_info(self) -> str:
+        """Полная информация о компании"""
+        return await self.__shared(("get_company_info",), self.__executor,
+                                   self.__company.get_company_info)
+
+    async def snapshot(self):
+        """Снимок компании (O(1))"""
+        return await self.__query(self.__company.snapshot)
+
+    # изменения
+    async def hire(self, department_name: str, employee) -> None:
+        """Добавляет сотрудника в отдел"""
+        await self.__mutate(self.__executor, self.__hire, department_name, employee)
+
+    def __hire(self, department_name: str, employee) -> None:
+        self.__company.get_department(department_name).add_employee(employee)
+
+    async def add_department(self, department) -> None:
+        """Добавляет отдел"""
+        await self.__mutate(self.__executor, self.__company.add_department, department)
+
+    async def transfer_employee(self, employee_id: int, from_dept_name: str, to_dept_name: str,
+                                expected_version: Optional[int] = None) -> None:
+        """Переводит сотрудника между отделами"""
+        await self.__mutate(self.__executor, self.__company.transfer_employee,
+                         employee_id, from_dept_name, to_dept_name,
+                         expected_version=expected_version)
+
+    async def update_salary(self, employee_id: int, new_salary: float,
+                            expected_version: Optional[int] = None) -> int:
+        """Изменяет базовую зарплату сотрудника"""
+        return await self.__mutate(self.__executor, self.__company.update_salary,
+                                employee_id, new_salary, expected_version=expected_version)
+
+    async def remove_employee(self, employee_id: int, force: bool = False) -> None:
+        """Удаляет сотрудника из компании"""
+        await self.__mutate(self.__executor, self.__company.remove_employee, employee_id, force)
+
+    # база данных
+    def __require_db(self):
+        if self.__db is None:
+            raise InvalidDataError(
+                field="db",
+                value=None,
+                expected="объект DatabaseConnection"
+            )
+        return self.__db
+
+    async def db_get_employee(self, employee_id: int) -> dict:
+        """Читает сотрудника из БД"""
+        db = self.__require_db()
+        return await self.__shared(("db_get_employee", employee_id), self.__db_executor,
+                                   db.get_employee, employee_id)
+
+    async def db_save_employee(self, employee_data: dict) -> None:
+        """Сохраняет сотрудника в БД"""
+        db = self.__require_db()
+        await self.__mutate(self.__db_executor, db.save_employee, employee_data)
+
+    # завершение работы
+    async def close(self) -> None:
+        """Дожидается запущенных операций и останавливает пулы потоков"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__executor.shutdown)
+        await loop.run_in_executor(None, self.__db_executor.shutdown)
+
+    async def __aenter__(self) -> 'AsyncCompany':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
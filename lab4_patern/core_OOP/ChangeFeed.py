@@ -0,0 +1,143 @@
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Optional, List, Dict, Any, Callable, NamedTuple
+from .exceptions import ChangeFeedGapError, InvalidDataError
+
+
+class ChangeEvent(NamedTuple):
+    """Событие ленты изменений"""
+    seq: int
+    type: str
+    entity_id: int
+    data: Dict[str, Any]
+    timestamp: datetime
+
+
+class ChangeFeed:
+    """Упорядоченная лента изменений компании с порядковыми номерами"""
+
+    HIRED = "hired"
+    REMOVED = "removed"
+    TRANSFERRED = "transferred"
+    SALARY_CHANGED = "salary_changed"
+    TEAM_CHANGED = "team_changed"
+    STATUS_CHANGED = "status_changed"
+    DEPARTMENT_ADDED = "department_added"
+    DEPARTMENT_REMOVED = "department_removed"
+    DEPARTMENT_RENAMED = "department_renamed"
+    PROJECT_ADDED = "project_added"
+    PROJECT_REMOVED = "project_removed"
+
+    EVENT_TYPES = {
+        HIRED, REMOVED, TRANSFERRED, SALARY_CHANGED, TEAM_CHANGED, STATUS_CHANGED,
+        DEPARTMENT_ADDED, DEPARTMENT_REMOVED, DEPARTMENT_RENAMED, PROJECT_ADDED, PROJECT_REMOVED
+    }
+
+    def __init__(self, retention: int = 100_000):
+        """
+        Args:
+            retention: Сколько последних событий хранить для догоняющих подписчиков
+        """
+        if not isinstance(retention, int) or retention <= 0:
+            raise InvalidDataError(
+                field="retention",
+                value=retention,
+                expected="положительное целое число"
+            )
+        self.__events = deque(maxlen=retention)
+        self.__last_seq = 0
+        self.__subscribers: List[Callable[[ChangeEvent], None]] = []
+        self.__lock = threading.RLock()
+
+    @property
+    def last_seq(self) -> int:
+        """Номер последнего опубликованного события (0 - событий не было)"""
+        return self.__last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Номер самого старого хранимого события"""
+        with self.__lock:
+            return self.__events[0].seq if self.__events else self.__last_seq + 1
+
+    def publish(self, event_type: str, entity_id: int, data: Dict[str, Any]) -> ChangeEvent:
+        """
+        Публикует событие и рассылает его подписчикам
+
+        Ошибки подписчиков не передаются публикующему: событие публикуется
+        посреди изменения компании, и сбой одного потребителя не должен
+        оставить ее в несогласованном состоянии.
+
+        Args:
+            event_type: Тип события (один из EVENT_TYPES)
+            entity_id: ID сотрудника или проекта (0 для событий отделов)
+            data: Подробности изменения
+        """
+        if event_type not in self.EVENT_TYPES:
+            raise InvalidDataError(
+                field="тип события",
+                value=event_type,
+                expected=f"один из: {', '.join(sorted(self.EVENT_TYPES))}"
+            )
+        with self.__lock:
+            self.__last_seq += 1
+            event = ChangeEvent(self.__last_seq, event_type, entity_id, data, datetime.now())
+            self.__events.append(event)
+            for callback in list(self.__subscribers):
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+            return event
+
+    def read(self, after_seq: int = 0, limit: Optional[int] = None) -> List[ChangeEvent]:
+        """
+        Возвращает события с номером больше after_seq
+
+        Args:
+            after_seq: Номер последнего обработанного потребителем события
+            limit: Максимум событий (None - все)
+
+        ChangeFeedGapError: Если нужные события уже вытеснены из ленты
+        """
+        with self.__lock:
+            start = self.__start_index(after_seq)
+            stop = None if limit is None else start + limit
+            return list(islice(self.__events, start, stop))
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None], after_seq: Optional[int] = None) -> None:
+        """
+        Подписывает обработчик на новые события
+
+        Args:
+            callback: Функция callback(event), вызывается синхронно в порядке seq;
+                ее исключения при публикации игнорируются
+            after_seq: Если указан, сначала передаются все события после этого номера
+
+        ChangeFeedGapError: Если after_seq слишком старый
+        """
+        with self.__lock:
+            if after_seq is not None:
+                for event in islice(self.__events, self.__start_index(after_seq), None):
+                    callback(event)
+            self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """Отписывает обработчик"""
+        with self.__lock:
+            self.__subscribers.remove(callback)
+
+    def __start_index(self, after_seq: int) -> int:
+        """Позиция первого события после after_seq в буфере"""
+        if after_seq >= self.__last_seq:
+            return len(self.__events)
+        first_seq = self.__events[0].seq if self.__events else self.__last_seq + 1
+        if after_seq < first_seq - 1:
+            raise ChangeFeedGapError(after_seq, first_seq)
+        return after_seq - first_seq + 1
+
+    def __len__(self) -> int:
+        """Количество хранимых событий"""
+        return len(self.__events)
@@ -1,23 +1,37 @@
 import json
+import functools
+import threading
+from contextlib import ExitStack, contextmanager, nullcontext
+from itertools import chain
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator, Union, Callable
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
+from .Department import Department
+from .Project import Project
+from .Snapshot import CompanySnapshot
+from .ChangeFeed import ChangeFeed
 from .exceptions import (
     EmployeeNotFoundError,
     DepartmentNotFoundError,
     ProjectNotFoundError,
     DuplicateIdError,
-    InvalidDataError
+    InvalidDataError,
+    InvalidStatusError,
+    VersionConflictError
 )
 
 
 class Company:
     """компания"""
 
-    def __init__(self, name: str):
+    MERGE_POLICIES = ("error", "skip", "renumber")
+
+    def __init__(self, name: str, thread_safe: bool = False):
         """
         Args:
             name: Название компании
+            thread_safe: Потокобезопасный режим (блокировки отделов, проектов и индексов)
 
         ValueError: Если название пустое
         """
@@ -28,43 +42,110 @@ class Company:
                 expected="непустая строка"
             )
         self.__name = name
-        self.__departments = []
+        # название -> отдел, порядок добавления сохраняется
+        self.__departments: Dict[str, Department] = {}
         self.__projects = []
+        # индексы: id сотрудника -> (сотрудник, отдел), id сотрудника -> {id проекта: проект}
+        self.__employee_index: Dict[int, Tuple[AbstractEmployee, Department]] = {}
+        self.__employee_projects: Dict[int, Dict[int, Project]] = {}
+        # контейнеры выше разделяются со снимком до первой записи
+        self.__shared = False
+        # блокировка индексов и реестров компании, захватывается последней
+        self.__thread_safe = thread_safe
+        self.__lock = threading.RLock() if thread_safe else nullcontext()
+        # журнал отмены открытой транзакции и поток, который ее ведет
+        self.__journal: Optional[List[Callable]] = None
+        self.__transaction_owner: Optional[int] = None
+        # блокировки открытой транзакции и id контейнеров, чьи блокировки в ней
+        self.__transaction_locks: Optional[ExitStack] = None
+        self.__transaction_locked: set = set()
+        # лента изменений; события транзакции копятся до фиксации
+        self.__feed = ChangeFeed()
+        self.__pending_events: Optional[list] = None
+        self.__rolling_back = False
+        self.__moving: Optional[int] = None
 
     @property
     def name(self) -> str:
         """Возвращает название комп"""
         return self.__name
 
+    @property
+    def thread_safe(self) -> bool:
+        """Включен ли потокобезопасный режим"""
+        return self.__thread_safe
+
+    @property
+    def change_feed(self) -> ChangeFeed:
+        """Лента изменений компании"""
+        return self.__feed
+
+    def __locked(self, *containers):
+        """
+        Захватывает блокировки в установленном порядке
+
+        Порядок: отделы, затем проекты (внутри группы - по id объекта),
+        затем блокировка компании. Все операции, которым нужно несколько
+        блокировок, берут их только через этот метод, поэтому взаимных
+        блокировок не возникает.
+
+        Внутри транзакции блокировки отделов и проектов, которые
+        регистрируются в ней (add_department, add_project), добавляются
+        к ее набору и держатся до ее завершения. Порядок при этом не
+        нарушается: пока контейнер не зарегистрирован, его блокировку не
+        берет ни один метод компании.
+        """
+        if self.__transaction_owner == threading.get_ident():
+            # транзакция этого потока уже держит блокировки компании
+            if self.__thread_safe:
+                for container in containers:
+                    if id(container) not in self.__transaction_locked:
+                        self.__transaction_locks.enter_context(container.lock)
+                        self.__transaction_locked.add(id(container))
+            return nullcontext()
+        stack = ExitStack()
+        if self.__thread_safe:
+            unique = {id(c): c for c in containers}.values()
+            departments = sorted((c for c in unique if isinstance(c, Department)), key=id)
+            projects = sorted((c for c in unique if isinstance(c, Project)), key=id)
+            for container in departments + projects:
+                stack.enter_context(container.lock)
+        stack.enter_context(self.__lock)
+        return stack
+
     # управления отделами
 
     def add_department(self, department):
         """Добавляет отдел с проверкой уникальности"""
-        # Проверка уникальности названия отдела
-        for dept in self.__departments:
-            if dept.name == department.name:
+        with self.__locked(department):
+            # Проверка уникальности названия отдела
+            if department.name in self.__departments:
                 raise DuplicateIdError(
                     entity_type="Отдел",
                     entity_id=department.name
                 )
-        
-        self.__departments.append(department)
 
-    def remove_department(self, department_name: str) -> None:
-        """
-        Удаляет отдел по названию
+            # ID сотрудников должны быть уникальны в рамках компании
+            for employee in department:
+                if employee.id in self.__employee_index:
+                    raise DuplicateIdError(
+                        entity_type="Сотрудник",
+                        entity_id=employee.id
+                    )
 
-        Args:
-            department_name: Название отдела для удаления
+            self.__attach_department(department)
+            self.__record(functools.partial(self.__drop_department, department))
 
-        ValueError: Если отдел не найден
+    def get_department(self, department_name: str) -> Department:
         """
-        for i, dept in enumerate(self.__departments):
-            if dept.name == department_name:
-                del self.__departments[i]
-                return
+        Возвращает отдел по названию
 
-        raise DepartmentNotFoundError(f"Отдел с названием '{department_name}' не найден")
+        DepartmentNotFoundError: Если отдел не найден
+        """
+        dept = self.__departments.get(department_name)
+        if dept is None:
+            raise DepartmentNotFoundError(department_name)
+        return dept
 
     def get_departments(self) -> List[Department]:
         """
@@ -73,7 +154,7 @@ class Company:
         Returns:
             Копию списка отделов
         """
-        return self.__departments.copy()
+        return list(self.__departments.values())
 
     # управление проектами
 
@@ -87,14 +168,16 @@ class Company:
         ValueError: Если проект уже есть в компании
         """
         if not isinstance(project, Project):
-            raise InvalidDataError("Можно добавить только объект типа Project")
+            raise InvalidDataError(field="project", value=project, expected="объект Project")
 
-        # Проверка на id
-        for proj in self.__projects:
-            if proj.project_id == project.project_id:
-                raise DuplicateIdError(f"Проект с ID {project.project_id} уже существует")
+        with self.__locked(project):
+            # Проверка на id
+            for proj in self.__projects:
+                if proj.project_id == project.project_id:
+                    raise DuplicateIdError("Проект", project.project_id)
 
-        self.__projects.append(project)
+            self.__attach_project(project)
+            self.__record(functools.partial(self.__drop_project, project))
 
     def remove_project(self, project_id: int) -> None:
         """
@@ -105,12 +188,23 @@ class Company:
 
         ValueError: Если проект не найден
         """
-        for i, proj in enumerate(self.__projects):
+        proj = self.get_project(project_id)
+        with self.__locked(proj):
+            if proj not in self.__projects:
+                raise ProjectNotFoundError(project_id)
+            self.__drop_project(proj)
+
+    def get_project(self, project_id: int) -> Project:
+        """
+        Возвращает проект по ID
+
+        ProjectNotFoundError: Если проект не найден
+        """
+        for proj in self.__projects:
             if proj.project_id == project_id:
-                del self.__projects[i]
-                return
+                return proj
 
-        raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
+        raise ProjectNotFoundError(project_id)
 
     def get_projects(self) -> List[Project]:
         """
@@ -130,10 +224,48 @@ class Company:
         Returns:
             Список всех сотрудников всех отделов
         """
-        all_employees = []
-        for department in self.__departments:
-            all_employees.extend(department.get_employees())
-        return all_employees
+        return list(self.iter_employees())
+
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        """
+        Ленивый обход всех сотрудников компании без промежуточных списков
+
+        Returns:
+            Итератор по сотрудникам всех отделов
+        """
+        if self.__thread_safe:
+            # каждый отдел читается целиком под своей блокировкой
+            return chain.from_iterable(dept.get_employees() for dept in self.get_departments())
+        return chain.from_iterable(self.__departments.values())
+
+    def iter_employees_by_type(self, employee_type: Union[type, str]) -> Iterator[AbstractEmployee]:
+        """
+        Ленивый обход сотрудников заданного типа
+
+        Args:
+            employee_type: Класс сотрудника или имя класса ("Manager", "Developer", ...)
+
+        Returns:
+            Итератор по сотрудникам этого типа (для класса учитываются подклассы)
+        """
+        if isinstance(employee_type, str):
+            return (emp for emp in self.iter_employees()
+                    if emp.__class__.__name__ == employee_type)
+        return (emp for emp in self.iter_employees() if isinstance(emp, employee_type))
+
+    def iter_employees_by_department(self, *department_names: str) -> Iterator[AbstractEmployee]:
+        """
+        Ленивый обход сотрудников указанных отделов
+
+        Args:
+            department_names: Названия отделов
+
+        DepartmentNotFoundError: Если отдел не найден
+        """
+        departments = [self.get_department(name) for name in department_names]
+        if self.__thread_safe:
+            return chain.from_iterable(dept.get_employees() for dept in departments)
+        return chain.from_iterable(departments)
 
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """
@@ -146,23 +278,50 @@ class Company:
             Найденный сотрудник или None
         """
         if not isinstance(employee_id, int) or employee_id <= 0:
-            raise InvalidDataError("ID должен быть положительным целым числом")
+            raise InvalidDataError(
+                field="ID сотрудника",
+                value=employee_id,
+                expected="положительное целое число"
+            )
 
-        for department in self.__departments:
-            employee = department.find_employee_by_id(employee_id)
-            if employee:
-                return employee
-        return None
+        entry = self.__employee_index.get(employee_id)
+        return entry[0] if entry is not None else None
 
     def find_employee_company_wide(self, employee_id: int):
         """Ищет сотрудника во всей компании"""
-        for department in self.__departments:
-            try:
-                return department.find_employee_by_id(employee_id)
-            except EmployeeNotFoundError:
-                continue
-        
-        raise EmployeeNotFoundError(employee_id)
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            raise EmployeeNotFoundError(employee_id)
+        return entry[0]
+
+    def find_many(self, employee_ids: Iterable[int]) -> Dict[int, AbstractEmployee]:
+        """
+        Пакетный поиск сотрудников по ID
+
+        Args:
+            employee_ids: ID сотрудников
+
+        Returns:
+            Словарь {id: сотрудник} только для найденных ID
+        """
+        index = self.__employee_index
+        found = {}
+        for emp_id in employee_ids:
+            entry = index.get(emp_id)
+            if entry is not None:
+                found[emp_id] = entry[0]
+        return found
+
+    def get_employee_department(self, employee_id: int) -> Department:
+        """
+        Возвращает отдел, в котором работает сотрудник
+
+        EmployeeNotFoundError: Если сотрудник не найден
+        """
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            raise EmployeeNotFoundError(employee_id)
+        return entry[1]
 
     def calculate_total_monthly_cost(self) -> float:
         """
@@ -171,10 +330,7 @@ class Company:
         Returns:
             Сумма зарплат всех сотрудников компании
         """
-        total = 0.0
-        for department in self.__departments:
-            total += department.calculate_total_salary()
-        return total
+        return sum((emp.calculate_salary() for emp in self.iter_employees()), 0.0)
 
     def get_projects_by_status(self, status: str) -> List[Project]:
         """
@@ -198,7 +354,7 @@ class Company:
         Returns:
             Строка с информацией
         """
-        total_employees = sum(len(dept) for dept in self.__departments)
+        total_employees = len(self)
         total_projects = len(self.__projects)
 
         return (f"Компания: {self.__name}\n"
@@ -209,12 +365,12 @@ class Company:
 
     def __str__(self) -> str:
         """Строковое представление компании"""
-        total_employees = sum(len(dept) for dept in self.__departments)
+        total_employees = len(self)
         return f"Компания: {self.__name} (Отделов: {len(self.__departments)}, Сотрудников: {total_employees})"
 
     def __len__(self) -> int:
         """Возвращает общее количество сотрудников"""
-        return sum(len(dept) for dept in self.__departments)
+        return len(self.__employee_index)
 
 
     # связи
@@ -229,20 +385,22 @@ class Company:
         ValueError: Если отдел не найден
         RuntimeError: Если в отделе есть сотрудники и не установлен force=True
         """
-        for i, dept in enumerate(self.__departments):
-            if dept.name == department_name:
-                # Проверка наличия сотрудников в отделе
-                if dept.has_employees() and not force:
-                    raise RuntimeError(
-                        f"Нельзя удалить отдел '{department_name}', так как в нем есть сотрудники. "
-                        f"Используйте force=True для принудительного удаления или перенесите сотрудников."
-                    )
-                del self.__departments[i]
-                return
+        dept = self.get_department(department_name)
 
-        raise DepartmentNotFoundError(f"Отдел с названием '{department_name}' не найден")
+        with self.__locked(dept):
+            if self.__departments.get(department_name) is not dept:
+                raise DepartmentNotFoundError(department_name)
+
+            # Проверка наличия сотрудников в отделе
+            if dept.has_employees() and not force:
+                raise RuntimeError(
+                    f"Нельзя удалить отдел '{department_name}', так как в нем есть сотрудники. "
+                    f"Используйте force=True для принудительного удаления или перенесите сотрудников."
+                )
+            self.__drop_department(dept)
 
-    def transfer_employee(self, employee_id: int, from_dept_name: str, to_dept_name: str) -> None:
+    def transfer_employee(self, employee_id: int, from_dept_name: str, to_dept_name: str,
+                          expected_version: Optional[int] = None) -> None:
         """
         Переносит сотрудника из одного отдела в другой
 
@@ -250,39 +408,95 @@ class Company:
             employee_id: ID сотрудника для переноса
             from_dept_name: Название отдела-источника
             to_dept_name: Название отдела-назначения
+            expected_version: Ожидаемая версия сотрудника (None - без проверки)
 
         ValueError: Если отделы не найдены или сотрудник не найден
+        VersionConflictError: Если сотрудник был изменен после чтения версии
         """
         # Поиск отделов
-        from_dept = None
-        to_dept = None
-
-        for dept in self.__departments:
-            if dept.name == from_dept_name:
-                from_dept = dept
-            if dept.name == to_dept_name:
-                to_dept = dept
-
-        if from_dept is None:
-            raise DepartmentNotFoundError(f"Исходный отдел '{from_dept_name}' не найден")
-        if to_dept is None:
-            raise DepartmentNotFoundError(f"Целевой отдел '{to_dept_name}' не найден")
-
-        # Поиск сотрудника в исходном отделе
-        employee = from_dept.find_employee_by_id(employee_id)
-        if employee is None:
-            raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в отделе '{from_dept_name}'")
-
-        # Проверка, что сотрудник не участвует в проектах
-        if self.__is_employee_in_projects(employee_id):
-            raise RuntimeError(
-                f"Сотрудник с ID {employee_id} участвует в проектах. "
-                f"Сначала удалите его из всех проектов."
-            )
+        from_dept = self.get_department(from_dept_name)
+        to_dept = self.get_department(to_dept_name)
+
+        # поиск, проверки и перенос выполняются атомарно
+        with self.__locked(from_dept, to_dept):
+            # Поиск сотрудника в исходном отделе
+            entry = self.__employee_index.get(employee_id)
+            if entry is None or entry[1] is not from_dept:
+                raise EmployeeNotFoundError(employee_id)
+            employee = entry[0]
+            self.__check_version(employee, expected_version)
+
+            # Проверка, что сотрудник не участвует в проектах
+            if self.__is_employee_in_projects(employee_id):
+                raise RuntimeError(
+                    f"Сотрудник с ID {employee_id} участвует в проектах. "
+                    f"Сначала удалите его из всех проектов."
+                )
+
+            # Удаление из исходного отдела и добавление в целевой
+            self.__move(employee, from_dept, to_dept)
+
+    def __move(self, employee, from_dept: Department, to_dept: Department) -> None:
+        """Переносит сотрудника без проверок (проверки делает вызывающий)"""
+        # перевод публикуется одним событием вместо "removed" + "hired"
+        self.__moving = employee.id
+        try:
+            from_dept.remove_employee(employee.id)
+            to_dept.add_employee(employee)
+        finally:
+            self.__moving = None
+        self.__record(functools.partial(setattr, employee, "department", employee.department))
+        employee.department = to_dept.name
+        self.__emit(ChangeFeed.TRANSFERRED, employee.id,
+                    from_department=from_dept.name, to_department=to_dept.name)
+
+    def update_salary(self, employee_id: int, new_salary: float,
+                      expected_version: Optional[int] = None) -> int:
+        """
+        Изменяет базовую зарплату сотрудника
 
-        # Удаление из исходного отдела и добавление в целевой
-        from_dept.remove_employee(employee_id)
-        to_dept.add_employee(employee)
+        Для оптимистичной блокировки читается employee.version, затем
+        версия передается сюда; при конфликте операцию повторяют заново.
+
+        Args:
+            employee_id: ID сотрудника
+            new_salary: Новая базовая зарплата
+            expected_version: Ожидаемая версия сотрудника (None - без проверки)
+
+        Returns:
+            Новая версия сотрудника
+
+        EmployeeNotFoundError: Если сотрудник не найден
+        VersionConflictError: Если сотрудник был изменен после чтения версии
+        """
+        while True:
+            department = self.get_employee_department(employee_id)
+            with self.__locked(department):
+                entry = self.__employee_index.get(employee_id)
+                if entry is None:
+                    raise EmployeeNotFoundError(employee_id)
+                if entry[1] is not department:
+                    # сотрудника перевели, пока ждали блокировку отдела
+                    continue
+                employee = entry[0]
+                self.__check_version(employee, expected_version)
+                old_salary = employee.base_salary
+                self.__record(functools.partial(setattr, employee, "base_salary", old_salary))
+                employee.base_salary = new_salary
+                self.__emit(ChangeFeed.SALARY_CHANGED, employee_id,
+                            old_salary=old_salary, new_salary=new_salary)
+                return employee.version
+
+    @staticmethod
+    def __check_version(entity, expected_version: Optional[int]) -> None:
+        """Сравнивает версию объекта с ожидаемой"""
+        if expected_version is not None and entity.version != expected_version:
+            raise VersionConflictError(
+                entity_type=entity.__class__.__name__,
+                entity_id=entity.id,
+                expected_version=expected_version,
+                actual_version=entity.version
+            )
 
     def __is_employee_in_projects(self, employee_id: int) -> bool:
         """
@@ -294,11 +508,239 @@ class Company:
         Returns:
             True если сотрудник участвует в проектах, иначе False
         """
-        for project in self.__projects:
-            for team_member in project.get_team():
-                if team_member.id == employee_id:
-                    return True
-        return False
+        return employee_id in self.__employee_projects
+
+    # снимки (copy-on-write)
+    def snapshot(self) -> 'CompanySnapshot':
+        """
+        Снимок состояния компании на текущий момент за O(1)
+
+        Снимок разделяет контейнеры с компанией; первая запись после снимка
+        копирует их, поэтому снимок не меняется при найме, переводах и увольнениях.
+        Сами объекты сотрудников и проектов общие: изменения их полей
+        (зарплата, статус) видны и в снимке.
+
+        Returns:
+            Неизменяемый снимок компании
+        """
+        with self.__lock:
+            self.__shared = True
+            return CompanySnapshot(
+                name=self.__name,
+                departments=self.__departments,
+                projects=self.__projects,
+                employee_index=self.__employee_index,
+                employee_projects=self.__employee_projects
+            )
+
+    def __prepare_write(self) -> None:
+        """Копирует контейнеры, если они разделяются со снимком"""
+        if self.__shared:
+            self.__departments = dict(self.__departments)
+            self.__projects = list(self.__projects)
+            self.__employee_index = dict(self.__employee_index)
+            self.__employee_projects = dict(self.__employee_projects)
+            self.__shared = False
+
+    # транзакции
+    @contextmanager
+    def transaction(self):
+        """
+        Пакет изменений, который откатывается целиком при ошибке
+
+        Пишет журнал отмены примитивных изменений (состав отделов и команд,
+        названия, статусы, а также зарплаты и переводы через методы Company)
+        и при исключении выполняет его в обратном порядке. В потокобезопасном
+        режиме все блокировки берутся один раз на весь пакет, поэтому
+        операции внутри не тратят время на захват блокировок; отделы и
+        проекты, добавленные внутри пакета, блокируются до его завершения.
+        Вложенная транзакция работает как точка сохранения.
+
+        Изменения полей сотрудников в обход Company в журнал не попадают.
+        """
+        if self.__transaction_owner == threading.get_ident():
+            mark = (len(self.__journal), len(self.__pending_events))
+            try:
+                yield self
+            except BaseException:
+                self.__rollback(*mark)
+                raise
+            return
+
+        containers = [*self.get_departments(), *self.get_projects()]
+        with self.__locked(*containers) as locks:
+            self.__journal = []
+            self.__pending_events = []
+            self.__transaction_locks = locks
+            self.__transaction_locked = {id(c) for c in containers}
+            self.__transaction_owner = threading.get_ident()
+            try:
+                yield self
+            except BaseException:
+                self.__rollback(0, 0)
+                raise
+            else:
+                # события публикуются только после успешной фиксации
+                for event_type, entity_id, data in self.__pending_events:
+                    self.__feed.publish(event_type, entity_id, data)
+            finally:
+                self.__journal = None
+                self.__pending_events = None
+                self.__transaction_owner = None
+                self.__transaction_locks = None
+                self.__transaction_locked = set()
+
+    def __record(self, undo: Callable) -> None:
+        """Добавляет действие отмены в журнал открытой транзакции"""
+        if self.__journal is not None:
+            self.__journal.append(undo)
+
+    def __rollback(self, mark: int, events_mark: int) -> None:
+        """Откатывает журнал до позиции mark и отбрасывает неопубликованные события"""
+        journal = self.__journal
+        # действия отмены сами не журналируются и не публикуются
+        self.__journal = None
+        self.__rolling_back = True
+        try:
+            while len(journal) > mark:
+                journal.pop()()
+        finally:
+            self.__journal = journal
+            self.__rolling_back = False
+            del self.__pending_events[events_mark:]
+
+    def __emit(self, event_type: str, entity_id: int, **data) -> None:
+        """Публикует событие в ленту или откладывает его до фиксации транзакции"""
+        if self.__rolling_back:
+            return
+        if self.__pending_events is not None:
+            self.__pending_events.append((event_type, entity_id, data))
+        else:
+            self.__feed.publish(event_type, entity_id, data)
+
+    # поддержка индексов
+    def __on_department_change(self, event: str, department: Department, employee) -> None:
+        """Обновляет индекс сотрудников при изменении состава отдела"""
+        with self.__lock:
+            if event == "added":
+                entry = self.__employee_index.get(employee.id)
+                if entry is not None and entry[1] is not department:
+                    raise DuplicateIdError(
+                        entity_type="Сотрудник",
+                        entity_id=employee.id
+                    )
+                self.__prepare_write()
+                self.__employee_index[employee.id] = (employee, department)
+                self.__record(functools.partial(department.remove_employee, employee.id))
+                if self.__moving != employee.id:
+                    self.__emit(ChangeFeed.HIRED, employee.id, department=department.name,
+                                employee=employee.to_dict())
+            elif event == "removed":
+                self.__prepare_write()
+                self.__employee_index.pop(employee.id, None)
+                self.__record(functools.partial(department.add_employee, employee))
+                if self.__moving != employee.id:
+                    self.__emit(ChangeFeed.REMOVED, employee.id, department=department.name)
+            elif event == "renamed":
+                # employee здесь - новое название, отдел еще под старым
+                new_name = employee
+                if new_name in self.__departments:
+                    raise DuplicateIdError(
+                        entity_type="Отдел",
+                        entity_id=new_name
+                    )
+                self.__departments = {
+                    (new_name if name == department.name else name): dept
+                    for name, dept in self.__departments.items()
+                }
+                self.__record(functools.partial(setattr, department, "name", department.name))
+                self.__emit(ChangeFeed.DEPARTMENT_RENAMED, 0, old_name=department.name, new_name=new_name)
+
+    def __on_project_change(self, event: str, project: Project, employee) -> None:
+        """Обновляет индекс участия в проектах при изменении команды"""
+        with self.__lock:
+            if event == "added":
+                self.__index_project_member(project, employee, True)
+                self.__record(functools.partial(project.remove_team_member, employee.id))
+                self.__emit(ChangeFeed.TEAM_CHANGED, project.project_id,
+                            employee_id=employee.id, action="added")
+            elif event == "removed":
+                self.__index_project_member(project, employee, False)
+                self.__record(functools.partial(project.add_team_member, employee))
+                self.__emit(ChangeFeed.TEAM_CHANGED, project.project_id,
+                            employee_id=employee.id, action="removed")
+            elif event == "status":
+                # employee здесь - новый статус, проект еще в старом
+                self.__record(functools.partial(project.change_status, project.status))
+                self.__emit(ChangeFeed.STATUS_CHANGED, project.project_id,
+                            old_status=project.status, new_status=employee)
+
+    def __index_project_member(self, project: Project, employee, member: bool) -> None:
+        """Добавляет или убирает проект из индекса участия сотрудника"""
+        # вложенные словари не изменяются на месте - их могут разделять снимки
+        self.__prepare_write()
+        projects = dict(self.__employee_projects.get(employee.id, {}))
+        if member:
+            projects[project.project_id] = project
+        else:
+            projects.pop(project.project_id, None)
+
+        if projects:
+            self.__employee_projects[employee.id] = projects
+        else:
+            self.__employee_projects.pop(employee.id, None)
+
+    def __attach_department(self, department: Department) -> None:
+        """Регистрирует отдел и его сотрудников в индексах"""
+        self.__prepare_write()
+        self.__departments[department.name] = department
+        self.__emit(ChangeFeed.DEPARTMENT_ADDED, 0, department=department.name)
+        for employee in department:
+            self.__employee_index[employee.id] = (employee, department)
+            self.__emit(ChangeFeed.HIRED, employee.id, department=department.name,
+                        employee=employee.to_dict())
+        department.add_listener(self.__on_department_change)
+
+    def __drop_department(self, department: Department) -> None:
+        """Убирает отдел из реестра и индексов"""
+        order = list(self.__departments)
+        self.__prepare_write()
+        del self.__departments[department.name]
+        department.remove_listener(self.__on_department_change)
+        for employee_id in department.get_employee_ids():
+            self.__employee_index.pop(employee_id, None)
+            self.__emit(ChangeFeed.REMOVED, employee_id, department=department.name)
+        self.__emit(ChangeFeed.DEPARTMENT_REMOVED, 0, department=department.name)
+        self.__record(functools.partial(self.__restore_department, department, order))
+
+    def __restore_department(self, department: Department, order: List[str]) -> None:
+        """Возвращает удаленный отдел на прежнее место (для отката)"""
+        self.__attach_department(department)
+        self.__departments = {name: self.__departments[name] for name in order}
+
+    def __attach_project(self, project: Project, position: Optional[int] = None) -> None:
+        """Регистрирует проект и его команду в индексах"""
+        self.__prepare_write()
+        if position is None:
+            self.__projects.append(project)
+        else:
+            self.__projects.insert(position, project)
+        for employee in project.get_team():
+            self.__index_project_member(project, employee, True)
+        # команда передается в самом событии, отдельных team_changed нет
+        self.__emit(ChangeFeed.PROJECT_ADDED, project.project_id, project=project.to_dict())
+        project.add_listener(self.__on_project_change)
+
+    def __drop_project(self, project: Project) -> None:
+        """Убирает проект из списка и индексов"""
+        self.__prepare_write()
+        position = self.__projects.index(project)
+        del self.__projects[position]
+        project.remove_listener(self.__on_project_change)
+        for employee in project.get_team():
+            self.__index_project_member(project, employee, False)
+        self.__emit(ChangeFeed.PROJECT_REMOVED, project.project_id)
+        self.__record(functools.partial(self.__attach_project, project, position))
 
     #проверка связей
     def remove_employee(self, employee_id: int, force: bool = False) -> None:
@@ -313,24 +755,21 @@ class Company:
         RuntimeError: Если сотрудник участвует в проектах и не установлен force=True
         """
         # Поиск отдела с сотрудником
-        department_with_employee = None
-        for dept in self.__departments:
-            if dept.find_employee_by_id(employee_id) is not None:
-                department_with_employee = dept
-                break
-
-        if department_with_employee is None:
-            raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в компании")
-
-        # Проверка участия в проектах
-        if self.__is_employee_in_projects(employee_id) and not force:
-            raise RuntimeError(
-                f"Нельзя удалить сотрудника с ID {employee_id}, так как он участвует в проектах. "
-                f"Используйте force=True для принудительного удаления или сначала удалите его из проектов."
-            )
+        department_with_employee = self.get_employee_department(employee_id)
+
+        with self.__locked(department_with_employee):
+            if self.get_employee_department(employee_id) is not department_with_employee:
+                raise EmployeeNotFoundError(employee_id)
+
+            # Проверка участия в проектах
+            if self.__is_employee_in_projects(employee_id) and not force:
+                raise RuntimeError(
+                    f"Нельзя удалить сотрудника с ID {employee_id}, так как он участвует в проектах. "
+                    f"Используйте force=True для принудительного удаления или сначала удалите его из проектов."
+                )
 
-        # Удаление сотрудника
-        department_with_employee.remove_employee(employee_id)
+            # Удаление сотрудника
+            department_with_employee.remove_employee(employee_id)
 
     def remove_project(self, project_id: int, force: bool = False) -> None:
         """
@@ -343,18 +782,18 @@ class Company:
         ValueError: Если проект не найден
         RuntimeError: Если в проекте есть команда и не установлен force=True
         """
-        for i, proj in enumerate(self.__projects):
-            if proj.project_id == project_id:
-                # Проверка наличия команды в проекте
-                if proj.get_team_size() > 0 and not force:
-                    raise RuntimeError(
-                        f"Нельзя удалить проект с ID {project_id}, так как в нем есть команда. "
-                        f"Используйте force=True для принудительного удаления или сначала удалите всех сотрудников из проекта."
-                    )
-                del self.__projects[i]
-                return
-
-        raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
+        proj = self.get_project(project_id)
+        with self.__locked(proj):
+            if proj not in self.__projects:
+                raise ProjectNotFoundError(project_id)
+
+            # Проверка наличия команды в проекте
+            if proj.get_team_size() > 0 and not force:
+                raise RuntimeError(
+                    f"Нельзя удалить проект с ID {project_id}, так как в нем есть команда. "
+                    f"Используйте force=True для принудительного удаления или сначала удалите всех сотрудников из проекта."
+                )
+            self.__drop_project(proj)
 
     def get_employee_projects(self, employee_id: int) -> List[Project]:
         """
@@ -366,13 +805,7 @@ class Company:
         Returns:
             Список проектов
         """
-        projects = []
-        for project in self.__projects:
-            for team_member in project.get_team():
-                if team_member.id == employee_id:
-                    projects.append(project)
-                    break
-        return projects
+        return list(self.__employee_projects.get(employee_id, {}).values())
 
     def remove_employee_from_all_projects(self, employee_id: int) -> None:
         """
@@ -383,14 +816,225 @@ class Company:
 
         EmployeeNotFoundError: Если сотрудник не найден в проектах
         """
-        removed_from_projects = []
+        projects = self.get_employee_projects(employee_id)
+        if not projects:
+            raise EmployeeNotFoundError(employee_id)
+
+        with self.__locked(*projects):
+            for project in projects:
+                try:
+                    project.remove_team_member(employee_id)
+                except EmployeeNotFoundError:
+                    # уже удален из этого проекта другим потоком
+                    continue
+
+    # массовые операции
+    def transfer_many(self, moves: Iterable[Tuple[int, str]], force: bool = False) -> int:
+        """
+        Пакетный перевод сотрудников между отделами
 
-        for project in self.__projects:
-            try:
-                project.remove_team_member(employee_id)
-                removed_from_projects.append(project.name)
-            except EmployeeNotFoundError:
-                pass
+        Все переводы сначала проверяются за один проход, затем выполняются
+        одной транзакцией: либо переводятся все, либо ни один.
+
+        Args:
+            moves: Пары (ID сотрудника, название целевого отдела)
+            force: Разрешить перевод сотрудников, участвующих в проектах
+
+        Returns:
+            Количество переведенных сотрудников
+
+        EmployeeNotFoundError: Если сотрудник не найден
+        DepartmentNotFoundError: Если целевой отдел не найден
+        DuplicateIdError: Если сотрудник встречается в пакете дважды
+        RuntimeError: Если сотрудник участвует в проектах и не установлен force=True
+        """
+        with self.transaction():
+            plan = []
+            seen = set()
+            for employee_id, to_dept_name in moves:
+                entry = self.__employee_index.get(employee_id)
+                if entry is None:
+                    raise EmployeeNotFoundError(employee_id)
+                if employee_id in seen:
+                    raise DuplicateIdError("Сотрудник", employee_id)
+                seen.add(employee_id)
+                if not force and self.__is_employee_in_projects(employee_id):
+                    raise RuntimeError(
+                        f"Сотрудник с ID {employee_id} участвует в проектах. "
+                        f"Сначала удалите его из всех проектов или используйте force=True."
+                    )
+                to_dept = self.get_department(to_dept_name)
+                if entry[1] is not to_dept:
+                    plan.append((entry[0], entry[1], to_dept))
+
+            for employee, from_dept, to_dept in plan:
+                self.__move(employee, from_dept, to_dept)
+        return len(plan)
+
+    def merge_departments(self, source_name: str, target_name: str, force: bool = False) -> Department:
+        """
+        Переводит всех сотрудников отдела source в отдел target и удаляет source
+
+        Args:
+            source_name: Название поглощаемого отдела
+            target_name: Название отдела-получателя
+            force: Разрешить перевод сотрудников, участвующих в проектах
+
+        Returns:
+            Отдел-получатель
+
+        DepartmentNotFoundError: Если отдел не найден
+        RuntimeError: Если сотрудники участвуют в проектах и не установлен force=True
+        """
+        source = self.get_department(source_name)
+        target = self.get_department(target_name)
+        if source is target:
+            raise InvalidDataError(
+                field="отделы для слияния",
+                value=source_name,
+                expected="два разных отдела"
+            )
+
+        with self.transaction():
+            self.transfer_many(((emp_id, target_name) for emp_id in source.get_employee_ids()), force)
+            self.__drop_department(source)
+        return target
+
+    def split_department(self, department_name: str, new_department_name: str,
+                         predicate: Callable[[AbstractEmployee], bool], force: bool = False) -> Department:
+        """
+        Выделяет из отдела новый отдел из сотрудников, подходящих под условие
+
+        Args:
+            department_name: Название исходного отдела
+            new_department_name: Название нового отдела
+            predicate: Функция predicate(сотрудник) -> bool
+            force: Разрешить перевод сотрудников, участвующих в проектах
+
+        Returns:
+            Новый отдел
+
+        DepartmentNotFoundError: Если исходный отдел не найден
+        DuplicateIdError: Если отдел с новым названием уже есть
+        """
+        source = self.get_department(department_name)
+        with self.transaction():
+            new_department = Department(new_department_name)
+            self.add_department(new_department)
+            self.transfer_many(
+                ((emp.id, new_department_name) for emp in source.get_employees() if predicate(emp)),
+                force
+            )
+        return new_department
+
+    def renumber_employee(self, employee_id: int, new_id: int) -> None:
+        """
+        Меняет ID сотрудника с сохранением отдела и проектов
+
+        EmployeeNotFoundError: Если сотрудник не найден
+        DuplicateIdError: Если новый ID уже занят
+        """
+        while True:
+            department = self.get_employee_department(employee_id)
+            projects = self.get_employee_projects(employee_id)
+            with self.__locked(department, *projects):
+                entry = self.__employee_index.get(employee_id)
+                if entry is None:
+                    raise EmployeeNotFoundError(employee_id)
+                # отдел и проекты могли смениться, пока ждали их блокировки
+                if (entry[1] is not department or {id(project) for project in projects}
+                        != {id(project) for project in self.get_employee_projects(employee_id)}):
+                    continue
+                if new_id in self.__employee_index:
+                    raise DuplicateIdError("Сотрудник", new_id)
+                employee = entry[0]
+
+                for project in projects:
+                    project.remove_team_member(employee_id)
+                department.remove_employee(employee_id)
+                self.__record(functools.partial(setattr, employee, "id", employee_id))
+                employee.id = new_id
+                department.add_employee(employee)
+                for project in projects:
+                    project.add_team_member(employee)
+                return
+
+    def merge_company(self, other: 'Company', on_conflict: str = "error") -> None:
+        """
+        Переносит в компанию все отделы, сотрудников и проекты другой компании
+
+        Отделы с совпадающими названиями сливаются. Обе компании изменяются
+        в транзакциях и откатываются при ошибке. Транзакции открываются в
+        порядке id() компаний, поэтому встречные a.merge_company(b) и
+        b.merge_company(a) из разных потоков не блокируют друг друга.
+
+        Args:
+            other: Поглощаемая компания
+            on_conflict: Что делать при совпадении ID:
+                "error" - ошибка до любых изменений,
+                "skip" - конфликтующие сотрудники и проекты (а также проекты
+                с такими сотрудниками) остаются в other,
+                "renumber" - выдать конфликтующим сотрудникам новые ID
+                (проекты перенумеровать нельзя - при их конфликте ошибка)
+
+        DuplicateIdError: Если есть конфликт ID, который политика не разрешает
+        """
+        if not isinstance(other, Company) or other is self:
+            raise InvalidDataError(
+                field="компания для слияния",
+                value=other,
+                expected="другой объект Company"
+            )
+        if on_conflict not in self.MERGE_POLICIES:
+            raise InvalidDataError(
+                field="on_conflict",
+                value=on_conflict,
+                expected=f"один из: {', '.join(self.MERGE_POLICIES)}"
+            )
 
-        if not removed_from_projects:
-            raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден ни в одном проекте")
+        # блокировки обеих компаний берутся в едином глобальном порядке
+        first, second = sorted((self, other), key=id)
+        with first.transaction(), second.transaction():
+            # единая проверка конфликтов до изменений
+            own_project_ids = {proj.project_id for proj in self.__projects}
+            conflicts = [emp.id for emp in other.iter_employees() if emp.id in self.__employee_index]
+            project_conflicts = [proj.project_id for proj in other.get_projects()
+                                 if proj.project_id in own_project_ids]
+            if conflicts and on_conflict == "error":
+                raise DuplicateIdError("Сотрудник", conflicts[0])
+            if project_conflicts and on_conflict != "skip":
+                raise DuplicateIdError("Проект", project_conflicts[0])
+
+            skipped = set(conflicts) if on_conflict == "skip" else set()
+            if on_conflict == "renumber":
+                next_id = max(max(self.__employee_index, default=0),
+                              max((emp.id for emp in other.iter_employees()), default=0)) + 1
+                for emp_id in conflicts:
+                    other.renumber_employee(emp_id, next_id)
+                    next_id += 1
+
+            for department in other.get_departments():
+                target = self.__departments.get(department.name)
+                if target is None and skipped.isdisjoint(department.get_employee_ids()):
+                    # отдел переносится целиком
+                    other.remove_department(department.name, force=True)
+                    self.add_department(department)
+                    continue
+
+                if target is None:
+                    target = Department(department.name)
+                    self.add_department(target)
+                for employee in department.get_employees():
+                    if employee.id not in skipped:
+                        department.remove_employee(employee.id)
+                        target.add_employee(employee)
+                if not department.has_employees():
+                    other.remove_department(department.name)
+
+            for project in other.get_projects():
+                if project.project_id in own_project_ids:
+                    continue
+                if not skipped.isdisjoint(project.get_team_member_ids()):
+                    continue
+                other.remove_project(project.project_id, force=True)
+                self.add_project(project)
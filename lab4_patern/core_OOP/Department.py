@@ -1,7 +1,9 @@
 import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
 from .exceptions import (
     EmployeeNotFoundError,
     DepartmentNotFoundError,
@@ -19,42 +21,92 @@ class Department:
             name: Название отдела
         """
         if not isinstance(name, str) or name.strip() == "":
-            raise InvalidDataError("Название отдела не должно быть пустой строкой")
+            raise InvalidDataError(field="название отдела", value=name, expected="непустая строка")
         self.__name = name
-        self.__employees: List[AbstractEmployee] = []
+        # id -> сотрудник, порядок добавления сохраняется
+        self.__employees: Dict[int, AbstractEmployee] = {}
+        self.__listeners: List[Callable] = []
+        # блокировка состава отдела (RLock - подписчики могут обращаться к отделу)
+        self.__lock = threading.RLock()
+        # растет при каждом изменении состава или названия
+        self.__version = 1
 
     @property
     def name(self) -> str:
         return self.__name
 
+    @property
+    def version(self) -> int:
+        """Версия отдела для оптимистичных блокировок"""
+        return self.__version
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Блокировка отдела для операций над несколькими контейнерами"""
+        return self.__lock
+
     @name.setter
     def name(self, value: str):
         """Устанавливает название отдела"""
         if not isinstance(value, str) or value.strip() == "":
-            raise InvalidDataError("Название отдела не должно быть пустой строкой")
-        self.__name = value
+            raise InvalidDataError(field="название отдела", value=value, expected="непустая строка")
+        with self.__lock:
+            if value != self.__name:
+                # подписчик может запретить переименование (например, дубликат в компании)
+                self.__notify("renamed", value)
+                # сотрудники хранят название отдела и сохраняются в БД с ним
+                for employee in self.__employees.values():
+                    employee.department = value
+            self.__name = value
+            self.__version += 1
+
+    # подписчики на изменение состава отдела
+    def add_listener(self, listener: Callable) -> None:
+        """
+        Подписывает обработчик на изменения состава отдела
 
-     def add_employee(self, employee):
+        Args:
+            listener: Функция listener(event, department, employee),
+                event - "added", "removed" или "renamed"
+                (для "renamed" вместо сотрудника передается новое название)
+        """
+        with self.__lock:
+            self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable) -> None:
+        """Отписывает обработчик"""
+        with self.__lock:
+            self.__listeners.remove(listener)
+
+    def __notify(self, event: str, employee) -> None:
+        for listener in self.__listeners:
+            listener(event, self, employee)
+
+    def add_employee(self, employee):
         """Добавляет сотрудника с проверкой уникальности ID"""
-        # Проверка уникальности ID
-        for emp in self.__employees:
-            if emp.id == employee.id:
+        with self.__lock:
+            # Проверка уникальности ID
+            if employee.id in self.__employees:
                 raise DuplicateIdError(
                     entity_type="Сотрудник",
                     entity_id=employee.id
                 )
-        
-        self.__employees.append(employee)
-    
+
+            # подписчик может запретить добавление (например, дубликат в компании)
+            self.__notify("added", employee)
+            self.__employees[employee.id] = employee
+            self.__version += 1
+
     def remove_employee(self, employee_id: int):
         """Удаляет сотрудника по ID"""
-        for i, emp in enumerate(self.__employees):
-            if emp.id == employee_id:
-                del self.__employees[i]
-                return
-        
-        raise EmployeeNotFoundError(employee_id)
-    
+        with self.__lock:
+            employee = self.__employees.get(employee_id)
+            if employee is None:
+                raise EmployeeNotFoundError(employee_id)
+
+            self.__notify("removed", employee)
+            del self.__employees[employee_id]
+            self.__version += 1
 
     def get_employees(self) -> List[AbstractEmployee]:
         """
@@ -63,7 +115,7 @@ class Department:
         Returns:
             Копию списка сотрудников
         """
-        return self.__employees.copy()
+        return list(self.__employees.values())
 
     def calculate_total_salary(self) -> float:
         """
@@ -73,8 +125,9 @@ class Department:
             Сумма зарплат всех сотрудников
         """
         total = 0.0
-        for employee in self.__employees:
-            total += employee.calculate_salary()
+        with self.__lock:
+            for employee in self.__employees.values():
+                total += employee.calculate_salary()
         return total
 
     def get_employee_count(self) -> dict[str, int]:
@@ -91,7 +144,7 @@ class Department:
             "Salesperson": 0
         }
 
-        for employee in self.__employees:
+        for employee in self.get_employees():
             class_name = employee.__class__.__name__
             if class_name in counts:
                 counts[class_name] += 1
@@ -103,17 +156,16 @@ class Department:
 
     def find_employee_by_id(self, employee_id: int):
         """Ищет сотрудника по ID"""
-        for employee in self.__employees:
-            if employee.id == employee_id:
-                return employee
-        
-        raise EmployeeNotFoundError(employee_id)
+        employee = self.__employees.get(employee_id)
+        if employee is None:
+            raise EmployeeNotFoundError(employee_id)
+        return employee
 
     def to_dict(self) -> dict:
         """Конвертирует отдел в словарь"""
         return {
             'name': self.__name,
-            'employees': [emp.to_dict() for emp in self.__employees]
+            'employees': [emp.to_dict() for emp in self.get_employees()]
         }
 
     def save_to_file(self, filename: str) -> None:
@@ -153,9 +205,9 @@ class Department:
             raise IOError(f"Не удалось загрузить файл {filename}: {e}")
 
         if 'name' not in data:
-            raise InvalidDataError("Файл должен содержать поле 'name'")
+            raise InvalidDataError(field="обязательное поле 'name'", value="отсутствует", expected="присутствует в файле")
         if 'employees' not in data:
-            raise InvalidDataError("Файл должен содержать поле 'employees'")
+            raise InvalidDataError(field="обязательное поле 'employees'", value="отсутствует", expected="присутствует в файле")
 
         department = cls(data['name'])
 
@@ -187,14 +239,15 @@ class Department:
         IndError: Если индекс вне диапазона
         TypeError: Если ключ не int или slice
         """
+        employees = list(self.__employees.values())
         if isinstance(key, int):
             if key < 0:
-                key = len(self.__employees) + key
-            if 0 <= key < len(self.__employees):
-                return self.__employees[key]
-            raise IndexError(f"Индекс {key} вне диапазона [0, {len(self.__employees) - 1}]")
+                key = len(employees) + key
+            if 0 <= key < len(employees):
+                return employees[key]
+            raise IndexError(f"Индекс {key} вне диапазона [0, {len(employees) - 1}]")
         elif isinstance(key, slice):
-            return self.__employees[key]
+            return employees[key]
         else:
             raise TypeError(f"Индекс должен быть int или slice, а не {type(key).__name__}")
 
@@ -211,10 +264,7 @@ class Department:
         if not isinstance(employee, AbstractEmployee):
             return False
 
-        for emp in self.__employees:
-            if emp == employee:
-                return True
-        return False
+        return employee.id in self.__employees
 
     def __str__(self) -> str:
         """Строковое представление отдела"""
@@ -222,7 +272,7 @@ class Department:
 
     def __iter__(self):
         """Итератор по сотрудникам отдела"""
-        return iter(self.__employees)
+        return iter(self.__employees.values())
 
     def __repr__(self) -> str:
         """Официальное строковое представление"""
@@ -245,4 +295,4 @@ class Department:
         Returns:
             Список ID сотрудников
         """
-        return [emp.id for emp in self.__employees]
+        return list(self.__employees.keys())
@@ -2,6 +2,7 @@ import json
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
 from .exceptions import (
     InvalidDataError,
     FinancialValidationError,
@@ -19,23 +20,33 @@ class Employee(AbstractEmployee):
         self.__name = name
         self.__department = department
         self.__base_salary = base_salary
+        # растет при каждом изменении, используется для оптимистичных блокировок
+        self.__version = 1
 
     def __validate_id(self, value):
         if not isinstance(value, int) or value <= 0:
-            raise InvalidDataError("ID должен быть положительным целым числом")
+            raise InvalidDataError(field="id", value=value, expected="положительное целое число")
 
     def __validate_name(self, value):
         if not isinstance(value, str) or value.strip() == "":
-            raise InvalidDataError("Имя не должно быть пустой строкой")
+            raise InvalidDataError(field="name", value=value, expected="непустая строка")
 
     def __validate_department(self, value):
         if not isinstance(value, str) or value.strip() == "":
-            raise InvalidDataError("Отдел не должен быть пустой строкой")
+            raise InvalidDataError(field="department", value=value, expected="непустая строка")
 
     def __validate_salary(self, value):
         if not isinstance(value, (int, float)) or value <= 0:
             raise FinancialValidationError("Зарплата должна быть положительным числом")
 
+    @property
+    def version(self):
+        return self.__version
+
+    def _bump_version(self):
+        """Отмечает изменение сотрудника (вызывается сеттерами, в т.ч. подклассов)"""
+        self.__version += 1
+
     def get_all(self):
         return (self.__id, self.__name, self.__department, self.__base_salary)
 
@@ -47,6 +58,7 @@ class Employee(AbstractEmployee):
     def id(self, value):
         self.__validate_id(value)
         self.__id = value
+        self._bump_version()
 
     @property
     def name(self):
@@ -56,6 +68,7 @@ class Employee(AbstractEmployee):
     def name(self, value):
         self.__validate_name(value)
         self.__name = value
+        self._bump_version()
 
     @property
     def department(self):
@@ -65,6 +78,7 @@ class Employee(AbstractEmployee):
     def department(self, value):
         self.__validate_department(value)
         self.__department = value
+        self._bump_version()
 
     @property
     def base_salary(self):
@@ -74,6 +88,7 @@ class Employee(AbstractEmployee):
     def base_salary(self, value):
         self.__validate_salary(value)
         self.__base_salary = value
+        self._bump_version()
 
     def __str__(self):
         return f"Сотрудник [id: {self.__id}, имя: {self.__name}, отдел: {self.__department}, базовая зарплата: {self.__base_salary}]"
@@ -94,7 +109,7 @@ class Employee(AbstractEmployee):
             'base_salary': self.__base_salary
         }
 
-@classmethod
+    @classmethod
     def from_dict(cls, data: dict) -> 'Employee':
         """Создает сотрудника из словаря с валидацией"""
         required_fields = ['id', 'name', 'department', 'base_salary']
@@ -121,3 +136,202 @@ class Employee(AbstractEmployee):
             department=data['department'],
             base_salary=data['base_salary']
         )
+
+
+class Manager(Employee):
+    def __init__(self, id_empl, name, department, base_salary, bonus):
+        super().__init__(id_empl, name, department, base_salary)
+        self.__validate_bonus(bonus)
+        self.__bonus = bonus
+
+    def __validate_bonus(self, value):
+        if not isinstance(value, (int, float)) or value < 0:
+            raise FinancialValidationError("Бонус должен быть неотрицательным числом")
+
+    @property
+    def bonus(self):
+        return self.__bonus
+
+    @bonus.setter
+    def bonus(self, value):
+        self.__validate_bonus(value)
+        self.__bonus = value
+        self._bump_version()
+
+    def calculate_salary(self) -> float:
+        return self.base_salary + self.__bonus
+
+    def get_info(self) -> str:
+        return f"{super().__str__()}, Бонус: {self.__bonus}, Итоговая зарплата: {self.calculate_salary()}"
+
+    def to_dict(self) -> dict:
+        """Конвертирует менеджера в словарь"""
+        data = super().to_dict()
+        data['bonus'] = self.__bonus
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Manager':
+        """Создает менеджера из словаря"""
+        if 'bonus' not in data:
+            raise InvalidDataError(
+                field="обязательное поле 'bonus'",
+                value="отсутствует",
+                expected="присутствует в данных"
+            )
+
+        return cls(
+            id_empl=data['id'],
+            name=data['name'],
+            department=data['department'],
+            base_salary=data['base_salary'],
+            bonus=data['bonus']
+        )
+
+
+class Developer(Employee):
+    SENIORITY_COEFFICIENTS = {
+        "junior": 1.0,
+        "middle": 1.5,
+        "senior": 2.0
+    }
+
+    def __init__(self, id_empl, name, department, base_salary, tech_stack=None, seniority_level="junior"):
+        super().__init__(id_empl, name, department, base_salary)
+        self.__validate_tech_stack(tech_stack)
+        self.__validate_seniority_level(seniority_level)
+        self.__tech_stack = list(tech_stack) if tech_stack is not None else []
+        self.__seniority_level = seniority_level
+
+    def __validate_tech_stack(self, value):
+        if value is not None and not isinstance(value, list):
+            raise InvalidDataError(field="tech_stack", value=value, expected="список навыков")
+
+    def __validate_seniority_level(self, value):
+        if value not in self.SENIORITY_COEFFICIENTS:
+            raise InvalidDataError(
+                field="seniority_level",
+                value=value,
+                expected=f"одно из: {list(self.SENIORITY_COEFFICIENTS)}"
+            )
+
+    @property
+    def tech_stack(self):
+        return self.__tech_stack.copy()
+
+    @property
+    def seniority_level(self):
+        return self.__seniority_level
+
+    @seniority_level.setter
+    def seniority_level(self, value):
+        self.__validate_seniority_level(value)
+        self.__seniority_level = value
+        self._bump_version()
+
+    def calculate_salary(self) -> float:
+        return self.base_salary * self.SENIORITY_COEFFICIENTS[self.__seniority_level]
+
+    def add_skill(self, new_skill: str) -> None:
+        if not isinstance(new_skill, str) or new_skill.strip() == "":
+            raise InvalidDataError(field="skill", value=new_skill, expected="непустая строка")
+        if new_skill not in self.__tech_stack:
+            self.__tech_stack.append(new_skill)
+            self._bump_version()
+
+    def get_info(self) -> str:
+        return f"{super().__str__()}, Уровень: {self.__seniority_level}, Технологии: {', '.join(self.__tech_stack)}, Итоговая зарплата: {self.calculate_salary()}"
+
+    def to_dict(self) -> dict:
+        """Конвертирует разработчика в словарь"""
+        data = super().to_dict()
+        data.update({
+            'tech_stack': self.__tech_stack.copy(),
+            'seniority_level': self.__seniority_level
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Developer':
+        """Создает разработчика из словаря"""
+        tech_stack = data.get('tech_stack', [])
+        seniority_level = data.get('seniority_level', 'junior')
+
+        return cls(
+            id_empl=data['id'],
+            name=data['name'],
+            department=data['department'],
+            base_salary=data['base_salary'],
+            tech_stack=tech_stack,
+            seniority_level=seniority_level
+        )
+
+
+class Salesperson(Employee):
+    def __init__(self, id_empl, name, department, base_salary, commission_rate, sales_volume=0.0):
+        super().__init__(id_empl, name, department, base_salary)
+        self.__validate_commission_rate(commission_rate)
+        self.__validate_sales_volume(sales_volume)
+        self.__commission_rate = commission_rate
+        self.__sales_volume = sales_volume
+
+    def __validate_commission_rate(self, value):
+        if not isinstance(value, (int, float)) or value < 0 or value > 1:
+            raise FinancialValidationError("Процент комиссии должен быть между 0 и 1")
+
+    def __validate_sales_volume(self, value):
+        if not isinstance(value, (int, float)) or value < 0:
+            raise FinancialValidationError("Объем продаж должен быть неотрицательным числом")
+
+    @property
+    def commission_rate(self):
+        return self.__commission_rate
+
+    @commission_rate.setter
+    def commission_rate(self, value):
+        self.__validate_commission_rate(value)
+        self.__commission_rate = value
+        self._bump_version()
+
+    @property
+    def sales_volume(self):
+        return self.__sales_volume
+
+    def calculate_salary(self) -> float:
+        return self.base_salary + (self.__sales_volume * self.__commission_rate)
+
+    def update_sales(self, new_sales: float) -> None:
+        self.__validate_sales_volume(new_sales)
+        self.__sales_volume += new_sales
+        self._bump_version()
+
+    def get_info(self) -> str:
+        return f"{super().__str__()}, Комиссия: {self.__commission_rate:.1%}, Объем продаж: {self.__sales_volume}, Итоговая зарплата: {self.calculate_salary()}"
+
+    def to_dict(self) -> dict:
+        """Конвертирует продавца в словарь"""
+        data = super().to_dict()
+        data.update({
+            'commission_rate': self.__commission_rate,
+            'sales_volume': self.__sales_volume
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Salesperson':
+        """Создает продавца из словаря"""
+        if 'commission_rate' not in data:
+            raise InvalidDataError(
+                field="обязательное поле 'commission_rate'",
+                value="отсутствует",
+                expected="присутствует в данных"
+            )
+
+        return cls(
+            id_empl=data['id'],
+            name=data['name'],
+            department=data['department'],
+            base_salary=data['base_salary'],
+            commission_rate=data['commission_rate'],
+            sales_volume=data.get('sales_volume', 0.0)
+        )
@@ -1,7 +1,15 @@
 import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
+from .Abctract_emp import AbstractEmployee
+from .exceptions import (
+    EmployeeNotFoundError,
+    DuplicateIdError,
+    InvalidDataError,
+    InvalidStatusError
+)
 
 
 class Project:
@@ -31,23 +39,29 @@ class Project:
         self.__description = description
         self.__deadline = deadline
         self.__status = status
-        self.__team: List[AbstractEmployee] = []
+        # id -> сотрудник, порядок добавления сохраняется
+        self.__team: Dict[int, AbstractEmployee] = {}
+        self.__listeners: List[Callable] = []
+        # блокировка команды и статуса (RLock - подписчики могут обращаться к проекту)
+        self.__lock = threading.RLock()
+        # растет при каждом изменении команды или статуса
+        self.__version = 1
 
     def __validate_project_id(self, value):
         if not isinstance(value, int) or value <= 0:
-            raise InvalidDataError("ID проекта должен быть положительным целым числом")
+            raise InvalidDataError(field="project_id", value=value, expected="положительное целое число")
 
     def __validate_name(self, value):
         if not isinstance(value, str) or value.strip() == "":
-            raise InvalidDataError("Название проекта не должно быть пустой строкой")
+            raise InvalidDataError(field="name", value=value, expected="непустая строка")
 
     def __validate_description(self, value):
         if not isinstance(value, str):
-            raise InvalidDataError("Описание проекта должно быть строкой")
+            raise InvalidDataError(field="description", value=value, expected="строка")
 
     def __validate_deadline(self, value):
         if not isinstance(value, datetime):
-            raise InvalidDataError("Срок должен быть объектом datetime")
+            raise InvalidDataError(field="deadline", value=value, expected="объект datetime")
 
     def __validate_status(self, value):
         if value not in self.VALID_STATUSES:
@@ -78,6 +92,38 @@ class Project:
         """Возвращает статус"""
         return self.__status
 
+    @property
+    def version(self) -> int:
+        """Версия проекта для оптимистичных блокировок"""
+        return self.__version
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Блокировка проекта для операций над несколькими контейнерами"""
+        return self.__lock
+
+    # подписчики на изменение команды
+    def add_listener(self, listener: Callable) -> None:
+        """
+        Подписывает обработчик на изменения команды
+
+        Args:
+            listener: Функция listener(event, project, employee),
+                event - "added", "removed" или "status"
+                (для "status" вместо сотрудника передается новый статус)
+        """
+        with self.__lock:
+            self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable) -> None:
+        """Отписывает обработчик"""
+        with self.__lock:
+            self.__listeners.remove(listener)
+
+    def __notify(self, event: str, employee) -> None:
+        for listener in self.__listeners:
+            listener(event, self, employee)
+
     def add_team_member(self, employee: AbstractEmployee) -> None:
         """
         Добавляет сотрудника
@@ -88,17 +134,19 @@ class Project:
         ValueError: Если сотрудник уже в проекте или проект завершен/отменен
         """
         if not isinstance(employee, AbstractEmployee):
-            raise InvalidDataError("Можно добавить только объект типа AbstractEmployee")
+            raise InvalidDataError(field="employee", value=employee, expected="объект AbstractEmployee")
 
-        if self.__status in {"completed", "cancelled"}:
-            raise InvalidStatusError(f"Нельзя добавить сотрудника в проект со статусом '{self.__status}'")
+        with self.__lock:
+            if self.__status in {"completed", "cancelled"}:
+                raise InvalidStatusError(f"Нельзя добавить сотрудника в проект со статусом '{self.__status}'")
 
-        # Проверка если ли уже сотрудник
-        for team_member in self.__team:
-            if team_member.id == employee.id:
-                raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже в проекте")
+            # Проверка если ли уже сотрудник
+            if employee.id in self.__team:
+                raise DuplicateIdError("Сотрудник", employee.id)
 
-        self.__team.append(employee)
+            self.__notify("added", employee)
+            self.__team[employee.id] = employee
+            self.__version += 1
 
     def remove_team_member(self, employee_id: int) -> None:
         """
@@ -110,20 +158,22 @@ class Project:
         ValueError: Если сотрудник не найден
         """
         if not isinstance(employee_id, int) or employee_id <= 0:
-            raise InvalidDataError("ID должен быть положительным целым числом")
+            raise InvalidDataError(field="ID сотрудника", value=employee_id, expected="положительное целое число")
 
-        for i, team_member in enumerate(self.__team):
-            if team_member.id == employee_id:
-                del self.__team[i]
-                return
+        with self.__lock:
+            employee = self.__team.get(employee_id)
+            if employee is None:
+                raise EmployeeNotFoundError(employee_id)
 
-        raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден в проекте")
+            self.__notify("removed", employee)
+            del self.__team[employee_id]
+            self.__version += 1
 
     def get_team(self) -> List[AbstractEmployee]:
         """
         Возвращает список команды
         """
-        return self.__team.copy()
+        return list(self.__team.values())
 
     def get_team_size(self) -> int:
         """
@@ -142,7 +192,7 @@ class Project:
             Сумма зарплат
         """
         total = 0.0
-        for employee in self.__team:
+        for employee in self.get_team():
             total += employee.calculate_salary()
         return total
 
@@ -172,7 +222,49 @@ class Project:
         if new_status not in self.VALID_STATUSES:
             raise InvalidStatusError(f"Статус должен быть одним из: {self.VALID_STATUSES}")
 
-        self.__status = new_status
+        with self.__lock:
+            if new_status != self.__status:
+                self.__notify("status", new_status)
+            self.__status = new_status
+            self.__version += 1
+
+    def to_dict(self) -> dict:
+        """Конвертирует проект в словарь (команда - списком ID)"""
+        return {
+            'project_id': self.__project_id,
+            'name': self.__name,
+            'description': self.__description,
+            'deadline': self.__deadline.isoformat(),
+            'status': self.__status,
+            'team': list(self.__team.keys())
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Project':
+        """
+        Создает проект из словаря без команды
+
+        Команду восстанавливает вызывающий: в словаре только ID сотрудников
+
+        InvalidDataError: Если данные некорректны
+        """
+        for field in ('project_id', 'name', 'description', 'deadline'):
+            if field not in data:
+                raise InvalidDataError(
+                    field=f"обязательное поле '{field}'",
+                    value="отсутствует",
+                    expected="присутствует в данных"
+                )
+        try:
+            deadline = datetime.fromisoformat(data['deadline'])
+        except (TypeError, ValueError):
+            raise InvalidDataError(
+                field="deadline",
+                value=data['deadline'],
+                expected="дата в формате ISO"
+            )
+        return cls(data['project_id'], data['name'], data['description'],
+                   deadline, data.get('status', 'planning'))
 
     def __str__(self) -> str:
         """Строковое представление проекта"""
@@ -187,10 +279,7 @@ class Project:
         if not isinstance(employee, AbstractEmployee):
             return False
 
-        for team_member in self.__team:
-            if team_member == employee:
-                return True
-        return False
+        return employee.id in self.__team
 
     # проверка команды
     def has_team(self) -> bool:
@@ -209,4 +298,4 @@ class Project:
         Returns:
             Список ID сотрудников
         """
-        return [emp.id for emp in self.__team]
+        return list(self.__team.keys())
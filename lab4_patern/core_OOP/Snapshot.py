@@ -0,0 +1,114 @@
+from typing import Optional, List, Dict, Iterator, Tuple, Any
+from datetime import datetime
+from .exceptions import (
+    EmployeeNotFoundError,
+    DepartmentNotFoundError
+)
+
+
+class CompanySnapshot:
+    """Неизменяемый снимок компании на момент времени (создается Company.snapshot)"""
+
+    def __init__(self, name: str, departments: dict, projects: list,
+                 employee_index: dict, employee_projects: dict):
+        """
+        Args:
+            name: Название компании
+            departments: Словарь {название: отдел}
+            projects: Список проектов
+            employee_index: Словарь {id сотрудника: (сотрудник, отдел)}
+            employee_projects: Словарь {id сотрудника: {id проекта: проект}}
+
+        Контейнеры не копируются: компания обязуется больше их не изменять
+        """
+        self.__name = name
+        self.__departments = departments
+        self.__projects = projects
+        self.__employee_index = employee_index
+        self.__employee_projects = employee_projects
+        self.__taken_at = datetime.now()
+        self.__department_names: Optional[Dict[int, str]] = None
+
+    @property
+    def name(self) -> str:
+        """Возвращает название компании"""
+        return self.__name
+
+    @property
+    def taken_at(self) -> datetime:
+        """Возвращает время создания снимка"""
+        return self.__taken_at
+
+    def get_department_names(self) -> List[str]:
+        """Возвращает названия отделов на момент снимка"""
+        return list(self.__departments.keys())
+
+    def get_projects(self):
+        """Возвращает список проектов на момент снимка"""
+        return list(self.__projects)
+
+    def iter_employees(self) -> Iterator:
+        """Ленивый обход сотрудников на момент снимка"""
+        return (entry[0] for entry in self.__employee_index.values())
+
+    def get_all_employees(self) -> list:
+        """Возвращает список сотрудников на момент снимка"""
+        return list(self.iter_employees())
+
+    def iter_department_employees(self, department_name: str) -> Iterator:
+        """
+        Ленивый обход сотрудников отдела на момент снимка
+
+        DepartmentNotFoundError: Если отдела не было в снимке
+        """
+        department = self.__departments.get(department_name)
+        if department is None:
+            raise DepartmentNotFoundError(department_name)
+        return (employee for employee, dept in self.__employee_index.values()
+                if dept is department)
+
+    def find_employee_by_id(self, employee_id: int):
+        """Поиск сотрудника по ID, None если его не было в снимке"""
+        entry = self.__employee_index.get(employee_id)
+        return entry[0] if entry is not None else None
+
+    def get_employee_department_name(self, employee_id: int) -> str:
+        """
+        Название отдела сотрудника на момент снимка
+
+        EmployeeNotFoundError: Если сотрудника не было в снимке
+        """
+        entry = self.__employee_index.get(employee_id)
+        if entry is None:
+            raise EmployeeNotFoundError(employee_id)
+        if self.__department_names is None:
+            self.__department_names = {id(dept): name for name, dept in self.__departments.items()}
+        return self.__department_names[id(entry[1])]
+
+    def iter_employee_entries(self) -> Iterator[Tuple[int, Any, str]]:
+        """
+        Ленивый обход (ID, сотрудник, название отдела) на момент снимка
+
+        ID берется из индекса снимка, а не из объекта сотрудника
+        """
+        if self.__department_names is None:
+            self.__department_names = {id(dept): name for name, dept in self.__departments.items()}
+        names = self.__department_names
+        return ((employee_id, employee, names[id(dept)])
+                for employee_id, (employee, dept) in self.__employee_index.items())
+
+    def get_employee_projects(self, employee_id: int) -> list:
+        """Проекты сотрудника на момент снимка"""
+        return list(self.__employee_projects.get(employee_id, {}).values())
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Сумма зарплат сотрудников на момент снимка"""
+        return sum((emp.calculate_salary() for emp in self.iter_employees()), 0.0)
+
+    def __len__(self) -> int:
+        """Количество сотрудников на момент снимка"""
+        return len(self.__employee_index)
+
+    def __str__(self) -> str:
+        return (f"Снимок компании: {self.__name} от {self.__taken_at:%d.%m.%Y %H:%M:%S} "
+                f"(Отделов: {len(self.__departments)}, Сотрудников: {len(self)})")
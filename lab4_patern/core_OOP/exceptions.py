@@ -43,6 +43,28 @@ class DuplicateIdError(BaseAppError):
         self.entity_type = entity_type
         self.entity_id = entity_id
 
+class VersionConflictError(BaseAppError):
+    """Исключение при изменении объекта, который уже изменил кто-то другой."""
+    def __init__(self, entity_type, entity_id, expected_version, actual_version):
+        super().__init__(
+            f"{entity_type} {entity_id} изменен параллельно: "
+            f"ожидалась версия {expected_version}, текущая {actual_version}"
+        )
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+class ChangeFeedGapError(BaseAppError):
+    """Исключение, когда нужные потребителю события уже вытеснены из ленты."""
+    def __init__(self, after_seq, first_seq):
+        super().__init__(
+            f"События после #{after_seq} недоступны, самое старое хранимое: #{first_seq}. "
+            f"Требуется полное перечитывание"
+        )
+        self.after_seq = after_seq
+        self.first_seq = first_seq
+
 class ValidationError(BaseAppError):
     """Базовое исключение для ошибок валидации."""
     pass
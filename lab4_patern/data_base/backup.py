@@ -0,0 +1,173 @@
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Optional, List, Callable, NamedTuple
+from core_OOP.exceptions import DatabaseError, InvalidDataError
+from data_base.connection import DatabaseConnection
+
+
+class BackupProgress(NamedTuple):
+    """Состояние копирования после очередного шага"""
+    pages_done: int
+    pages_total: int
+    elapsed: float
+    # скорость копирования в байтах в секунду
+    throughput: float
+
+
+class BackupResult(NamedTuple):
+    """Итог резервного копирования"""
+    path: str
+    pages: int
+    size: int
+    elapsed: float
+    # сколько раз копирование начиналось заново из-за записей в исходную БД
+    restarts: int
+
+
+class _TooManyRestarts(Exception):
+    """Прерывает пошаговое копирование из обратного вызова progress"""
+
+
+class BackupManager:
+    """
+    Резервные копии работающей БД через sqlite3 backup API
+
+    Копирование идет шагами по pages страниц с паузой sleep между ними:
+    между шагами исходная БД не заблокирована и запросы приложения не
+    ждут. Если в исходную БД пишут другие соединения, SQLite начинает
+    копирование заново; после max_restarts повторов оставшаяся копия
+    делается за один шаг (в режиме WAL это не блокирует писателя).
+
+    Копия пишется во временный файл, проверяется PRAGMA integrity_check
+    и только затем получает имя company-<время>.db. Хранятся последние
+    keep копий.
+    """
+
+    PREFIX = "company-"
+    SUFFIX = ".db"
+
+    def __init__(self, directory: str = "backups", db: Optional[DatabaseConnection] = None,
+                 keep: int = 5, pages: int = 256, sleep: float = 0.01, max_restarts: int = 3):
+        """
+        Args:
+            directory: Каталог копий (создается при необходимости)
+            db: Подключение к БД (по умолчанию - общий экземпляр DatabaseConnection)
+            keep: Сколько последних копий хранить
+            pages: Страниц за один шаг копирования
+            sleep: Пауза между шагами в секундах
+            max_restarts: Повторов пошагового копирования до копирования за один шаг
+        """
+        for field, value in (("keep", keep), ("pages", pages)):
+            if not isinstance(value, int) or value <= 0:
+                raise InvalidDataError(
+                    field=field,
+                    value=value,
+                    expected="положительное целое число"
+                )
+        if sleep < 0:
+            raise InvalidDataError(
+                field="sleep",
+                value=sleep,
+                expected="неотрицательное число"
+            )
+
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__db = db if db is not None else DatabaseConnection.get_instance()
+        self.__keep = keep
+        self.__pages = pages
+        self.__sleep = sleep
+        self.__max_restarts = max_restarts
+
+    def backup(self, progress: Optional[Callable[[BackupProgress], None]] = None) -> BackupResult:
+        """
+        Делает резервную копию, проверяет ее и удаляет лишние старые копии
+
+        Args:
+            progress: Вызывается после каждого шага копирования
+
+        Returns:
+            Сведения о созданной копии
+
+        DatabaseError: Если копирование не удалось или копия повреждена
+        """
+        name = f"{self.PREFIX}{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{self.SUFFIX}"
+        path = os.path.join(self.__directory, name)
+        partial = path + ".partial"
+
+        source = self.__db.open_reader()
+        target = sqlite3.connect(partial)
+        start = time.perf_counter()
+        try:
+            page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            state = {"restarts": 0, "remaining": None, "total": 0}
+
+            def on_step(status: int, remaining: int, total: int) -> None:
+                # после записи в исходную БД копирование начинается сначала
+                if state["remaining"] is not None and remaining > state["remaining"]:
+                    state["restarts"] += 1
+                    if state["restarts"] > self.__max_restarts:
+                        raise _TooManyRestarts()
+                state["remaining"], state["total"] = remaining, total
+                if progress is not None:
+                    elapsed = time.perf_counter() - start
+                    done = total - remaining
+                    progress(BackupProgress(done, total, elapsed,
+                                            done * page_size / elapsed if elapsed else 0.0))
+
+            try:
+                source.backup(target, pages=self.__pages, progress=on_step, sleep=self.__sleep)
+            except _TooManyRestarts:
+                source.backup(target, pages=-1, progress=on_step)
+            # копия - один самостоятельный файл, без журнала WAL
+            target.execute("PRAGMA journal_mode = DELETE")
+            check = target.execute("PRAGMA integrity_check").fetchone()[0]
+            if check != "ok":
+                raise DatabaseError(f"Резервная копия повреждена: {check}")
+        except sqlite3.Error as e:
+            target.close()
+            os.remove(partial)
+            raise DatabaseError(f"Ошибка резервного копирования: {e}")
+        except BaseException:
+            target.close()
+            os.remove(partial)
+            raise
+        finally:
+            source.close()
+        target.close()
+        os.replace(partial, path)
+        elapsed = time.perf_counter() - start
+
+        self.__rotate()
+        return BackupResult(path, state["total"], os.path.getsize(path), elapsed, state["restarts"])
+
+    def list_backups(self) -> List[str]:
+        """Пути копий, от старых к новым"""
+        names = sorted(name for name in os.listdir(self.__directory)
+                       if name.startswith(self.PREFIX) and name.endswith(self.SUFFIX))
+        return [os.path.join(self.__directory, name) for name in names]
+
+    @staticmethod
+    def verify(path: str) -> bool:
+        """Проверяет целостность копии (PRAGMA integrity_check)"""
+        if not os.path.isfile(path):
+            return False
+        try:
+            connection = sqlite3.connect(path)
+        except sqlite3.Error:
+            return False
+        try:
+            connection.execute("PRAGMA query_only = ON")
+            return connection.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        except sqlite3.Error:
+            return False
+        finally:
+            connection.close()
+
+    def __rotate(self) -> None:
+        """Удаляет копии сверх keep, начиная со старых"""
+        backups = self.list_backups()
+        for path in backups[:-self.__keep]:
+            os.remove(path)
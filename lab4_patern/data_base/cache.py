@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple, NamedTuple
+from core_OOP.Abctract_emp import AbstractEmployee
+from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError, InvalidDataError
+from data_base.connection import DatabaseConnection
+from data_base.repository import EmployeeRepository
+
+
+class CacheStats(NamedTuple):
+    """Счетчики кэша с момента создания (или reset_stats)"""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля обращений, обслуженных из кэша"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class EmployeeCache:
+    """
+    Identity map сотрудников поверх таблицы employees
+
+    Для одного ID get возвращает один и тот же объект, пока запись не
+    вытеснена (LRU при превышении max_size), не устарела (ttl) и не
+    изменена в БД. Об изменениях кэш узнает от потока-писателя
+    DatabaseConnection: любая запись в employees через submit_write
+    (save_employee, репозитории, CompanySync) удаляет затронутые ID
+    из кэша до того, как записавший получит результат.
+    """
+
+    GET_SQL = EmployeeRepository.GET_SQL
+
+    def __init__(self, db: Optional[DatabaseConnection] = None,
+                 max_size: int = 10_000, ttl: Optional[float] = None):
+        """
+        Args:
+            db: Подключение к БД (по умолчанию - общий экземпляр DatabaseConnection)
+            max_size: Максимум сотрудников в кэше
+            ttl: Время жизни записи в секундах (None - без ограничения)
+        """
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise InvalidDataError(
+                field="max_size",
+                value=max_size,
+                expected="положительное целое число"
+            )
+        if ttl is not None and ttl <= 0:
+            raise InvalidDataError(
+                field="ttl",
+                value=ttl,
+                expected="положительное число или None"
+            )
+
+        self.__db = db if db is not None else DatabaseConnection.get_instance()
+        self.__repository = EmployeeRepository(self.__db)
+        self.__max_size = max_size
+        self.__ttl = ttl
+        # ID -> (сотрудник, момент загрузки); порядок - от давно использованных к недавним
+        self.__entries: "OrderedDict[int, Tuple[AbstractEmployee, float]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        # растет при каждой инвалидации: загрузка, начатая до нее, не кэшируется
+        self.__generation = 0
+        self.__hits = self.__misses = 0
+        self.__evictions = self.__expirations = self.__invalidations = 0
+        self.__db.add_write_listener(self.invalidate)
+
+    def get(self, employee_id: int) -> AbstractEmployee:
+        """
+        Сотрудник по ID - из кэша или из БД
+
+        EmployeeNotFoundError: Если сотрудника нет в БД
+        DatabaseError: Если чтение не удалось
+        """
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(employee_id)
+            if entry is not None:
+                employee, loaded_at = entry
+                if self.__ttl is None or now - loaded_at < self.__ttl:
+                    self.__entries.move_to_end(employee_id)
+                    self.__hits += 1
+                    return employee
+                del self.__entries[employee_id]
+                self.__expirations += 1
+            self.__misses += 1
+            generation = self.__generation
+
+        try:
+            row = self.__db.get_connection().execute(self.GET_SQL, (employee_id,)).fetchone()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при чтении сотрудника {employee_id}: {e}")
+        if row is None:
+            raise EmployeeNotFoundError(employee_id)
+        employee = self.__repository.map_row(row)
+
+        with self.__lock:
+            # другой поток мог загрузить того же сотрудника раньше
+            entry = self.__entries.get(employee_id)
+            if entry is not None:
+                return entry[0]
+            if generation == self.__generation:
+                self.__entries[employee_id] = (employee, now)
+                if len(self.__entries) > self.__max_size:
+                    self.__entries.popitem(last=False)
+                    self.__evictions += 1
+        return employee
+
+    def invalidate(self, employee_ids: Set[int]) -> None:
+        """Удаляет сотрудников из кэша (вызывается писателем после записи)"""
+        with self.__lock:
+            self.__generation += 1
+            for employee_id in employee_ids:
+                if self.__entries.pop(employee_id, None) is not None:
+                    self.__invalidations += 1
+
+    def clear(self) -> None:
+        """Очищает кэш (счетчики сохраняются)"""
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Текущие счетчики кэша"""
+        with self.__lock:
+            return CacheStats(self.__hits, self.__misses, self.__evictions,
+                              self.__expirations, self.__invalidations, len(self.__entries))
+
+    def reset_stats(self) -> None:
+        """Обнуляет счетчики"""
+        with self.__lock:
+            self.__hits = self.__misses = 0
+            self.__evictions = self.__expirations = self.__invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self.__entries
+
+    def close(self) -> None:
+        """Отписывается от записей и очищает кэш"""
+        self.__db.remove_write_listener(self.invalidate)
+        self.clear()
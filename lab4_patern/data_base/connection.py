@@ -1,117 +1,684 @@
+import json
+import queue
 import sqlite3
-from typing import Optional
-from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError
+import threading
+from concurrent.futures import Future
+from typing import Optional, List, Dict, Set, Any, Callable, Iterable, Union, NamedTuple
+from core_OOP.Abctract_emp import AbstractEmployee
+from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError, InvalidDataError
+from Paterns.creational.factory_method import EmployeeFactory
+from data_base.migrations import SchemaMigrator
+
+
+class StorageProfile(NamedTuple):
+    """Настройки SQLite для одного сценария нагрузки"""
+    journal_mode: str
+    synchronous: str
+    # отрицательное значение - размер в КиБ, положительное - в страницах
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    # каждая фиксация дожидается fsync: подтвержденная запись переживет отключение питания
+    "durable": StorageProfile("WAL", "FULL", -2_000, 0, "DEFAULT"),
+    # при отключении питания теряются последние транзакции, но БД не повреждается
+    "balanced": StorageProfile("WAL", "NORMAL", -16_000, 64 * 1024 * 1024, "MEMORY"),
+    # только для первичной загрузки в файл, который можно пересоздать: сбой
+    # посреди записи может повредить БД, читатели ждут окончания транзакций
+    "bulk-load": StorageProfile("MEMORY", "OFF", -256_000, 0, "MEMORY"),
+    # большой кэш и отображение файла в память для частых чтений
+    "read-mostly": StorageProfile("WAL", "NORMAL", -64_000, 256 * 1024 * 1024, "MEMORY"),
+}
+
+
+# кодировщик создается один раз: json.dumps с параметрами создает его на каждый вызов
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 class DatabaseConnection:
-    """""
-    Singleton для управления подключением к базе данных SQLite.
-  
-    Гарантирует единственное подключение к БД в рамках приложения.
-    """""
-    
+    """
+    Singleton для работы с базой данных SQLite из нескольких потоков.
+
+    По умолчанию база открывается в режиме WAL (профиль "balanced", см.
+    STORAGE_PROFILES): читатели не блокируют писателя и друг друга.
+    У каждого потока свое соединение для чтения (get_connection), все записи
+    выполняет единственный поток-писатель, который объединяет накопившиеся
+    операции в одну транзакцию - поэтому "database is locked" не возникает.
+    """
+
     _instance: Optional['DatabaseConnection'] = None
-    _connection: Optional[sqlite3.Connection] = None
-    
+
+    EMPLOYEE_COLUMNS = ("id", "name", "department", "base_salary", "employee_type", "bonus",
+                        "tech_stack", "seniority_level", "commission_rate", "sales_volume")
+
+    EMPLOYEE_UPSERT = f"""
+        INSERT INTO employees ({", ".join(EMPLOYEE_COLUMNS)})
+        VALUES ({", ".join("?" * len(EMPLOYEE_COLUMNS))})
+        ON CONFLICT(id) DO UPDATE SET
+            {", ".join(f"{column} = excluded.{column}" for column in EMPLOYEE_COLUMNS[1:])}
+    """
+
+    # пакетная запись (upsert_employees): построчные триггеры навыков и поиска
+    # (миграции 4 и 5) стоят дороже самой вставки, даже если ничего не делают.
+    # На время операции они снимаются, а таблицы обновляются запросами по
+    # JSON-массиву ID пачки
+    BULK_TRIGGERS = ("employee_skills_insert", "employee_skills_update",
+                     "employees_fts_insert", "employees_fts_update")
+    BULK_TRIGGERS_SQL = ("SELECT name, sql FROM sqlite_master "
+                         "WHERE type = 'trigger' AND name IN (SELECT value FROM json_each(?))")
+    BULK_FTS_DELETE_SQL = ("INSERT INTO employees_fts (employees_fts, rowid, name) "
+                           "SELECT 'delete', id, name FROM employees WHERE id IN (SELECT value FROM json_each(?))")
+    BULK_FTS_INSERT_SQL = ("INSERT INTO employees_fts (rowid, name) "
+                           "SELECT id, name FROM employees WHERE id IN (SELECT value FROM json_each(?))")
+    BULK_SKILLS_DELETE_SQL = "DELETE FROM employee_skills WHERE employee_id IN (SELECT value FROM json_each(?))"
+    BULK_SKILLS_INSERT_SQL = """
+        INSERT INTO skills (name)
+            SELECT DISTINCT skill.value FROM employees, json_each(employees.tech_stack) AS skill
+            WHERE employees.id IN (SELECT value FROM json_each(?)) AND json_valid(employees.tech_stack)
+            ON CONFLICT (name) DO NOTHING
+    """
+    BULK_EMPLOYEE_SKILLS_INSERT_SQL = """
+        INSERT INTO employee_skills (employee_id, skill_id)
+            SELECT employees.id, skills.id FROM employees, json_each(employees.tech_stack) AS skill
+            JOIN skills ON skills.name = skill.value
+            WHERE employees.id IN (SELECT value FROM json_each(?)) AND json_valid(employees.tech_stack)
+            ON CONFLICT DO NOTHING
+    """
+
+    # строки employees прямо из объектов четырех классов, без to_dict;
+    # порядок полей - EMPLOYEE_COLUMNS
+    _ROW_BUILDERS: Dict[type, Callable[[Any], tuple]] = {
+        Employee: lambda employee: (*employee.get_all(), "Employee", None, None, None, None, None),
+        Manager: lambda employee: (*employee.get_all(), "Manager", employee.bonus, None, None, None, None),
+        Developer: lambda employee: (*employee.get_all(), "Developer", None,
+                                     _JSON_ENCODER.encode(employee.tech_stack), employee.seniority_level,
+                                     None, None),
+        Salesperson: lambda employee: (*employee.get_all(), "Salesperson", None, None, None,
+                                       employee.commission_rate, employee.sales_volume),
+    }
+
     def __new__(cls):
-      """ создание нового экземпляра"""
+        """ создание нового экземпляра"""
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
+            cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
-      """ инициализация"""
-        if self._connection is None:
-            self._connection = None
-    
+        """ инициализация"""
+        if self._initialized:
+            return
+        self._initialized = True
+        self._db_path: Optional[str] = None
+        self._busy_timeout = 5.0
+        self._write_batch = 256
+        self._profile = STORAGE_PROFILES["balanced"]
+        self._lock = threading.Lock()
+        # соединения читателей: поток -> соединение
+        self._local = threading.local()
+        self._readers: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._write_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # ошибка, остановившая писателя; новые записи сразу ее получают
+        self._failure: Optional[DatabaseError] = None
+        # ID сотрудников, измененных текущей транзакцией писателя
+        self._written_ids: Set[int] = set()
+        self._write_listeners: List[Callable[[Set[int]], None]] = []
+
     @classmethod
     def get_instance(cls) -> 'DatabaseConnection':
-      """
-      Получить единственный экземпляр класса.
-      """
+        """
+        Получить единственный экземпляр класса.
+        """
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
-    
+
+    @property
+    def path(self) -> Optional[str]:
+        """Путь к файлу открытой базы (None, если база не открыта)"""
+        return self._db_path
+
+    @property
+    def profile(self) -> StorageProfile:
+        """Настройки SQLite открытой (или следующей открываемой) базы"""
+        return self._profile
+
+    def configure(self, db_path: str = "company.db", busy_timeout: float = 5.0,
+                  write_batch: int = 256, profile: Union[str, StorageProfile] = "balanced") -> None:
+        """
+        Открывает базу данных и запускает поток-писатель
+
+        Args:
+            db_path: Путь к файлу БД (":memory:" не подходит - у каждого
+                соединения была бы своя база)
+            busy_timeout: Ожидание блокировки другими процессами в секундах
+            write_batch: Максимум операций записи в одной транзакции
+            profile: Имя профиля из STORAGE_PROFILES или свой StorageProfile
+
+        DatabaseError: Если база уже открыта с другим путем или профилем или не открывается
+        """
+        if write_batch <= 0:
+            raise InvalidDataError(
+                field="write_batch",
+                value=write_batch,
+                expected="положительное целое число"
+            )
+        if not isinstance(profile, StorageProfile):
+            if profile not in STORAGE_PROFILES:
+                raise InvalidDataError(
+                    field="profile",
+                    value=profile,
+                    expected=f"один из: {', '.join(STORAGE_PROFILES)}"
+                )
+            profile = STORAGE_PROFILES[profile]
+        with self._lock:
+            if self._db_path is not None:
+                if self._db_path != db_path:
+                    raise DatabaseError(f"База данных уже открыта: {self._db_path}")
+                # journal_mode уже выставлен писателем, а настройки - открытым соединениям
+                if self._profile != profile:
+                    raise DatabaseError(
+                        f"База данных {db_path} уже открыта с профилем {self._profile}; "
+                        f"для смены профиля закройте ее (close_connection)"
+                    )
+                return
+            self._db_path = db_path
+            self._busy_timeout = busy_timeout
+            self._write_batch = write_batch
+            self._profile = profile
+
+            started = Future()
+            self._writer = threading.Thread(target=self._write_loop, args=(started,),
+                                            name="database-writer", daemon=True)
+            self._writer.start()
+        try:
+            started.result()
+        except BaseException:
+            self._writer.join()
+            with self._lock:
+                self._db_path = None
+                self._writer = None
+            raise
+
     def get_connection(self, db_path: str = "company.db") -> sqlite3.Connection:
-     """ получить подключение к бд""" 
-        if self._connection is None:
-            self._connection = sqlite3.connect(db_path)
-            self._connection.row_factory = sqlite3.Row
-            self._create_tables()
-        return self._connection
-    
-    def close_connection(self) -> None:
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
-    
-    def _create_tables(self) -> None:
-      """создание таблицы в бд"""
-        if self._connection is None:
+        """
+        Соединение для чтения, принадлежащее текущему потоку
+
+        Соединение только для чтения (query_only): записи выполняются через
+        submit_write / execute_write.
+        """
+        if self._db_path is None:
+            self.configure(db_path)
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            connection.execute("PRAGMA query_only = ON")
+            self._local.connection = connection
+            with self._lock:
+                self._prune_readers()
+                self._readers[threading.current_thread()] = connection
+        return connection
+
+    def open_reader(self) -> sqlite3.Connection:
+        """
+        Отдельное соединение только для чтения, которым владеет вызывающий
+
+        В отличие от get_connection, соединение не привязано к потоку и не
+        закрывается вместе с базой: его закрывает вызывающий. Подходит для
+        долгих чтений (резервное копирование), которые не должны занимать
+        соединение потока. Открывает базу, если она еще не открыта.
+
+        DatabaseError: Если базу не удалось открыть
+        """
+        if self._db_path is None:
+            self.configure()
+        connection = self._connect()
+        connection.execute("PRAGMA query_only = ON")
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        """Открывает соединение с общими настройками"""
+        try:
+            connection = sqlite3.connect(self._db_path, timeout=self._busy_timeout,
+                                         check_same_thread=False)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Не удалось открыть базу данных {self._db_path}: {e}")
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        # настройки соединения; journal_mode - свойство файла БД, его ставит писатель
+        profile = self._profile
+        connection.execute(f"PRAGMA synchronous = {profile.synchronous}")
+        connection.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+        connection.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+        connection.execute(f"PRAGMA temp_store = {profile.temp_store}")
+        return connection
+
+    def _prune_readers(self) -> None:
+        """Закрывает соединения завершившихся потоков (вызывается под _lock)"""
+        for thread in [t for t in self._readers if not t.is_alive()]:
+            self._readers.pop(thread).close()
+
+    # запись
+    def submit_write(self, operation: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Ставит операцию записи в очередь потока-писателя
+
+        Операция выполняется внутри общей транзакции в своей точке
+        сохранения: ее ошибка откатывает только ее изменения.
+
+        Args:
+            operation: Функция operation(connection), результат попадает в Future
+
+        Returns:
+            Future, который завершается после фиксации транзакции
+
+        DatabaseError: Если поток-писатель остановлен ошибкой
+        """
+        if self._writer is None:
+            self.configure()
+        future = Future()
+        with self._lock:
+            if self._failure is not None:
+                raise self._failure
+            self._write_queue.put((operation, future))
+        return future
+
+    def execute_write(self, sql: str, params: Iterable = ()) -> int:
+        """Выполняет один оператор записи и ждет фиксации, возвращает rowcount"""
+        return self.submit_write(lambda conn: conn.execute(sql, params).rowcount).result()
+
+    def executemany_write(self, sql: str, seq_of_params: Iterable[Iterable]) -> int:
+        """Выполняет оператор для каждого набора параметров в одной операции записи"""
+        rows = list(seq_of_params)
+        return self.submit_write(lambda conn: conn.executemany(sql, rows).rowcount).result()
+
+    def _write_loop(self, started: Future) -> None:
+        """Поток-писатель: выполняет очередь операций пачками по транзакциям"""
+        try:
+            connection = self._connect()
+            # управление транзакциями вручную
+            connection.isolation_level = None
+            # журнал точек сохранения в памяти (temp_store = MEMORY) растет
+            # квадратично на операторах с триггерами: писателю - временные файлы
+            connection.execute("PRAGMA temp_store = DEFAULT")
+            journal_mode = self._profile.journal_mode
+            actual = connection.execute(f"PRAGMA journal_mode = {journal_mode}").fetchone()[0]
+            if actual.upper() != journal_mode.upper():
+                raise DatabaseError(
+                    f"Не удалось включить journal_mode={journal_mode} (остался {actual}): "
+                    f"базу держит открытой другой процесс"
+                )
+            SchemaMigrator().migrate(connection)
+            if self._write_listeners:
+                self._track_employee_writes(connection)
+        except BaseException as e:
+            # configure ждет started: любая ошибка должна до него дойти
+            started.set_exception(e if isinstance(e, DatabaseError)
+                                  else DatabaseError(f"Ошибка БД при открытии: {e}"))
             return
-        
-        cursor = self._connection.cursor()
-        # сотрудники
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                department TEXT NOT NULL,
-                base_salary REAL NOT NULL,
-                employee_type TEXT NOT NULL,
-                bonus REAL,
-                tech_stack TEXT,
-                seniority_level TEXT,
-                commission_rate REAL,
-                sales_volume REAL
-            )
-        """)
-        # отделы
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS departments (
-                name TEXT PRIMARY KEY
-            )
+        started.set_result(None)
+
+        stopping = False
+        while not stopping:
+            batch = [self._write_queue.get()]
+            while len(batch) < self._write_batch:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+            if batch:
+                try:
+                    self._run_batch(connection, batch)
+                except BaseException as e:
+                    self._fail_writer(batch, e)
+                    connection.close()
+                    return
+        # статистика для планировщика по таблицам, где она устарела
+        connection.execute("PRAGMA optimize")
+        connection.close()
+
+    def _run_batch(self, connection: sqlite3.Connection, batch: List[tuple]) -> None:
+        """Выполняет пачку операций в одной транзакции"""
+        results = []
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                connection.execute("SAVEPOINT operation")
+                try:
+                    result = operation(connection)
+                except BaseException as e:
+                    connection.execute("ROLLBACK TO operation")
+                    connection.execute("RELEASE operation")
+                    if isinstance(e, sqlite3.Error):
+                        e = DatabaseError(f"Ошибка БД при записи: {e}")
+                    future.set_exception(e)
+                    continue
+                connection.execute("RELEASE operation")
+                results.append((future, result))
+            connection.execute("COMMIT")
+        except BaseException as e:
+            # сюда попадают и ошибки ROLLBACK TO / RELEASE: пачка откатывается целиком
+            self._written_ids = set()
+            error = DatabaseError(f"Ошибка БД при фиксации транзакции: {e}") if isinstance(e, sqlite3.Error) else e
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            # если откатить не удалось, соединение непригодно - писатель остановится
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            return
+        # слушатели узнают об изменениях раньше, чем вызывающий получит результат
+        written, self._written_ids = self._written_ids, set()
+        if written:
+            self._notify_write_listeners(written)
+        # результат виден вызывающему только после фиксации
+        for future, result in results:
+            future.set_result(result)
+
+    def _fail_writer(self, batch: List[tuple], error: BaseException) -> None:
+        """
+        Останавливает писателя после ошибки, которую нельзя локализовать в пачке
+
+        Все ожидающие операции и все последующие вызовы submit_write
+        получают DatabaseError; писатель перезапускается через
+        close_connection и configure.
+        """
+        failure = DatabaseError(f"Поток записи остановлен ошибкой: {error!r}")
+        failure.__cause__ = error
+        with self._lock:
+            self._failure = failure
+            pending = [future for _, future in batch]
+            while True:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    pending.append(item[1])
+        for future in pending:
+            if not future.done():
+                future.set_exception(failure)
+
+    # отслеживание изменений сотрудников
+    def _track_employee_writes(self, connection: sqlite3.Connection) -> None:
+        """
+        Временные триггеры соединения писателя: каждая измененная строка
+        employees (любым оператором, включая каскадные удаления) попадает
+        в _written_ids. Триггеры стоят только пока есть подписчики - они
+        замедляют пакетную запись.
+        """
+        connection.create_function("employee_written", 1, self._written_ids_add)
+        for event, row in (("INSERT", "new"), ("UPDATE", "old"), ("DELETE", "old")):
+            connection.execute(f"""
+                CREATE TEMP TRIGGER IF NOT EXISTS track_employee_{event.lower()}
+                AFTER {event} ON main.employees
+                BEGIN SELECT employee_written({row}.id); END
+            """)
+        # при смене id (renumber) меняются обе строки
+        connection.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS track_employee_renumber
+            AFTER UPDATE OF id ON main.employees
+            BEGIN SELECT employee_written(new.id); END
         """)
-        
-        self._connection.commit()
-    
+
+    @staticmethod
+    def _untrack_employee_writes(connection: sqlite3.Connection) -> None:
+        """Удаляет триггеры отслеживания"""
+        for name in ("insert", "update", "delete", "renumber"):
+            connection.execute(f"DROP TRIGGER IF EXISTS temp.track_employee_{name}")
+
+    def _written_ids_add(self, employee_id: int) -> None:
+        """Функция SQL employee_written (вызывается в потоке-писателе)"""
+        self._written_ids.add(employee_id)
+
+    def add_write_listener(self, listener: Callable[[Set[int]], None]) -> None:
+        """
+        Подписка на изменения таблицы employees
+
+        listener(ids) вызывается в потоке-писателе после фиксации каждой
+        транзакции, изменившей сотрудников, и до того, как записавшие
+        получат результат. Набор ids может быть шире фактических изменений
+        (откаченные операции пачки), но не уже.
+        """
+        with self._lock:
+            self._write_listeners.append(listener)
+            first = len(self._write_listeners) == 1
+            running = self._writer is not None
+        # если писатель еще не запущен, триггеры создаст _write_loop
+        if first and running:
+            self.submit_write(self._track_employee_writes).result()
+
+    def remove_write_listener(self, listener: Callable[[Set[int]], None]) -> None:
+        """Отписка от изменений таблицы employees"""
+        with self._lock:
+            if listener not in self._write_listeners:
+                return
+            self._write_listeners.remove(listener)
+            last = not self._write_listeners
+            running = self._writer is not None
+        if last and running:
+            self.submit_write(self._untrack_employee_writes).result()
+
+    def _notify_write_listeners(self, employee_ids: Set[int]) -> None:
+        """Уведомляет подписчиков; их ошибки не должны остановить писателя"""
+        with self._lock:
+            listeners = list(self._write_listeners)
+        for listener in listeners:
+            try:
+                listener(employee_ids)
+            except Exception:
+                pass
+
+    def close_connection(self) -> None:
+        """Дожидается очереди записи и закрывает все соединения"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+            readers, self._readers = self._readers, {}
+            self._db_path = None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+        with self._lock:
+            # после остановки писателя ошибкой в очереди мог остаться сигнал остановки
+            self._write_queue = queue.Queue()
+            self._failure = None
+        for connection in readers.values():
+            connection.close()
+        self._local = threading.local()
+
     def reset_instance(self) -> None:
-      """
+        """
         Сбросить экземпляр
         FOR TEST ONLY
         """
-        if self._connection is not None:
-            self._connection.close()
-        self._connection = None
+        self.close_connection()
         DatabaseConnection._instance = None
 
     def get_employee(self, employee_id: int):
         """Получить сотрудника с проверкой существования"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
         cursor.execute("SELECT * FROM employees WHERE id = ?", (employee_id,))
         result = cursor.fetchone()
-        
+
         if not result:
             raise EmployeeNotFoundError(employee_id)
-        
+
         return dict(result)
-    
+
     def save_employee(self, employee_data):
         """Сохранить сотрудника с валидацией"""
+        self.execute_write(self.EMPLOYEE_UPSERT, self.employee_row(employee_data))
+
+    def save_employees(self, employees: Iterable, batch_size: int = 10_000) -> int:
+        """
+        Пакетное сохранение сотрудников (вставка или обновление по id)
+
+        Строки уходят потоку-писателю пачками по batch_size, каждая пачка -
+        один executemany в одной транзакции. Пока пишется одна пачка,
+        готовится следующая.
+
+        Args:
+            employees: Объекты сотрудников (любого из четырех классов) или словари
+            batch_size: Строк в одной транзакции
+
+        Returns:
+            Количество сохраненных сотрудников
+
+        InvalidDataError: Если у сотрудника нет обязательных полей
+        DatabaseError: Если запись не удалась (уже записанные пачки остаются)
+        """
+        if batch_size <= 0:
+            raise InvalidDataError(
+                field="batch_size",
+                value=batch_size,
+                expected="положительное целое число"
+            )
+        total = 0
+        pending: Optional[Future] = None
+        batch = []
+        for employee in employees:
+            batch.append(self.employee_row(employee))
+            if len(batch) >= batch_size:
+                if pending is not None:
+                    total += pending.result()
+                pending = self._submit_rows(batch)
+                batch = []
+        if pending is not None:
+            total += pending.result()
+        if batch:
+            total += self._submit_rows(batch).result()
+        return total
+
+    def _submit_rows(self, rows: List[tuple]) -> Future:
+        """Ставит в очередь записи одну пачку строк сотрудников"""
+        return self.submit_write(lambda conn: self.upsert_employees(conn, rows))
+
+    @classmethod
+    def upsert_employees(cls, conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        """
+        Вставляет или обновляет пачку строк employees внутри операции записи
+
+        Навыки и полнотекстовый индекс обновляются несколькими запросами на
+        всю пачку: построчные триггеры снимаются и создаются заново внутри
+        своей точки сохранения, поэтому другие соединения их отсутствия не
+        видят, а при ошибке откат возвращает их вместе с данными.
+
+        Returns:
+            Количество записанных строк
+        """
+        if not rows:
+            return 0
+        ids = (json.dumps([row[0] for row in rows]),)
+        conn.execute("SAVEPOINT upsert_employees")
+        try:
+            triggers = conn.execute(cls.BULK_TRIGGERS_SQL, (json.dumps(cls.BULK_TRIGGERS),)).fetchall()
+            for name, _ in triggers:
+                conn.execute(f"DROP TRIGGER main.{name}")
+            # старые имена удаляются из индекса до того, как UPSERT их перезапишет
+            conn.execute(cls.BULK_FTS_DELETE_SQL, ids)
+            conn.execute(cls.BULK_SKILLS_DELETE_SQL, ids)
+            count = conn.executemany(cls.EMPLOYEE_UPSERT, rows).rowcount
+            conn.execute(cls.BULK_FTS_INSERT_SQL, ids)
+            conn.execute(cls.BULK_SKILLS_INSERT_SQL, ids)
+            conn.execute(cls.BULK_EMPLOYEE_SKILLS_INSERT_SQL, ids)
+            for _, sql in triggers:
+                conn.execute(sql)
+        except BaseException:
+            conn.execute("ROLLBACK TO upsert_employees")
+            conn.execute("RELEASE upsert_employees")
+            raise
+        conn.execute("RELEASE upsert_employees")
+        return count
+
+    def load_employees(self, department: Optional[str] = None,
+                       employee_type: Optional[str] = None) -> List[AbstractEmployee]:
+        """
+        Загружает сотрудников из БД
+
+        Args:
+            department: Только сотрудники отдела (None - все)
+            employee_type: Только сотрудники класса, например "Developer" (None - все)
+
+        Returns:
+            Список объектов сотрудников в порядке ID
+        """
+        sql = "SELECT * FROM employees"
+        conditions, params = [], []
+        if department is not None:
+            conditions.append("department = ?")
+            params.append(department)
+        if employee_type is not None:
+            conditions.append("employee_type = ?")
+            params.append(employee_type)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+
+        try:
+            rows = self.get_connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при загрузке сотрудников: {e}")
+        return [self._employee_from_row(row) for row in rows]
+
+    @classmethod
+    def employee_row(cls, employee) -> tuple:
+        """
+        Строка таблицы employees из объекта сотрудника или словаря
+
+        Args:
+            employee: Сотрудник или словарь в формате to_dict
+
+        Returns:
+            Кортеж значений в порядке EMPLOYEE_COLUMNS, пригодный для EMPLOYEE_UPSERT
+
+        InvalidDataError: Если в словаре нет обязательного поля
+        """
+        build = cls._ROW_BUILDERS.get(type(employee))
+        if build is not None:
+            return build(employee)
+        # подклассы и словари - через to_dict
+        data = employee.to_dict() if isinstance(employee, AbstractEmployee) else employee
         # Проверяем обязательные поля
         required = ['id', 'name', 'department', 'base_salary']
         for field in required:
-            if field not in employee_data:
+            if field not in data:
                 raise InvalidDataError(
                     field=f"обязательное поле '{field}'",
                     value="отсутствует",
                     expected="присутствует"
                 )
-        
-        try:
-            # ... сохранение в БД
-        except sqlite3.Error as e:
-            raise DatabaseError(f"Ошибка БД при сохранении сотрудника: {e}")
+
+        tech_stack = data.get('tech_stack')
+        return (
+            data['id'],
+            data['name'],
+            data['department'],
+            data['base_salary'],
+            data.get('employee_type', data.get('type', 'Employee')),
+            data.get('bonus'),
+            _JSON_ENCODER.encode(tech_stack) if tech_stack is not None else None,
+            data.get('seniority_level'),
+            data.get('commission_rate'),
+            data.get('sales_volume')
+        )
+
+    @staticmethod
+    def _employee_from_row(row: sqlite3.Row) -> AbstractEmployee:
+        """Объект сотрудника из строки таблицы employees"""
+        data = dict(row)
+        data['type'] = data.pop('employee_type')
+        if data['tech_stack'] is not None:
+            data['tech_stack'] = json.loads(data['tech_stack'])
+        return EmployeeFactory.from_dict(data)
@@ -0,0 +1,484 @@
+import json
+import os
+import threading
+from typing import Optional, List, Dict, Any
+from core_OOP.Company import Company
+from core_OOP.Department import Department
+from core_OOP.Project import Project
+from core_OOP.ChangeFeed import ChangeFeed, ChangeEvent
+from core_OOP.exceptions import InvalidDataError
+from Paterns.creational.factory_method import EmployeeFactory
+
+
+class CompanyJournal:
+    """
+    Журнал изменений компании на диске (write-ahead log)
+
+    Каждое событие ленты изменений дописывается строкой JSON в текущий
+    сегмент журнала. Записи копятся в памяти и уходят на диск пачкой с
+    одним fsync (group commit): раз в commit_interval секунд или как только
+    накопится commit_batch записей. Восстановление - последний снимок плюс
+    хвост журнала после него. Компактификация пишет новый снимок и удаляет
+    сегменты, которые он полностью покрывает.
+
+    Изменения полей сотрудников в обход Company (кроме зарплаты через
+    update_salary) в ленту не попадают и не журналируются.
+    """
+
+    SNAPSHOT_FILE = "snapshot.json"
+    SEGMENT_PREFIX = "journal-"
+    SEGMENT_SUFFIX = ".log"
+
+    def __init__(self, directory: str, commit_interval: float = 0.05,
+                 commit_batch: int = 1000, compact_every: Optional[int] = None):
+        """
+        Args:
+            directory: Каталог для снимка и сегментов журнала
+            commit_interval: Максимальная задержка записи на диск в секундах
+            commit_batch: Сколько записей сбрасывать на диск без ожидания
+            compact_every: Компактифицировать в фоне после стольких записей
+                (None - только явным вызовом compact)
+        """
+        if commit_interval < 0:
+            raise InvalidDataError(
+                field="commit_interval",
+                value=commit_interval,
+                expected="неотрицательное число"
+            )
+        if not isinstance(commit_batch, int) or commit_batch <= 0:
+            raise InvalidDataError(
+                field="commit_batch",
+                value=commit_batch,
+                expected="положительное целое число"
+            )
+        if compact_every is not None and (not isinstance(compact_every, int) or compact_every <= 0):
+            raise InvalidDataError(
+                field="compact_every",
+                value=compact_every,
+                expected="положительное целое число или None"
+            )
+
+        self.__directory = directory
+        self.__commit_interval = commit_interval
+        self.__commit_batch = commit_batch
+        self.__compact_every = compact_every
+
+        self.__company: Optional[Company] = None
+        self.__lsn = 0
+        self.__durable_lsn = 0
+        self.__buffer: List[str] = []
+        self.__since_compaction = 0
+        self.__flush_requested = False
+        self.__closed = False
+        self.__error: Optional[BaseException] = None
+        self.__segment = None
+        self.__segment_start = 0
+        # порядок захвата: __io_lock, затем __cond
+        self.__io_lock = threading.RLock()
+        self.__cond = threading.Condition()
+        self.__compact_lock = threading.Lock()
+        self.__writer: Optional[threading.Thread] = None
+        self.__compactor: Optional[threading.Thread] = None
+
+    @property
+    def directory(self) -> str:
+        """Возвращает каталог журнала"""
+        return self.__directory
+
+    @property
+    def lsn(self) -> int:
+        """Номер последней записи журнала"""
+        return self.__lsn
+
+    @property
+    def durable_lsn(self) -> int:
+        """Номер последней записи, гарантированно сохраненной на диск"""
+        return self.__durable_lsn
+
+    # подключение и восстановление
+    def attach(self, company: Company) -> None:
+        """
+        Начинает журналировать компанию в пустой каталог
+
+        Сразу пишет снимок текущего состояния компании.
+
+        InvalidDataError: Если журнал уже подключен, каталог содержит журнал
+            или для фоновой компактификации компания не потокобезопасна
+        """
+        if os.path.exists(self.__snapshot_path()) or self.__segment_starts():
+            raise InvalidDataError(
+                field="каталог журнала",
+                value=self.__directory,
+                expected="пустой каталог (для существующего журнала используйте recover)"
+            )
+        self.__start(company)
+        self.compact()
+
+    def recover(self, thread_safe: bool = False) -> Company:
+        """
+        Восстанавливает компанию из снимка и хвоста журнала
+
+        После восстановления журнал продолжает запись в новый сегмент.
+        Незавершенная последняя строка сегмента (обрыв при сбое) пропускается.
+
+        Args:
+            thread_safe: Режим создаваемой компании
+
+        Returns:
+            Восстановленная компания
+
+        InvalidDataError: Если снимка нет или журнал поврежден
+        """
+        try:
+            with open(self.__snapshot_path(), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (IOError, OSError, json.JSONDecodeError) as e:
+            raise InvalidDataError(
+                field="снимок журнала",
+                value=self.__snapshot_path(),
+                expected=f"читаемый JSON ({e})"
+            )
+
+        company = self.__load_snapshot(state, thread_safe)
+        lsn = state['lsn']
+        for record in self.__read_segments():
+            if record['lsn'] <= state['lsn']:
+                continue
+            if record['lsn'] != lsn + 1:
+                raise InvalidDataError(
+                    field="номер записи журнала",
+                    value=record['lsn'],
+                    expected=f"{lsn + 1} (журнал поврежден или неполон)"
+                )
+            self.__apply(company, record['type'], record['id'], record['data'])
+            lsn = record['lsn']
+
+        self.__lsn = self.__durable_lsn = lsn
+        self.__start(company)
+        return company
+
+    def __start(self, company: Company) -> None:
+        """Открывает новый сегмент, подписывается на ленту и запускает запись"""
+        if self.__company is not None:
+            raise InvalidDataError(
+                field="журнал",
+                value=self.__directory,
+                expected="еще не подключенный к компании"
+            )
+        if self.__compact_every is not None and not company.thread_safe:
+            raise InvalidDataError(
+                field="compact_every",
+                value=self.__compact_every,
+                expected="None для компании без thread_safe"
+            )
+        os.makedirs(self.__directory, exist_ok=True)
+        self.__company = company
+        self.__open_segment(self.__lsn + 1)
+        self.__writer = threading.Thread(target=self.__write_loop, name="company-journal", daemon=True)
+        self.__writer.start()
+        company.change_feed.subscribe(self.__on_event)
+
+    # запись
+    def __on_event(self, event: ChangeEvent) -> None:
+        """Ставит событие ленты в очередь на запись (вызывается под блокировкой компании)"""
+        with self.__cond:
+            self.__lsn += 1
+            self.__buffer.append(json.dumps({
+                'lsn': self.__lsn,
+                'type': event.type,
+                'id': event.entity_id,
+                'data': event.data,
+                'ts': event.timestamp.isoformat()
+            }, ensure_ascii=False) + "\n")
+            if len(self.__buffer) >= self.__commit_batch:
+                self.__cond.notify_all()
+
+    def __write_loop(self) -> None:
+        """Фоновый поток: сбрасывает накопленные записи одним fsync"""
+        while True:
+            with self.__cond:
+                while not self.__buffer and not self.__closed:
+                    self.__cond.wait()
+                # окно group commit: ждем еще записей, пока никто не просит сброса
+                if (not self.__closed and not self.__flush_requested
+                        and len(self.__buffer) < self.__commit_batch):
+                    self.__cond.wait(self.__commit_interval)
+                if self.__closed and not self.__buffer:
+                    return
+
+            written = self.__sync()
+            if (written and self.__compact_every is not None
+                    and self.__since_compaction >= self.__compact_every):
+                self.__compact_in_background()
+
+    def __sync(self) -> int:
+        """Записывает буфер в текущий сегмент и делает fsync, возвращает число записей"""
+        with self.__io_lock:
+            with self.__cond:
+                lines, self.__buffer = self.__buffer, []
+                upto = self.__lsn
+                self.__flush_requested = False
+            if lines:
+                try:
+                    self.__segment.write("".join(lines))
+                    self.__segment.flush()
+                    os.fsync(self.__segment.fileno())
+                except (IOError, OSError) as e:
+                    with self.__cond:
+                        self.__error = e
+                        self.__cond.notify_all()
+                    raise
+            with self.__cond:
+                self.__durable_lsn = upto
+                self.__since_compaction += len(lines)
+                self.__cond.notify_all()
+            return len(lines)
+
+    def flush(self) -> None:
+        """
+        Дожидается сохранения на диск всех уже записанных в журнал изменений
+
+        IOError: Если фоновая запись завершилась ошибкой
+        """
+        with self.__cond:
+            target = self.__lsn
+            self.__flush_requested = True
+            self.__cond.notify_all()
+            while self.__durable_lsn < target and self.__error is None and self.__writer_alive():
+                self.__cond.wait()
+            if self.__error is not None:
+                raise IOError(f"Не удалось записать журнал {self.__directory}: {self.__error}")
+
+    def __writer_alive(self) -> bool:
+        return self.__writer is not None and self.__writer.is_alive()
+
+    # компактификация
+    def compact(self) -> None:
+        """
+        Пишет снимок компании и удаляет покрытые им сегменты журнала
+
+        Изменения блокируются только на время взятия O(1) снимка, сериализация
+        идет параллельно с работой компании. Для компании без thread_safe
+        вызывать из потока, который ее изменяет, и не внутри транзакции.
+        """
+        company = self.__company
+        if company is None:
+            raise InvalidDataError(
+                field="журнал",
+                value=self.__directory,
+                expected="подключенный к компании"
+            )
+        with self.__compact_lock:
+            self.__rotate()
+            # транзакция без изменений - способ остановить запись на время снимка
+            with company.transaction():
+                snapshot = company.snapshot()
+                statuses = {project.project_id: project.status for project in snapshot.get_projects()}
+                lsn = self.__lsn
+            self.__write_snapshot(snapshot, statuses, lsn)
+
+            current = self.__segment_start
+            for start in self.__segment_starts():
+                if start < current:
+                    os.remove(self.__segment_path(start))
+
+    def __compact_in_background(self) -> None:
+        """Запускает компактификацию в отдельном потоке, если она еще не идет"""
+        if self.__compactor is not None and self.__compactor.is_alive():
+            return
+        self.__compactor = threading.Thread(target=self.compact, name="company-journal-compact", daemon=True)
+        self.__compactor.start()
+
+    def __rotate(self) -> None:
+        """Сбрасывает буфер в текущий сегмент и начинает новый"""
+        with self.__io_lock:
+            self.__sync()
+            self.__segment.close()
+            self.__open_segment(self.__durable_lsn + 1)
+
+    def __open_segment(self, start: int) -> None:
+        self.__segment = open(self.__segment_path(start), 'a', encoding='utf-8')
+        self.__segment_start = start
+        self.__fsync_directory()
+
+    def __write_snapshot(self, snapshot, statuses: Dict[int, str], lsn: int) -> None:
+        """Атомарно заменяет файл снимка"""
+        departments = {name: [] for name in snapshot.get_department_names()}
+        teams: Dict[int, List[int]] = {project_id: [] for project_id in statuses}
+        for employee_id, employee, department_name in snapshot.iter_employee_entries():
+            data = employee.to_dict()
+            data['id'] = employee_id
+            departments[department_name].append(data)
+            for project in snapshot.get_employee_projects(employee_id):
+                teams[project.project_id].append(employee_id)
+
+        projects = []
+        for project in snapshot.get_projects():
+            data = project.to_dict()
+            data['status'] = statuses[project.project_id]
+            data['team'] = teams[project.project_id]
+            projects.append(data)
+
+        state = {
+            'lsn': lsn,
+            'name': snapshot.name,
+            'taken_at': snapshot.taken_at.isoformat(),
+            'departments': [{'name': name, 'employees': employees}
+                            for name, employees in departments.items()],
+            'projects': projects
+        }
+        tmp_path = self.__snapshot_path() + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.__snapshot_path())
+            self.__fsync_directory()
+        except (IOError, OSError) as e:
+            raise IOError(f"Не удалось сохранить снимок {self.__snapshot_path()}: {e}")
+        with self.__cond:
+            self.__since_compaction = self.__lsn - lsn
+
+    # чтение
+    def __load_snapshot(self, state: Dict[str, Any], thread_safe: bool) -> Company:
+        """Строит компанию по содержимому снимка"""
+        for field in ('lsn', 'name', 'departments', 'projects'):
+            if field not in state:
+                raise InvalidDataError(
+                    field=f"поле снимка '{field}'",
+                    value="отсутствует",
+                    expected="присутствует в снимке"
+                )
+
+        company = Company(state['name'], thread_safe=thread_safe)
+        for dept_data in state['departments']:
+            department = Department(dept_data['name'])
+            for emp_data in dept_data['employees']:
+                department.add_employee(EmployeeFactory.from_dict(emp_data))
+            company.add_department(department)
+        for project_data in state['projects']:
+            self.__restore_project(company, project_data)
+        return company
+
+    def __read_segments(self):
+        """Читает записи всех сегментов по порядку"""
+        for start in self.__segment_starts():
+            path = self.__segment_path(start)
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            for number, line in enumerate(lines):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if number == len(lines) - 1:
+                        break  # запись оборвалась при сбое и не была подтверждена
+                    raise InvalidDataError(
+                        field=f"строка {number + 1} сегмента",
+                        value=path,
+                        expected="корректный JSON"
+                    )
+
+    @staticmethod
+    def __restore_project(company: Company, data: Dict[str, Any]) -> None:
+        """Создает проект с командой; статус ставится после набора команды"""
+        project = Project.from_dict(dict(data, status="planning"))
+        for employee_id in data.get('team', []):
+            # сотрудники, удаленные из компании с force, не восстанавливаются
+            employee = company.find_employee_by_id(employee_id)
+            if employee is not None:
+                project.add_team_member(employee)
+        project.change_status(data.get('status', "planning"))
+        company.add_project(project)
+
+    @classmethod
+    def __apply(cls, company: Company, event_type: str, entity_id: int, data: Dict[str, Any]) -> None:
+        """Повторяет событие журнала на компании"""
+        if event_type == ChangeFeed.HIRED:
+            employee = EmployeeFactory.from_dict(data['employee'])
+            company.get_department(data['department']).add_employee(employee)
+        elif event_type == ChangeFeed.REMOVED:
+            company.get_department(data['department']).remove_employee(entity_id)
+        elif event_type == ChangeFeed.TRANSFERRED:
+            company.transfer_many([(entity_id, data['to_department'])], force=True)
+        elif event_type == ChangeFeed.SALARY_CHANGED:
+            company.update_salary(entity_id, data['new_salary'])
+        elif event_type == ChangeFeed.TEAM_CHANGED:
+            project = company.get_project(entity_id)
+            if data['action'] == "added":
+                employee = company.find_employee_by_id(data['employee_id'])
+                if employee is not None:
+                    project.add_team_member(employee)
+            else:
+                project.remove_team_member(data['employee_id'])
+        elif event_type == ChangeFeed.STATUS_CHANGED:
+            company.get_project(entity_id).change_status(data['new_status'])
+        elif event_type == ChangeFeed.DEPARTMENT_ADDED:
+            company.add_department(Department(data['department']))
+        elif event_type == ChangeFeed.DEPARTMENT_REMOVED:
+            company.remove_department(data['department'], force=True)
+        elif event_type == ChangeFeed.DEPARTMENT_RENAMED:
+            company.get_department(data['old_name']).name = data['new_name']
+        elif event_type == ChangeFeed.PROJECT_ADDED:
+            cls.__restore_project(company, data['project'])
+        elif event_type == ChangeFeed.PROJECT_REMOVED:
+            company.remove_project(entity_id, force=True)
+        else:
+            raise InvalidDataError(
+                field="тип записи журнала",
+                value=event_type,
+                expected=f"один из: {', '.join(sorted(ChangeFeed.EVENT_TYPES))}"
+            )
+
+    # файлы
+    def __snapshot_path(self) -> str:
+        return os.path.join(self.__directory, self.SNAPSHOT_FILE)
+
+    def __segment_path(self, start: int) -> str:
+        return os.path.join(self.__directory, f"{self.SEGMENT_PREFIX}{start:020d}{self.SEGMENT_SUFFIX}")
+
+    def __segment_starts(self) -> List[int]:
+        """Номера первых записей существующих сегментов по возрастанию"""
+        if not os.path.isdir(self.__directory):
+            return []
+        starts = []
+        for filename in os.listdir(self.__directory):
+            if filename.startswith(self.SEGMENT_PREFIX) and filename.endswith(self.SEGMENT_SUFFIX):
+                starts.append(int(filename[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]))
+        return sorted(starts)
+
+    def __fsync_directory(self) -> None:
+        """Фиксирует создание и переименование файлов (только POSIX)"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.__directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # завершение работы
+    def close(self) -> None:
+        """Сбрасывает журнал на диск, отписывается от ленты и закрывает сегмент"""
+        if self.__company is None:
+            return
+        self.__company.change_feed.unsubscribe(self.__on_event)
+        if self.__compactor is not None:
+            self.__compactor.join()
+        with self.__cond:
+            self.__closed = True
+            self.__cond.notify_all()
+        self.__writer.join()
+        # поток записи мог успеть запустить еще одну компактификацию
+        if self.__compactor is not None:
+            self.__compactor.join()
+        self.__segment.close()
+        self.__company = None
+        if self.__error is not None:
+            raise IOError(f"Не удалось записать журнал {self.__directory}: {self.__error}")
+
+    def __enter__(self) -> 'CompanyJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
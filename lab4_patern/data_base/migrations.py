@@ -0,0 +1,257 @@
+import sqlite3
+from typing import Optional, List, Tuple, Callable, NamedTuple
+from core_OOP.exceptions import DatabaseError
+
+
+class Migration(NamedTuple):
+    """Шаг изменения схемы БД"""
+    version: int
+    description: str
+    statements: Tuple[str, ...] = ()
+    # для изменений, которые не выразить списком SQL (перенос данных)
+    apply: Optional[Callable[[sqlite3.Connection], None]] = None
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "сотрудники и отделы", (
+        """
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            department TEXT NOT NULL,
+            base_salary REAL NOT NULL,
+            employee_type TEXT NOT NULL,
+            bonus REAL,
+            tech_stack TEXT,
+            seniority_level TEXT,
+            commission_rate REAL,
+            sales_volume REAL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS departments (
+            name TEXT PRIMARY KEY
+        )
+        """,
+    )),
+    # поиск по типу с диапазоном зарплат и сортировкой по ней
+    Migration(2, "индексы по отделу и типу с зарплатой", (
+        "CREATE INDEX IF NOT EXISTS idx_employees_department ON employees (department)",
+        "CREATE INDEX IF NOT EXISTS idx_employees_type_salary ON employees (employee_type, base_salary)",
+    )),
+    # первичный ключ участников обслуживает поиск по проекту, индекс - по сотруднику
+    Migration(3, "проекты и участники проектов", (
+        """
+        CREATE TABLE IF NOT EXISTS projects (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            deadline TEXT NOT NULL,
+            status TEXT NOT NULL
+                CHECK (status IN ('planning', 'active', 'completed', 'cancelled'))
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS project_members (
+            project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+            employee_id INTEGER NOT NULL REFERENCES employees (id) ON DELETE CASCADE,
+            PRIMARY KEY (project_id, employee_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_project_members_employee ON project_members (employee_id, project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)",
+    )),
+    # источник истины - employees.tech_stack: триггеры раскладывают его по
+    # таблицам при любой записи сотрудника, затем переносятся уже сохраненные
+    Migration(4, "навыки сотрудников", (
+        """
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS employee_skills (
+            employee_id INTEGER NOT NULL
+                REFERENCES employees (id) ON DELETE CASCADE ON UPDATE CASCADE,
+            skill_id INTEGER NOT NULL REFERENCES skills (id),
+            PRIMARY KEY (employee_id, skill_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_employee_skills_skill ON employee_skills (skill_id, employee_id)",
+        # OR IGNORE внутри триггера заменяется политикой внешнего оператора
+        # (UPSERT сотрудника), поэтому конфликты разрешает ON CONFLICT; "WHERE"
+        # перед ним обязателен синтаксисом UPSERT для INSERT ... SELECT
+        """
+        CREATE TRIGGER IF NOT EXISTS employee_skills_insert
+        AFTER INSERT ON employees
+        WHEN json_valid(new.tech_stack)
+        BEGIN
+            INSERT INTO skills (name)
+                SELECT DISTINCT value FROM json_each(new.tech_stack) WHERE true
+                ON CONFLICT (name) DO NOTHING;
+            INSERT INTO employee_skills (employee_id, skill_id)
+                SELECT new.id, skills.id FROM json_each(new.tech_stack)
+                JOIN skills ON skills.name = json_each.value WHERE true
+                ON CONFLICT DO NOTHING;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS employee_skills_update
+        AFTER UPDATE OF tech_stack ON employees
+        WHEN old.tech_stack IS NOT new.tech_stack
+        BEGIN
+            DELETE FROM employee_skills WHERE employee_id = new.id;
+            INSERT INTO skills (name)
+                SELECT DISTINCT value FROM json_each(new.tech_stack) WHERE json_valid(new.tech_stack)
+                ON CONFLICT (name) DO NOTHING;
+            INSERT INTO employee_skills (employee_id, skill_id)
+                SELECT new.id, skills.id FROM json_each(new.tech_stack)
+                JOIN skills ON skills.name = json_each.value WHERE json_valid(new.tech_stack)
+                ON CONFLICT DO NOTHING;
+        END
+        """,
+        """
+        INSERT OR IGNORE INTO skills (name)
+            SELECT DISTINCT json_each.value FROM employees, json_each(employees.tech_stack)
+            WHERE json_valid(employees.tech_stack)
+        """,
+        """
+        INSERT OR IGNORE INTO employee_skills (employee_id, skill_id)
+            SELECT employees.id, skills.id FROM employees, json_each(employees.tech_stack)
+            JOIN skills ON skills.name = json_each.value
+            WHERE json_valid(employees.tech_stack)
+        """,
+    )),
+    # внешнее содержимое: FTS хранит только индекс, текст берется из employees.
+    # unicode61 приводит к нижнему регистру и кириллицу; prefix ускоряет
+    # поиск по началу слова из 2-3 букв
+    Migration(5, "полнотекстовый поиск по именам", (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
+            name, content = 'employees', content_rowid = 'id',
+            tokenize = 'unicode61', prefix = '2 3'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_fts_insert
+        AFTER INSERT ON employees
+        BEGIN
+            INSERT INTO employees_fts (rowid, name) VALUES (new.id, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_fts_delete
+        AFTER DELETE ON employees
+        BEGIN
+            INSERT INTO employees_fts (employees_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        END
+        """,
+        # UPSERT сотрудника переписывает name всегда - индекс трогаем только при изменении
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_fts_update
+        AFTER UPDATE OF id, name ON employees
+        WHEN old.id != new.id OR old.name IS NOT new.name
+        BEGIN
+            INSERT INTO employees_fts (employees_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            INSERT INTO employees_fts (rowid, name) VALUES (new.id, new.name);
+        END
+        """,
+        "INSERT INTO employees_fts (employees_fts) VALUES ('rebuild')",
+    )),
+    # iter_by_type выбирает по типу в порядке id: в индексе (employee_type,
+    # base_salary) строки типа упорядочены по зарплате, и SQLite сортирует их
+    # во временном B-дереве; в индексе только по типу они уже идут по rowid
+    Migration(6, "индекс по типу сотрудника", (
+        "CREATE INDEX IF NOT EXISTS idx_employees_type ON employees (employee_type)",
+    )),
+]
+
+
+class SchemaMigrator:
+    """
+    Применяет миграции схемы по порядку версий
+
+    Текущая версия хранится в таблице schema_version, каждая миграция
+    выполняется в своей транзакции вместе с записью новой версии.
+    """
+
+    def __init__(self, migrations: Optional[List[Migration]] = None):
+        """
+        Args:
+            migrations: Миграции (по умолчанию - MIGRATIONS)
+
+        DatabaseError: Если версии не идут подряд начиная с 1
+        """
+        self.__migrations = list(MIGRATIONS if migrations is None else migrations)
+        for expected, migration in enumerate(self.__migrations, start=1):
+            if migration.version != expected:
+                raise DatabaseError(
+                    f"Миграции должны идти подряд: ожидалась версия {expected}, "
+                    f"получена {migration.version}"
+                )
+
+    @property
+    def latest_version(self) -> int:
+        """Версия схемы после всех миграций"""
+        return len(self.__migrations)
+
+    @staticmethod
+    def current_version(connection: sqlite3.Connection) -> int:
+        """Версия схемы БД (0 - миграции не применялись)"""
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        row = connection.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return row[0] or 0
+
+    def migrate(self, connection: sqlite3.Connection, target: Optional[int] = None) -> List[int]:
+        """
+        Доводит схему до версии target
+
+        Соединение должно быть в режиме ручного управления транзакциями
+        (isolation_level = None).
+
+        Args:
+            connection: Соединение с БД
+            target: Нужная версия (None - последняя)
+
+        Returns:
+            Номера примененных миграций
+
+        DatabaseError: Если БД новее кода или миграция завершилась ошибкой
+        """
+        target = self.latest_version if target is None else target
+        current = self.current_version(connection)
+        if current > self.latest_version:
+            raise DatabaseError(
+                f"Версия схемы БД {current} новее известной приложению {self.latest_version}"
+            )
+
+        applied = []
+        for migration in self.__migrations[current:target]:
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                for statement in migration.statements:
+                    connection.execute(statement)
+                if migration.apply is not None:
+                    migration.apply(connection)
+                connection.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (migration.version, migration.description)
+                )
+                connection.execute("COMMIT")
+            except BaseException as e:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                if isinstance(e, sqlite3.Error):
+                    raise DatabaseError(
+                        f"Ошибка миграции {migration.version} ({migration.description}): {e}"
+                    )
+                raise
+            applied.append(migration.version)
+        return applied
@@ -0,0 +1,460 @@
+import json
+import re
+import sqlite3
+from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Iterator, Union, Callable, NamedTuple
+from core_OOP.Abctract_emp import AbstractEmployee
+from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+from core_OOP.Project import Project
+from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError, InvalidDataError, ProjectNotFoundError
+from data_base.connection import DatabaseConnection
+
+
+class PayrollRow(NamedTuple):
+    """Фонд оплаты труда группы сотрудников"""
+    department: str
+    employee_type: str
+    employees: int
+    total: float
+
+
+class EmployeeRow(NamedTuple):
+    """Строка таблицы employees без создания объекта сотрудника"""
+    id: int
+    name: str
+    department: str
+    base_salary: float
+    employee_type: str
+    bonus: Optional[float]
+    # JSON-текст, как хранится в БД
+    tech_stack: Optional[str]
+    seniority_level: Optional[str]
+    commission_rate: Optional[float]
+    sales_volume: Optional[float]
+
+
+class EmployeeRepository:
+    """
+    Репозиторий сотрудников над DatabaseConnection
+
+    Объекты строятся прямо из sqlite3.Row маппером своего класса, без
+    промежуточных словарей. Тексты запросов - константы: модуль sqlite3
+    кэширует подготовленные операторы соединения по тексту SQL, поэтому
+    повторные вызовы не компилируют запрос заново. Чтение идет через
+    соединение текущего потока, запись - через поток-писатель.
+    """
+
+    COLUMNS = ("id, name, department, base_salary, employee_type, bonus, "
+               "tech_stack, seniority_level, commission_rate, sales_volume")
+
+    GET_SQL = f"SELECT {COLUMNS} FROM employees WHERE id = ?"
+    # один текст запроса для любого числа ID - список передается JSON-массивом
+    GET_MANY_SQL = f"SELECT {COLUMNS} FROM employees WHERE id IN (SELECT value FROM json_each(?))"
+    BY_DEPARTMENT_SQL = f"SELECT {COLUMNS} FROM employees WHERE department = ? ORDER BY id"
+    BY_TYPE_SQL = f"SELECT {COLUMNS} FROM employees WHERE employee_type = ? ORDER BY id"
+    BY_TYPE_SALARY_SQL = (f"SELECT {COLUMNS} FROM employees "
+                          f"WHERE employee_type = ? AND base_salary BETWEEN ? AND ? ORDER BY base_salary")
+
+    # сотрудники, у которых есть хотя бы ? навыков из JSON-списка: для "всех
+    # навыков" передается длина списка, для "любого" - 1
+    BY_SKILLS_SQL = (f"SELECT {COLUMNS} FROM employees WHERE id IN ("
+                     f"SELECT employee_skills.employee_id FROM employee_skills "
+                     f"JOIN skills ON skills.id = employee_skills.skill_id "
+                     f"WHERE skills.name IN (SELECT value FROM json_each(?)) "
+                     f"GROUP BY employee_skills.employee_id HAVING COUNT(*) >= ?) ORDER BY id")
+    SKILL_COUNTS_SQL = ("SELECT skills.name, COUNT(*) FROM employee_skills "
+                        "JOIN skills ON skills.id = employee_skills.skill_id "
+                        "GROUP BY skills.id ORDER BY COUNT(*) DESC, skills.name")
+
+    # колонки FTS-таблицы совпадают по имени с employees, поэтому с префиксом таблицы
+    SEARCH_SQL = (f"SELECT {', '.join('employees.' + column for column in COLUMNS.split(', '))} "
+                  f"FROM employees_fts JOIN employees ON employees.id = employees_fts.rowid "
+                  f"WHERE employees_fts MATCH ? ORDER BY employees_fts.rank LIMIT ?")
+
+    # страница потокового обхода: фильтры добавляет stream, курсор - последний ID
+    STREAM_SQL = f"SELECT {COLUMNS} FROM employees WHERE id > ?{{filters}} ORDER BY id LIMIT ?"
+
+    # те же формулы, что calculate_salary у Employee, Manager, Developer и Salesperson
+    SALARY_SQL = """
+        CASE employee_type
+            WHEN 'Manager' THEN base_salary + COALESCE(bonus, 0)
+            WHEN 'Developer' THEN base_salary * CASE seniority_level
+                WHEN 'senior' THEN 2.0
+                WHEN 'middle' THEN 1.5
+                ELSE 1.0
+            END
+            WHEN 'Salesperson' THEN base_salary + COALESCE(sales_volume, 0) * COALESCE(commission_rate, 0)
+            ELSE base_salary
+        END
+    """
+    PAYROLL_SQL = (f"SELECT department, employee_type, COUNT(*), TOTAL({SALARY_SQL}) FROM employees "
+                   f"GROUP BY department, employee_type ORDER BY department, employee_type")
+    TOTAL_PAYROLL_SQL = f"SELECT TOTAL({SALARY_SQL}) FROM employees"
+
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        """
+        Args:
+            db: Подключение к БД (по умолчанию - общий экземпляр DatabaseConnection)
+        """
+        self.__db = db if db is not None else DatabaseConnection.get_instance()
+        self.__mappers: Dict[str, Callable[[sqlite3.Row], AbstractEmployee]] = {
+            "Employee": self.__map_employee,
+            "Manager": self.__map_manager,
+            "Developer": self.__map_developer,
+            "Salesperson": self.__map_salesperson,
+        }
+
+    # мапперы строк; порядок колонок - COLUMNS
+    @staticmethod
+    def __map_employee(row: sqlite3.Row) -> Employee:
+        return Employee(row[0], row[1], row[2], row[3])
+
+    @staticmethod
+    def __map_manager(row: sqlite3.Row) -> Manager:
+        return Manager(row[0], row[1], row[2], row[3], row[5])
+
+    @staticmethod
+    def __map_developer(row: sqlite3.Row) -> Developer:
+        tech_stack = json.loads(row[6]) if row[6] is not None else []
+        return Developer(row[0], row[1], row[2], row[3], tech_stack, row[7] or "junior")
+
+    @staticmethod
+    def __map_salesperson(row: sqlite3.Row) -> Salesperson:
+        return Salesperson(row[0], row[1], row[2], row[3], row[8],
+                           row[9] if row[9] is not None else 0.0)
+
+    def __map(self, row: sqlite3.Row) -> AbstractEmployee:
+        """Строит сотрудника маппером его класса"""
+        mapper = self.__mappers.get(row[4])
+        if mapper is None:
+            raise InvalidDataError(
+                field="тип сотрудника",
+                value=row[4],
+                expected=f"один из: {', '.join(self.__mappers)}"
+            )
+        return mapper(row)
+
+    def map_row(self, row: sqlite3.Row) -> AbstractEmployee:
+        """
+        Сотрудник из строки employees, выбранной в порядке COLUMNS
+
+        InvalidDataError: Если тип сотрудника неизвестен
+        """
+        return self.__map(row)
+
+    def __execute(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        try:
+            return self.__db.get_connection().execute(sql, params)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при чтении сотрудников: {e}")
+
+    # чтение
+    def get(self, employee_id: int) -> AbstractEmployee:
+        """
+        Сотрудник по ID
+
+        EmployeeNotFoundError: Если сотрудника нет в БД
+        """
+        row = self.__execute(self.GET_SQL, (employee_id,)).fetchone()
+        if row is None:
+            raise EmployeeNotFoundError(employee_id)
+        return self.__map(row)
+
+    def get_many(self, employee_ids: Iterable[int]) -> Dict[int, AbstractEmployee]:
+        """
+        Пакетный поиск одним запросом
+
+        Returns:
+            Словарь {ID: сотрудник}; отсутствующие в БД ID пропускаются
+        """
+        ids = json.dumps(list(employee_ids))
+        return {row[0]: self.__map(row) for row in self.__execute(self.GET_MANY_SQL, (ids,))}
+
+    def find_by_department(self, department_name: str) -> List[AbstractEmployee]:
+        """Сотрудники отдела в порядке ID"""
+        return [self.__map(row) for row in self.__execute(self.BY_DEPARTMENT_SQL, (department_name,))]
+
+    def iter_by_type(self, employee_type: Union[type, str], batch_size: int = 1000) -> Iterator[AbstractEmployee]:
+        """
+        Ленивый обход сотрудников одного класса в порядке ID
+
+        Args:
+            employee_type: Класс сотрудника или его имя, например "Developer"
+            batch_size: Сколько строк читать из БД за раз
+        """
+        type_name = employee_type.__name__ if isinstance(employee_type, type) else employee_type
+        cursor = self.__execute(self.BY_TYPE_SQL, (type_name,))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self.__map(row)
+
+    def stream(self, department: Optional[str] = None, employee_type: Union[type, str, None] = None,
+               min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+               batch_size: int = 1000, rows: bool = False) -> Iterator[Union[AbstractEmployee, EmployeeRow]]:
+        """
+        Потоковый обход таблицы employees в порядке ID с постоянным расходом памяти
+
+        Каждая страница - отдельный запрос "id > последний ID ... LIMIT
+        batch_size" (keyset-пагинация): в памяти не больше одной страницы,
+        транзакция чтения не держится между страницами, и каждая страница
+        начинается с поиска по первичному ключу, а не с пропуска OFFSET строк.
+        Строки, добавленные во время обхода с ID больше текущего, попадут
+        в обход.
+
+        Args:
+            department: Только сотрудники отдела
+            employee_type: Класс сотрудника или его имя
+            min_salary: Нижняя граница базовой зарплаты (включительно)
+            max_salary: Верхняя граница базовой зарплаты (включительно)
+            batch_size: Строк в одной странице
+            rows: Выдавать EmployeeRow вместо объектов сотрудников
+
+        InvalidDataError: Если batch_size не положительный
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise InvalidDataError(
+                field="batch_size",
+                value=batch_size,
+                expected="положительное целое число"
+            )
+        filters, params = [], []
+        if department is not None:
+            filters.append(" AND department = ?")
+            params.append(department)
+        if employee_type is not None:
+            filters.append(" AND employee_type = ?")
+            params.append(employee_type.__name__ if isinstance(employee_type, type) else employee_type)
+        if min_salary is not None:
+            filters.append(" AND base_salary >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            filters.append(" AND base_salary <= ?")
+            params.append(max_salary)
+        sql = self.STREAM_SQL.format(filters="".join(filters))
+        convert = EmployeeRow._make if rows else self.__map
+
+        # ID сотрудников положительные
+        last_id = 0
+        while True:
+            page = self.__execute(sql, (last_id, *params, batch_size)).fetchall()
+            for row in page:
+                yield convert(row)
+            if len(page) < batch_size:
+                return
+            last_id = page[-1][0]
+
+    def find_by_skills(self, skills: Iterable[str], match_all: bool = True) -> List[AbstractEmployee]:
+        """
+        Сотрудники с навыками из tech_stack, в порядке ID
+
+        Запрос идет по индексированной таблице employee_skills, которую
+        триггеры БД поддерживают при каждой записи сотрудника.
+
+        Args:
+            skills: Названия навыков (с учетом регистра)
+            match_all: True - нужны все навыки, False - хотя бы один
+        """
+        names = sorted(set(skills))
+        if not names:
+            return []
+        params = (json.dumps(names), len(names) if match_all else 1)
+        return [self.__map(row) for row in self.__execute(self.BY_SKILLS_SQL, params)]
+
+    def skill_counts(self) -> List[tuple]:
+        """Пары (навык, число сотрудников), от самых распространенных"""
+        return [tuple(row) for row in self.__execute(self.SKILL_COUNTS_SQL, ())]
+
+    def search_by_name(self, query: str, limit: int = 50, prefix: bool = True) -> List[AbstractEmployee]:
+        """
+        Полнотекстовый поиск по имени (FTS5), от лучшего совпадения
+
+        Запрос делится на слова; подходят сотрудники, в имени которых есть
+        все слова (без учета регистра, в том числе кириллицы). Специальный
+        синтаксис FTS5 в запросе не действует - слова ищутся как есть.
+
+        Args:
+            query: Слова или их начала, например "алекс пет"
+            limit: Максимум результатов
+            prefix: True - слово запроса может быть началом слова имени
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+        suffix = "*" if prefix else ""
+        match = " ".join(f'"{word}"{suffix}' for word in words)
+        return [self.__map(row) for row in self.__execute(self.SEARCH_SQL, (match, limit))]
+
+    def find_by_salary_range(self, employee_type: Union[type, str], min_salary: float,
+                             max_salary: float) -> List[AbstractEmployee]:
+        """Сотрудники одного класса с базовой зарплатой в диапазоне, по возрастанию зарплаты"""
+        type_name = employee_type.__name__ if isinstance(employee_type, type) else employee_type
+        cursor = self.__execute(self.BY_TYPE_SALARY_SQL, (type_name, min_salary, max_salary))
+        return [self.__map(row) for row in cursor]
+
+    # фонд оплаты труда считается в SQLite, объекты сотрудников не создаются
+    def payroll_by_department(self) -> List[PayrollRow]:
+        """Фонд оплаты труда по отделам и типам сотрудников"""
+        return [PayrollRow(*row) for row in self.__execute(self.PAYROLL_SQL, ())]
+
+    def total_payroll(self) -> float:
+        """
+        Общий фонд оплаты труда
+
+        Зарплата каждого сотрудника считается в SQL так же, как в его
+        calculate_salary, и совпадает с ней точно. Итог может отличаться от
+        Company.calculate_total_monthly_cost в последних разрядах: SQLite
+        складывает строки в порядке ID, а компания - по отделам, и сумма
+        float зависит от порядка сложения.
+        """
+        return self.__execute(self.TOTAL_PAYROLL_SQL, ()).fetchone()[0]
+
+    # запись
+    def save(self, employee: AbstractEmployee) -> None:
+        """Сохраняет (вставляет или обновляет) сотрудника"""
+        self.__db.save_employee(employee)
+
+    def save_many(self, employees: Iterable[AbstractEmployee]) -> int:
+        """Пакетное сохранение, возвращает количество сохраненных сотрудников"""
+        return self.__db.save_employees(employees)
+
+
+class ProjectRepository:
+    """
+    Репозиторий проектов и их команд над DatabaseConnection
+
+    Вопросы о составе команд ("в каких проектах сотрудник") решаются
+    запросами к project_members, без загрузки всех проектов.
+    """
+
+    UPSERT_SQL = """
+        INSERT INTO projects (id, name, description, deadline, status)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            description = excluded.description,
+            deadline = excluded.deadline,
+            status = excluded.status
+    """
+    CLEAR_TEAM_SQL = "DELETE FROM project_members WHERE project_id = ?"
+    ADD_MEMBER_SQL = "INSERT INTO project_members (project_id, employee_id) VALUES (?, ?)"
+    DELETE_SQL = "DELETE FROM projects WHERE id = ?"
+
+    PROJECT_COLUMNS = "id, name, description, deadline, status"
+    GET_SQL = f"SELECT {PROJECT_COLUMNS} FROM projects WHERE id = ?"
+    BY_STATUS_SQL = f"SELECT {PROJECT_COLUMNS} FROM projects WHERE status = ? ORDER BY id"
+    BY_EMPLOYEE_SQL = (f"SELECT {PROJECT_COLUMNS} FROM projects "
+                       f"WHERE id IN (SELECT project_id FROM project_members WHERE employee_id = ?) "
+                       f"ORDER BY id")
+    TEAM_IDS_SQL = "SELECT employee_id FROM project_members WHERE project_id = ? ORDER BY employee_id"
+    TEAMS_SQL = ("SELECT project_id, employee_id FROM project_members "
+                 "WHERE project_id IN (SELECT value FROM json_each(?))")
+    EMPLOYEE_PROJECT_IDS_SQL = "SELECT project_id FROM project_members WHERE employee_id = ? ORDER BY project_id"
+    IS_MEMBER_SQL = "SELECT 1 FROM project_members WHERE employee_id = ? LIMIT 1"
+
+    def __init__(self, db: Optional[DatabaseConnection] = None,
+                 employees: Optional[EmployeeRepository] = None):
+        """
+        Args:
+            db: Подключение к БД (по умолчанию - общий экземпляр DatabaseConnection)
+            employees: Репозиторий для загрузки участников команд
+        """
+        self.__db = db if db is not None else DatabaseConnection.get_instance()
+        self.__employees = employees if employees is not None else EmployeeRepository(self.__db)
+
+    def __execute(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        try:
+            return self.__db.get_connection().execute(sql, params)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при чтении проектов: {e}")
+
+    # запись
+    def save(self, project: Project) -> None:
+        """Сохраняет проект вместе со статусом, сроком и командой"""
+        self.save_many([project])
+
+    def save_many(self, projects: Iterable[Project]) -> int:
+        """
+        Пакетное сохранение проектов одной транзакцией
+
+        Команда каждого проекта заменяется целиком. Участники должны быть
+        уже сохранены в таблице employees.
+
+        Returns:
+            Количество сохраненных проектов
+
+        DatabaseError: Если участник отсутствует в БД (изменения не применяются)
+        """
+        rows, team_rows = [], []
+        for project in projects:
+            rows.append((project.project_id, project.name, project.description,
+                         project.deadline.isoformat(), project.status))
+            team_rows.extend((project.project_id, employee_id)
+                             for employee_id in project.get_team_member_ids())
+
+        def write(conn: sqlite3.Connection) -> int:
+            conn.executemany(self.UPSERT_SQL, rows)
+            conn.executemany(self.CLEAR_TEAM_SQL, ((row[0],) for row in rows))
+            conn.executemany(self.ADD_MEMBER_SQL, team_rows)
+            return len(rows)
+
+        return self.__db.submit_write(write).result()
+
+    def delete(self, project_id: int) -> None:
+        """Удаляет проект (участники удаляются каскадно)"""
+        self.__db.execute_write(self.DELETE_SQL, (project_id,))
+
+    # чтение
+    def get(self, project_id: int) -> Project:
+        """
+        Проект по ID вместе с командой
+
+        ProjectNotFoundError: Если проекта нет в БД
+        """
+        projects = self.__load(self.__execute(self.GET_SQL, (project_id,)).fetchall())
+        if not projects:
+            raise ProjectNotFoundError(project_id)
+        return projects[0]
+
+    def find_by_status(self, status: str) -> List[Project]:
+        """Проекты с указанным статусом вместе с командами"""
+        return self.__load(self.__execute(self.BY_STATUS_SQL, (status,)).fetchall())
+
+    def find_by_employee(self, employee_id: int) -> List[Project]:
+        """Проекты, в которых участвует сотрудник, вместе с командами"""
+        return self.__load(self.__execute(self.BY_EMPLOYEE_SQL, (employee_id,)).fetchall())
+
+    def get_team_ids(self, project_id: int) -> List[int]:
+        """ID участников проекта"""
+        return [row[0] for row in self.__execute(self.TEAM_IDS_SQL, (project_id,))]
+
+    def get_employee_project_ids(self, employee_id: int) -> List[int]:
+        """ID проектов сотрудника"""
+        return [row[0] for row in self.__execute(self.EMPLOYEE_PROJECT_IDS_SQL, (employee_id,))]
+
+    def is_employee_in_projects(self, employee_id: int) -> bool:
+        """Участвует ли сотрудник хотя бы в одном проекте"""
+        return self.__execute(self.IS_MEMBER_SQL, (employee_id,)).fetchone() is not None
+
+    def __load(self, rows: List[sqlite3.Row]) -> List[Project]:
+        """Строит проекты: команды всех проектов читаются двумя запросами"""
+        if not rows:
+            return []
+        teams: Dict[int, List[int]] = {row[0]: [] for row in rows}
+        for project_id, employee_id in self.__execute(self.TEAMS_SQL, (json.dumps(list(teams)),)):
+            teams[project_id].append(employee_id)
+        members = self.__employees.get_many(
+            employee_id for team in teams.values() for employee_id in team
+        )
+
+        projects = []
+        for project_id, name, description, deadline, status in rows:
+            # команда набирается до установки статуса: в завершенный проект добавить нельзя
+            project = Project(project_id, name, description, datetime.fromisoformat(deadline))
+            for employee_id in sorted(teams[project_id]):
+                project.add_team_member(members[employee_id])
+            project.change_status(status)
+            projects.append(project)
+        return projects
@@ -0,0 +1,452 @@
+import json
+import os
+import sqlite3
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterable, Union, Callable, Any
+from core_OOP.Abctract_emp import AbstractEmployee
+from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError, InvalidDataError
+from data_base.connection import DatabaseConnection, StorageProfile
+from data_base.repository import EmployeeRepository, PayrollRow
+
+
+class ShardConnection(DatabaseConnection):
+    """
+    Подключение к одному шарду: DatabaseConnection без Singleton
+
+    У каждого шарда свой поток-писатель и свои соединения читателей,
+    поэтому записи в разные шарды идут параллельно.
+    """
+
+    def __new__(cls):
+        instance = object.__new__(cls)
+        instance._initialized = False
+        return instance
+
+    def reset_instance(self) -> None:
+        """Закрывает шард (общий экземпляр DatabaseConnection не трогается)"""
+        self.close_connection()
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Согласованное хеширование (jump consistent hash, Lamping & Veach)
+
+    При переходе от n к n + 1 шардам меняет шард только ~1/(n + 1) ключей.
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class ShardedStorage:
+    """
+    Сотрудники, распределенные по нескольким файлам SQLite
+
+    Шард выбирается по ID сотрудника или по отделу (все сотрудники отдела
+    в одном файле) через jump_hash. Параметры хранятся в shards.json в
+    каталоге шардов. Поиск по ключу идет в один шард, остальные запросы -
+    параллельно во все шарды с объединением результатов; общий фонд оплаты
+    труда считается одним запросом через ATTACH.
+
+    В шардах хранятся только сотрудники (проекты и навыки - в основной БД).
+    """
+
+    KEYS = ("id", "department")
+    MANIFEST = "shards.json"
+    # SQLITE_MAX_ATTACHED по умолчанию
+    MAX_ATTACHED = 10
+    DELETE_SQL = "DELETE FROM employees WHERE id = ?"
+    # какие из переданных JSON-массивом ID есть в шарде
+    LOCATE_SQL = "SELECT id FROM employees WHERE id IN (SELECT value FROM json_each(?))"
+
+    def __init__(self, directory: str, shards: Optional[int] = None, key: str = "id",
+                 profile: Union[str, StorageProfile] = "balanced"):
+        """
+        Args:
+            directory: Каталог файлов шардов (создается при необходимости)
+            shards: Число шардов для нового каталога (None - 4 или из shards.json)
+            key: "id" или "department" - по чему распределяются сотрудники
+            profile: Профиль хранения каждого шарда
+
+        InvalidDataError: Если параметры не совпадают с уже созданным каталогом
+        """
+        if key not in self.KEYS:
+            raise InvalidDataError(
+                field="key",
+                value=key,
+                expected=f"один из: {', '.join(self.KEYS)}"
+            )
+        if shards is not None and (not isinstance(shards, int) or shards <= 0):
+            raise InvalidDataError(
+                field="shards",
+                value=shards,
+                expected="положительное целое число"
+            )
+
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__profile = profile
+        manifest = self.__read_manifest()
+        if manifest is None:
+            manifest = {"key": key, "shards": shards or 4}
+            self.__write_manifest(manifest)
+        elif manifest["key"] != key or (shards is not None and manifest["shards"] != shards):
+            raise InvalidDataError(
+                field="shards",
+                value=f"key={key}, shards={shards}",
+                expected=f"key={manifest['key']}, shards={manifest['shards']} (как в {self.MANIFEST}; "
+                         f"число шардов меняет rebalance)"
+            )
+        self.__key = manifest["key"]
+        self.__shards: List[ShardConnection] = [self.__open(index) for index in range(manifest["shards"])]
+        self.__executor = ThreadPoolExecutor(max_workers=len(self.__shards), thread_name_prefix="shard")
+
+    @property
+    def shard_count(self) -> int:
+        """Количество шардов"""
+        return len(self.__shards)
+
+    @property
+    def key(self) -> str:
+        """Ключ распределения: "id" или "department" """
+        return self.__key
+
+    # служебные методы
+    def __path(self, index: int) -> str:
+        return os.path.join(self.__directory, f"shard-{index:03d}.db")
+
+    def __open(self, index: int) -> ShardConnection:
+        shard = ShardConnection()
+        shard.configure(self.__path(index), profile=self.__profile)
+        return shard
+
+    def __read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.__directory, self.MANIFEST), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def __write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Записывает параметры атомарно: при сбое остается старый или новый файл"""
+        path = os.path.join(self.__directory, self.MANIFEST)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+
+    def __shard_index(self, employee_id: int, department: str, shards: int) -> int:
+        """Номер шарда для сотрудника при заданном числе шардов"""
+        if self.__key == "id":
+            return jump_hash(employee_id, shards)
+        # crc32 не зависит от запуска, в отличие от hash() для строк
+        return jump_hash(zlib.crc32(department.encode("utf-8")), shards)
+
+    def __fan_out(self, func: Callable[[ShardConnection], Any]) -> List[Any]:
+        """Выполняет func для каждого шарда параллельно, результаты - в порядке шардов"""
+        return list(self.__executor.map(func, self.__shards))
+
+    def shard_for(self, employee_id: int, department: Optional[str] = None) -> Optional[int]:
+        """
+        Номер шарда сотрудника или None, если без отдела его не определить
+
+        Args:
+            employee_id: ID сотрудника
+            department: Отдел (нужен при key="department")
+        """
+        if self.__key == "department" and department is None:
+            return None
+        return self.__shard_index(employee_id, department, len(self.__shards))
+
+    # запись
+    def save_employee(self, employee) -> None:
+        """Сохраняет сотрудника (объект или словарь) в его шард"""
+        self.save_employees([employee])
+
+    def save_employees(self, employees: Iterable, batch_size: int = 10_000) -> int:
+        """
+        Пакетное сохранение: строки раскладываются по шардам и пишутся параллельно
+
+        При key="department" сотрудник, сменивший отдел, удаляется из
+        шарда прежнего отдела в той же пачке; остальные шарды не пишутся.
+
+        Returns:
+            Количество сохраненных сотрудников
+        """
+        if batch_size <= 0:
+            raise InvalidDataError(
+                field="batch_size",
+                value=batch_size,
+                expected="положительное целое число"
+            )
+        total = 0
+        pending: List[Future] = []
+        batch = []
+        for employee in employees:
+            batch.append(DatabaseConnection.employee_row(employee))
+            if len(batch) >= batch_size:
+                # пока шарды пишут предыдущую пачку, готовится следующая
+                total += sum(future.result() for future in pending)
+                pending = self.__submit_rows(batch)
+                batch = []
+        total += sum(future.result() for future in pending)
+        if batch:
+            total += sum(future.result() for future in self.__submit_rows(batch))
+        return total
+
+    def __submit_rows(self, rows: List[tuple]) -> List[Future]:
+        """Ставит строки employees в очереди записи их шардов, писатели шардов работают одновременно"""
+        by_shard: List[List[tuple]] = [[] for _ in self.__shards]
+        for row in rows:
+            by_shard[self.__shard_index(row[0], row[2], len(self.__shards))].append(row)
+        stale = self.__locate_stale(by_shard) if self.__key == "department" else None
+
+        futures = []
+        for index, shard in enumerate(self.__shards):
+            upserts = by_shard[index]
+            stale_ids = stale[index] if stale is not None else []
+            if not upserts and not stale_ids:
+                continue
+
+            def write(conn: sqlite3.Connection, upserts=upserts, stale_ids=stale_ids) -> int:
+                conn.executemany(self.DELETE_SQL, stale_ids)
+                return DatabaseConnection.upsert_employees(conn, upserts)
+
+            futures.append(shard.submit_write(write))
+        return futures
+
+    def __locate_stale(self, by_shard: List[List[tuple]]) -> List[List[tuple]]:
+        """
+        Для каждого шарда - ID сотрудников пачки, которые лежат в нем, но
+        по новому отделу относятся к другому шарду
+
+        Поиск - параллельные чтения по первичному ключу, поэтому пачка без
+        смены отделов пишет только в свои шарды.
+        """
+        def locate(index: int) -> List[tuple]:
+            moved_in = [row[0] for other, shard_rows in enumerate(by_shard) if other != index
+                        for row in shard_rows]
+            if not moved_in:
+                return []
+            try:
+                cursor = self.__shards[index].get_connection().execute(
+                    self.LOCATE_SQL, (json.dumps(moved_in),))
+                return [(row[0],) for row in cursor]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Ошибка БД при поиске сотрудников в шарде {index}: {e}")
+
+        return list(self.__executor.map(locate, range(len(self.__shards))))
+
+    def delete_employee(self, employee_id: int, department: Optional[str] = None) -> bool:
+        """
+        Удаляет сотрудника
+
+        Returns:
+            True, если сотрудник был найден
+        """
+        index = self.shard_for(employee_id, department)
+        shards = self.__shards if index is None else [self.__shards[index]]
+        return sum(shard.execute_write(self.DELETE_SQL, (employee_id,)) for shard in shards) > 0
+
+    # чтение
+    def get_employee(self, employee_id: int, department: Optional[str] = None) -> AbstractEmployee:
+        """
+        Сотрудник по ID
+
+        При key="id" (или известном отделе при key="department") читается
+        один шард, иначе - все параллельно.
+
+        EmployeeNotFoundError: Если сотрудника нет ни в одном шарде
+        """
+        index = self.shard_for(employee_id, department)
+        if index is not None:
+            return EmployeeRepository(self.__shards[index]).get(employee_id)
+
+        def lookup(shard: ShardConnection) -> Optional[AbstractEmployee]:
+            return EmployeeRepository(shard).get_many([employee_id]).get(employee_id)
+
+        for employee in self.__fan_out(lookup):
+            if employee is not None:
+                return employee
+        raise EmployeeNotFoundError(employee_id)
+
+    def load_employees(self, department: Optional[str] = None,
+                       employee_type: Optional[str] = None) -> List[AbstractEmployee]:
+        """
+        Сотрудники всех шардов в порядке ID
+
+        При key="department" и заданном отделе читается один шард.
+        """
+        if self.__key == "department" and department is not None:
+            index = self.__shard_index(0, department, len(self.__shards))
+            return self.__shards[index].load_employees(department, employee_type)
+        parts = self.__fan_out(lambda shard: shard.load_employees(department, employee_type))
+        return sorted((employee for part in parts for employee in part), key=lambda employee: employee.id)
+
+    def count(self) -> int:
+        """Количество сотрудников во всех шардах"""
+        return sum(self.__fan_out(
+            lambda shard: shard.get_connection().execute("SELECT COUNT(*) FROM employees").fetchone()[0]))
+
+    def shard_sizes(self) -> List[int]:
+        """Количество сотрудников в каждом шарде"""
+        return [shard.get_connection().execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+                for shard in self.__shards]
+
+    def payroll_by_department(self) -> List[PayrollRow]:
+        """Фонд оплаты труда по отделам и типам, собранный со всех шардов"""
+        merged: Dict[tuple, List] = {}
+        for part in self.__fan_out(lambda shard: EmployeeRepository(shard).payroll_by_department()):
+            for row in part:
+                totals = merged.setdefault((row.department, row.employee_type), [0, 0.0])
+                totals[0] += row.employees
+                totals[1] += row.total
+        return [PayrollRow(department, employee_type, employees, total)
+                for (department, employee_type), (employees, total) in sorted(merged.items())]
+
+    def total_payroll(self) -> float:
+        """
+        Общий фонд оплаты труда
+
+        Один запрос по всем шардам, подключенным через ATTACH; если шардов
+        больше, чем SQLite позволяет подключить, - сумма параллельных
+        запросов к шардам.
+        """
+        if len(self.__shards) - 1 > self.MAX_ATTACHED:
+            return sum(self.__fan_out(lambda shard: EmployeeRepository(shard).total_payroll()))
+
+        connection = sqlite3.connect(self.__path(0))
+        try:
+            connection.execute("PRAGMA query_only = ON")
+            for index in range(1, len(self.__shards)):
+                connection.execute(f"ATTACH DATABASE ? AS shard{index}", (self.__path(index),))
+            schemas = ["main"] + [f"shard{index}" for index in range(1, len(self.__shards))]
+            union = " UNION ALL ".join(
+                f"SELECT {EmployeeRepository.SALARY_SQL} AS salary FROM {schema}.employees"
+                for schema in schemas)
+            return connection.execute(f"SELECT TOTAL(salary) FROM ({union})").fetchone()[0]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Ошибка БД при расчете фонда оплаты труда по шардам: {e}")
+        finally:
+            connection.close()
+
+    # перераспределение
+    def rebalance(self, shards: int, batch_size: int = 5_000) -> int:
+        """
+        Меняет число шардов и переносит сотрудников, у которых сменился шард
+
+        Перенос идет в три этапа: строки копируются в новые шарды (старые
+        копии остаются на месте), затем shards.json переключается на новую
+        раскладку и только после этого копии удаляются из прежних шардов.
+        Если перераспределение прервано до записи shards.json, все строки
+        доступны по старой раскладке; если после - по новой, а лишние копии
+        удалит повторный вызов rebalance с тем же числом шардов. Во время
+        перераспределения не должно быть записей.
+
+        Args:
+            shards: Новое число шардов
+            batch_size: Строк в одной транзакции переноса
+
+        Returns:
+            Количество скопированных в другой шард сотрудников
+        """
+        if not isinstance(shards, int) or shards <= 0:
+            raise InvalidDataError(
+                field="shards",
+                value=shards,
+                expected="положительное целое число"
+            )
+        old_count = len(self.__shards)
+        added = [self.__open(index) for index in range(old_count, shards)]
+        targets = self.__shards + added
+        try:
+            # по текущей раскладке в новых файлах ничего нет; там могут быть
+            # только копии прерванного перераспределения, возможно устаревшие
+            for shard in added:
+                shard.execute_write("DELETE FROM employees")
+            moved = sum(self.__copy(index, source, targets, shards, batch_size)
+                        for index, source in enumerate(self.__shards))
+            self.__write_manifest({"key": self.__key, "shards": shards})
+        except BaseException:
+            for shard in added:
+                shard.close_connection()
+            raise
+
+        for shard in targets[shards:]:
+            shard.close_connection()
+        self.__executor.shutdown()
+        self.__shards = targets[:shards]
+        self.__executor = ThreadPoolExecutor(max_workers=shards, thread_name_prefix="shard")
+        self.__remove_files_from(shards)
+        self.__fan_out_indexed(lambda index, shard: self.__drop_foreign(index, shard, batch_size))
+        return moved
+
+    def __copy(self, index: int, source: ShardConnection, targets: List[ShardConnection],
+               shards: int, batch_size: int) -> int:
+        """Копирует строки шарда index, которые по новой раскладке относятся к другим шардам"""
+        batch: Dict[int, List[tuple]] = {}
+        pending = copied = 0
+        for row in EmployeeRepository(source).stream(batch_size=batch_size, rows=True):
+            target = self.__shard_index(row.id, row.department, shards)
+            if target != index:
+                batch.setdefault(target, []).append(tuple(row))
+                pending += 1
+                if pending >= batch_size:
+                    copied += self.__upsert(targets, batch)
+                    batch, pending = {}, 0
+        if batch:
+            copied += self.__upsert(targets, batch)
+        return copied
+
+    @staticmethod
+    def __upsert(targets: List[ShardConnection], batch: Dict[int, List[tuple]]) -> int:
+        """Пишет строки в целевые шарды параллельно и ждет фиксации"""
+        futures = [targets[target].submit_write(
+            lambda conn, rows=rows: DatabaseConnection.upsert_employees(conn, rows))
+            for target, rows in batch.items()]
+        for future in futures:
+            future.result()
+        return sum(len(rows) for rows in batch.values())
+
+    def __drop_foreign(self, index: int, shard: ShardConnection, batch_size: int) -> None:
+        """Удаляет из шарда строки, которые по текущей раскладке лежат в другом шарде"""
+        foreign = []
+        for row in EmployeeRepository(shard).stream(batch_size=batch_size, rows=True):
+            if self.__shard_index(row.id, row.department, len(self.__shards)) != index:
+                foreign.append((row.id,))
+                if len(foreign) >= batch_size:
+                    shard.executemany_write(self.DELETE_SQL, foreign)
+                    foreign = []
+        if foreign:
+            shard.executemany_write(self.DELETE_SQL, foreign)
+
+    def __fan_out_indexed(self, func: Callable[[int, ShardConnection], Any]) -> List[Any]:
+        """Как __fan_out, но func получает и номер шарда"""
+        return list(self.__executor.map(func, range(len(self.__shards)), self.__shards))
+
+    def __remove_files_from(self, index: int) -> None:
+        """Удаляет файлы шардов с номерами от index, не входящие в раскладку"""
+        while any(os.path.exists(self.__path(index) + suffix) for suffix in ("", "-wal", "-shm")):
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(self.__path(index) + suffix):
+                    os.remove(self.__path(index) + suffix)
+            index += 1
+
+    # завершение работы
+    def close(self) -> None:
+        """Закрывает все шарды"""
+        self.__executor.shutdown()
+        for shard in self.__shards:
+            shard.close_connection()
+
+    def __enter__(self) -> 'ShardedStorage':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,276 @@
+import atexit
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Set, Tuple
+from core_OOP.Company import Company
+from core_OOP.ChangeFeed import ChangeFeed, ChangeEvent
+from core_OOP.exceptions import InvalidDataError, ProjectNotFoundError, DepartmentNotFoundError
+from data_base.connection import DatabaseConnection
+from data_base.repository import ProjectRepository
+
+
+class CompanySync:
+    """
+    Отложенная запись (write-behind) компании из памяти в SQLite
+
+    По ленте изменений отмечаются "грязные" сотрудники, отделы и проекты.
+    Фоновый поток раз в interval секунд (или сразу, когда набралось
+    batch_size записей) читает их текущее состояние из компании и пишет в
+    БД пачками по batch_size, каждая пачка - одна транзакция. Операции с
+    компанией не ждут диска. close() записывает все оставшееся; при
+    нормальном завершении процесса close вызывается автоматически.
+
+    Изменения, сделанные прямо через объекты сотрудников (бонус, навыки,
+    продажи), в ленту не попадают: при каждом сбросе такие сотрудники
+    находятся по версии объекта, отличной от последней записанной.
+    """
+
+    EMPLOYEE_DELETE_SQL = "DELETE FROM employees WHERE id = ?"
+    DEPARTMENT_UPSERT_SQL = "INSERT OR IGNORE INTO departments (name) VALUES (?)"
+    DEPARTMENT_DELETE_SQL = "DELETE FROM departments WHERE name = ?"
+
+    def __init__(self, company: Company, db: Optional[DatabaseConnection] = None,
+                 interval: float = 1.0, batch_size: int = 1000, full_sync: bool = True):
+        """
+        Args:
+            company: Компания (thread_safe=True - ее читает фоновый поток)
+            db: Подключение к БД (по умолчанию - общий экземпляр DatabaseConnection)
+            interval: Период записи в секундах
+            batch_size: Максимум сущностей в одной транзакции
+            full_sync: Сразу отметить всю компанию для записи
+        """
+        if not company.thread_safe:
+            raise InvalidDataError(
+                field="company",
+                value=company,
+                expected="компания с thread_safe=True"
+            )
+        if interval <= 0:
+            raise InvalidDataError(
+                field="interval",
+                value=interval,
+                expected="положительное число"
+            )
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise InvalidDataError(
+                field="batch_size",
+                value=batch_size,
+                expected="положительное целое число"
+            )
+
+        self.__company = company
+        self.__db = db if db is not None else DatabaseConnection.get_instance()
+        self.__interval = interval
+        self.__batch_size = batch_size
+
+        self.__employees: Set[int] = set()
+        self.__departments: Set[str] = set()
+        self.__projects: Set[int] = set()
+        self.__cond = threading.Condition()
+        # один сброс за раз: фоновый поток и явный flush не пересекаются
+        self.__flush_lock = threading.Lock()
+        self.__closed = False
+        self.__error: Optional[BaseException] = None
+        self.__flushed = 0
+        # ID сотрудника -> версия объекта, последней записанная в БД (меняется под __flush_lock)
+        self.__written: Dict[int, int] = {}
+
+        company.change_feed.subscribe(self.__on_event)
+        with company.transaction():
+            if full_sync:
+                with self.__cond:
+                    self.__departments.update(dept.name for dept in company.get_departments())
+                    self.__employees.update(employee.id for employee in company.iter_employees())
+                    self.__projects.update(project.project_id for project in company.get_projects())
+            else:
+                # без полной записи текущее состояние считается уже сохраненным
+                self.__written.update((employee.id, employee.version) for employee in company.iter_employees())
+
+        self.__thread = threading.Thread(target=self.__run, name="company-sync", daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Количество сущностей, ожидающих записи"""
+        with self.__cond:
+            return len(self.__employees) + len(self.__departments) + len(self.__projects)
+
+    @property
+    def last_error(self) -> Optional[BaseException]:
+        """Ошибка последней неудачной записи (None - последняя запись успешна)"""
+        return self.__error
+
+    @property
+    def flushed(self) -> int:
+        """Сколько сущностей записано в БД с момента создания"""
+        return self.__flushed
+
+    # отслеживание изменений
+    def __on_event(self, event: ChangeEvent) -> None:
+        """Отмечает измененные сущности (вызывается под блокировкой компании)"""
+        with self.__cond:
+            if event.type in (ChangeFeed.HIRED, ChangeFeed.REMOVED,
+                              ChangeFeed.TRANSFERRED, ChangeFeed.SALARY_CHANGED):
+                self.__employees.add(event.entity_id)
+            elif event.type in (ChangeFeed.TEAM_CHANGED, ChangeFeed.STATUS_CHANGED,
+                                ChangeFeed.PROJECT_ADDED, ChangeFeed.PROJECT_REMOVED):
+                self.__projects.add(event.entity_id)
+            elif event.type in (ChangeFeed.DEPARTMENT_ADDED, ChangeFeed.DEPARTMENT_REMOVED):
+                self.__departments.add(event.data['department'])
+            elif event.type == ChangeFeed.DEPARTMENT_RENAMED:
+                self.__departments.update((event.data['old_name'], event.data['new_name']))
+                # у сотрудников в БД хранится название отдела; если внутри
+                # транзакции отдел переименовали еще раз, сотрудников отметит
+                # следующее событие
+                try:
+                    department = self.__company.get_department(event.data['new_name'])
+                except DepartmentNotFoundError:
+                    department = None
+                if department is not None:
+                    self.__employees.update(department.get_employee_ids())
+            if self.pending >= self.__batch_size:
+                self.__cond.notify_all()
+
+    # запись
+    def __run(self) -> None:
+        """Фоновый поток: периодически записывает накопленные изменения"""
+        while True:
+            with self.__cond:
+                if not self.__closed and self.pending < self.__batch_size:
+                    self.__cond.wait(self.__interval)
+                if self.__closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # ошибка сохранена в __error, изменения останутся в очереди до следующей попытки
+                pass
+
+    def flush(self) -> int:
+        """
+        Записывает в БД все накопленные изменения
+
+        Returns:
+            Количество записанных сущностей
+
+        DatabaseError: Если запись не удалась (изменения остаются в очереди)
+        """
+        total = 0
+        with self.__flush_lock:
+            self.__mark_changed()
+            while True:
+                batch = self.__take_batch()
+                if batch is None:
+                    return total
+                try:
+                    total += self.__write(*batch)
+                except BaseException as e:
+                    with self.__cond:
+                        self.__employees.update(batch[0])
+                        self.__departments.update(batch[1])
+                        self.__projects.update(batch[2])
+                        self.__error = e
+                    raise
+                self.__error = None
+
+    def __mark_changed(self) -> None:
+        """Отмечает сотрудников, чья версия изменилась после последней записи"""
+        company = self.__company
+        with company.transaction():
+            changed = [employee.id for employee in company.iter_employees()
+                       if self.__written.get(employee.id) != employee.version]
+        if changed:
+            with self.__cond:
+                self.__employees.update(changed)
+
+    def __take_batch(self) -> Optional[Tuple[List[int], List[str], List[int]]]:
+        """Забирает из очереди до batch_size сущностей"""
+        with self.__cond:
+            if not self.pending:
+                return None
+            limit = self.__batch_size
+            departments = [self.__departments.pop() for _ in range(min(limit, len(self.__departments)))]
+            limit -= len(departments)
+            employees = [self.__employees.pop() for _ in range(min(limit, len(self.__employees)))]
+            limit -= len(employees)
+            projects = [self.__projects.pop() for _ in range(min(limit, len(self.__projects)))]
+            return employees, departments, projects
+
+    def __write(self, employee_ids: List[int], department_names: List[str], project_ids: List[int]) -> int:
+        """Читает текущее состояние сущностей и пишет его одной транзакцией"""
+        company = self.__company
+        # согласованный срез: на время чтения изменения компании приостановлены
+        with company.transaction():
+            department_names_now = {dept.name for dept in company.get_departments()}
+            departments_upsert = [(name,) for name in department_names if name in department_names_now]
+            departments_delete = [(name,) for name in department_names if name not in department_names_now]
+
+            projects_upsert, projects_delete, team_rows = [], [], []
+            for project_id in project_ids:
+                try:
+                    project = company.get_project(project_id)
+                except ProjectNotFoundError:
+                    projects_delete.append((project_id,))
+                    continue
+                projects_upsert.append((project.project_id, project.name, project.description,
+                                        project.deadline.isoformat(), project.status))
+                # уволенные с force сотрудники могут остаться в команде, но в БД их уже нет
+                team_rows.extend((project_id, employee_id) for employee_id in project.get_team_member_ids()
+                                 if company.find_employee_by_id(employee_id) is not None)
+
+            # участники команд из очереди пишутся в этой же транзакции - иначе
+            # строки project_members нарушили бы внешний ключ
+            with self.__cond:
+                members = [employee_id for _, employee_id in team_rows if employee_id in self.__employees]
+                self.__employees.difference_update(members)
+            employee_ids.extend(members)
+
+            employees_upsert, employees_delete = [], []
+            versions: Dict[int, int] = {}
+            for employee_id in employee_ids:
+                employee = company.find_employee_by_id(employee_id)
+                if employee is None:
+                    employees_delete.append((employee_id,))
+                    continue
+                versions[employee_id] = employee.version
+                data = employee.to_dict()
+                data['department'] = company.get_employee_department(employee_id).name
+                employees_upsert.append(DatabaseConnection.employee_row(data))
+
+        def write(conn: sqlite3.Connection) -> None:
+            conn.executemany(self.DEPARTMENT_UPSERT_SQL, departments_upsert)
+            DatabaseConnection.upsert_employees(conn, employees_upsert)
+            conn.executemany(ProjectRepository.UPSERT_SQL, projects_upsert)
+            conn.executemany(ProjectRepository.CLEAR_TEAM_SQL, ((row[0],) for row in projects_upsert))
+            conn.executemany(ProjectRepository.ADD_MEMBER_SQL, team_rows)
+            conn.executemany(ProjectRepository.DELETE_SQL, projects_delete)
+            conn.executemany(self.EMPLOYEE_DELETE_SQL, employees_delete)
+            conn.executemany(self.DEPARTMENT_DELETE_SQL, departments_delete)
+
+        self.__db.submit_write(write).result()
+        self.__written.update(versions)
+        for (employee_id,) in employees_delete:
+            self.__written.pop(employee_id, None)
+        count = len(employee_ids) + len(department_names) + len(project_ids)
+        self.__flushed += count
+        return count
+
+    # завершение работы
+    def close(self) -> None:
+        """Останавливает фоновый поток и записывает все оставшиеся изменения"""
+        with self.__cond:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__cond.notify_all()
+        self.__company.change_feed.unsubscribe(self.__on_event)
+        self.__thread.join()
+        atexit.unregister(self.close)
+        self.flush()
+
+    def __enter__(self) -> 'CompanySync':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
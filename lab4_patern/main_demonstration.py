@@ -372,18 +372,10 @@ def main():
             # 4 Сохраняем в БД через Singleton
             print("\n4. СОХРАНЕНИЕ через SINGLETON:")
             try:
-                from data_base.connection import save_employee
-
-                employee_data = {
-                    'id': new_employee.id,
-                    'name': new_employee.name,
-                    'department': new_employee.department,
-                    'base_salary': new_employee.base_salary,
-                    'employee_type': new_employee.__class__.__name__,
-                    'tech_stack': new_employee.tech_stack if hasattr(new_employee, 'tech_stack') else []
-                }
-
-                save_employee(employee_data)
+                from data_base.connection import DatabaseConnection
+
+                # сотрудники сохраняются одной пачкой в одной транзакции
+                DatabaseConnection.get_instance().save_employees([new_employee])
                 print(f"   Сотрудник сохранен в БД с ID: {new_employee.id}")
 
             except ImportError as e:
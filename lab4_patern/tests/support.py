@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+import unittest
+from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+from data_base.connection import DatabaseConnection
+
+
+def make_employee(emp_id: int, department: str = "IT"):
+    """Сотрудник одного из четырех классов в зависимости от ID"""
+    kind = emp_id % 4
+    if kind == 0:
+        return Employee(emp_id, f"Сотрудник {emp_id}", department, 1000 + emp_id)
+    if kind == 1:
+        return Manager(emp_id, f"Менеджер {emp_id}", department, 2000 + emp_id, 500)
+    if kind == 2:
+        return Developer(emp_id, f"Разработчик {emp_id}", department, 1500 + emp_id,
+                         ["python", "sql"], ("junior", "middle", "senior")[emp_id % 3])
+    return Salesperson(emp_id, f"Продавец {emp_id}", department, 1200 + emp_id, 0.1, 10_000)
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Каждый тест получает свежий DatabaseConnection с базой во временном каталоге"""
+
+    profile = "balanced"
+
+    def setUp(self):
+        DatabaseConnection._instance = None
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "company.db")
+        self.db = DatabaseConnection()
+        self.db.configure(self.db_path, profile=self.profile)
+
+    def tearDown(self):
+        self.db.reset_instance()
+        shutil.rmtree(self.directory, ignore_errors=True)
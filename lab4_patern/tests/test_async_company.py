@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+import unittest
+from core_OOP.AsyncCompany import AsyncCompany
+from core_OOP.Company import Company
+from tests.test_company import make_company
+
+
+class RecordingCompany(Company):
+    """Компания, которая запоминает потоки, обращавшиеся к ней"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def find_employee_by_id(self, employee_id):
+        self.threads.add(threading.current_thread().name)
+        return super().find_employee_by_id(employee_id)
+
+    def snapshot(self):
+        self.threads.add(threading.current_thread().name)
+        return super().snapshot()
+
+
+def slow_salary_changes(company: Company, delay: float) -> None:
+    """Замедляет update_salary: подписчик ленты вызывается внутри изменения"""
+    company.change_feed.subscribe(lambda event: time.sleep(delay))
+
+
+class AsyncCompanyTest(unittest.TestCase):
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_queries_and_mutations(self):
+        async def scenario():
+            async with AsyncCompany(make_company(thread_safe=True), workers=4) as service:
+                version = await service.update_salary(2, 950)
+                employee = await service.find_employee_by_id(2)
+                self.assertEqual((employee.base_salary, employee.version), (950, version))
+                await service.transfer_employee(2, "IT", "HR")
+                self.assertEqual(await service.calculate_department_salary("HR"), 1500 + 950)
+                self.assertEqual(await service.calculate_total_monthly_cost(), 1500 + 950 + 1500)
+        self.run_async(scenario())
+
+    def test_not_thread_safe_company_is_used_from_one_thread(self):
+        company = RecordingCompany("Test")
+        for department in make_company().get_departments():
+            company.add_department(department)
+
+        async def scenario():
+            async with AsyncCompany(company, workers=4) as service:
+                await service.find_employee_by_id(1)
+                await service.snapshot()
+        self.run_async(scenario())
+        self.assertEqual(len(company.threads), 1)
+        self.assertNotIn(threading.current_thread().name, company.threads)
+
+    def test_timeout_does_not_apply_to_mutations(self):
+        company = make_company(thread_safe=True)
+        slow_salary_changes(company, 0.2)
+
+        async def scenario():
+            async with AsyncCompany(company, timeout=0.05) as service:
+                return await service.update_salary(2, 950)
+        self.assertEqual(self.run_async(scenario()), company.find_employee_by_id(2).version)
+        self.assertEqual(company.find_employee_by_id(2).base_salary, 950)
+
+    def test_cancel_waits_for_started_mutation(self):
+        company = make_company(thread_safe=True)
+        slow_salary_changes(company, 0.2)
+
+        async def scenario():
+            async with AsyncCompany(company) as service:
+                task = asyncio.ensure_future(service.update_salary(2, 950))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                # отмена пришла только после того, как изменение применено
+                self.assertEqual(company.find_employee_by_id(2).base_salary, 950)
+        self.run_async(scenario())
+
+    def test_read_timeout(self):
+        company = make_company(thread_safe=True)
+        company.get_department("IT").calculate_total_salary = lambda: time.sleep(0.2)
+
+        async def scenario():
+            async with AsyncCompany(company, timeout=0.05) as service:
+                with self.assertRaises(asyncio.TimeoutError):
+                    await service.calculate_department_salary("IT")
+        self.run_async(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
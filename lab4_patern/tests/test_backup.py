@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import threading
+import unittest
+from data_base.backup import BackupManager
+from tests.support import DatabaseTestCase, make_employee
+
+
+class ReaderTest(DatabaseTestCase):
+    def test_path_and_reader(self):
+        self.assertEqual(self.db.path, self.db_path)
+        self.db.save_employees([make_employee(1)])
+        reader = self.db.open_reader()
+        try:
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM employees").fetchone()[0], 1)
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM employees")
+        finally:
+            reader.close()
+        self.db.close_connection()
+        self.assertIsNone(self.db.path)
+
+
+class BackupTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.backups = os.path.join(self.directory, "backups")
+        self.db.save_employees([make_employee(emp_id) for emp_id in range(1, 2001)])
+
+    def count(self, path: str) -> int:
+        connection = sqlite3.connect(path)
+        try:
+            return connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_backup_is_verified_copy(self):
+        steps = []
+        result = BackupManager(self.backups, db=self.db, pages=4, sleep=0).backup(progress=steps.append)
+        self.assertTrue(BackupManager.verify(result.path))
+        self.assertEqual(self.count(result.path), 2000)
+        self.assertEqual(result.size, os.path.getsize(result.path))
+        self.assertGreater(len(steps), 1)
+        self.assertEqual(steps[-1].pages_done, steps[-1].pages_total)
+        self.assertFalse(any(name.endswith(".partial") for name in os.listdir(self.backups)))
+
+    def test_rotation_keeps_newest(self):
+        manager = BackupManager(self.backups, db=self.db, keep=2)
+        paths = [manager.backup().path for _ in range(4)]
+        self.assertEqual(manager.list_backups(), paths[-2:])
+
+    def test_backup_during_writes(self):
+        stop = threading.Event()
+
+        def writer():
+            emp_id = 10_000
+            while not stop.is_set():
+                self.db.save_employees([make_employee(emp_id)])
+                emp_id += 1
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            result = BackupManager(self.backups, db=self.db, pages=2, sleep=0.001,
+                                   max_restarts=2).backup()
+        finally:
+            stop.set()
+            thread.join()
+        self.assertTrue(BackupManager.verify(result.path))
+        self.assertGreaterEqual(self.count(result.path), 2000)
+
+    def test_verify_rejects_damaged_files(self):
+        result = BackupManager(self.backups, db=self.db).backup()
+        self.assertFalse(BackupManager.verify(os.path.join(self.backups, "missing.db")))
+        with open(result.path, "r+b") as file:
+            file.seek(4096)
+            file.write(b"\xff" * 8192)
+        self.assertFalse(BackupManager.verify(result.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
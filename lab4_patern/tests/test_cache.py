@@ -0,0 +1,86 @@
+import time
+import unittest
+from core_OOP.exceptions import EmployeeNotFoundError, InvalidDataError
+from data_base.cache import EmployeeCache
+from data_base.repository import EmployeeRepository
+from tests.support import DatabaseTestCase, make_employee
+
+
+class EmployeeCacheTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db.save_employees(make_employee(emp_id) for emp_id in range(1, 6))
+        self.cache = EmployeeCache(self.db, max_size=3)
+
+    def tearDown(self):
+        self.cache.close()
+        super().tearDown()
+
+    def test_identity_and_hits(self):
+        first = self.cache.get(1)
+        self.assertIs(self.cache.get(1), first)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+        with self.assertRaises(EmployeeNotFoundError):
+            self.cache.get(99)
+
+    def test_loads_all_employee_classes(self):
+        for emp_id in range(1, 5):
+            expected = make_employee(emp_id)
+            loaded = self.cache.get(emp_id)
+            self.assertIs(type(loaded), type(expected))
+            self.assertEqual(loaded.to_dict(), expected.to_dict())
+
+    def test_write_invalidates(self):
+        employee = self.cache.get(1)
+        employee.base_salary = 7777
+        EmployeeRepository(self.db).save(employee)
+        # писатель удаляет ID из кэша до возврата из save
+        self.assertNotIn(1, self.cache)
+        reloaded = self.cache.get(1)
+        self.assertIsNot(reloaded, employee)
+        self.assertEqual(reloaded.base_salary, 7777)
+        self.assertEqual(self.cache.stats().invalidations, 1)
+
+        self.cache.get(2)
+        self.db.execute_write("DELETE FROM employees WHERE id = ?", (2,))
+        self.assertNotIn(2, self.cache)
+
+    def test_lru_eviction(self):
+        for emp_id in (1, 2, 3):
+            self.cache.get(emp_id)
+        self.cache.get(1)
+        self.cache.get(4)
+        # вытеснен давно не использованный 2, а не первый загруженный 1
+        self.assertNotIn(2, self.cache)
+        self.assertIn(1, self.cache)
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.stats().evictions, 1)
+
+    def test_ttl(self):
+        cache = EmployeeCache(self.db, ttl=0.05)
+        try:
+            first = cache.get(1)
+            time.sleep(0.1)
+            self.assertIsNot(cache.get(1), first)
+            self.assertEqual(cache.stats().expirations, 1)
+        finally:
+            cache.close()
+
+    def test_close_stops_invalidation(self):
+        self.cache.get(1)
+        self.cache.close()
+        self.assertEqual(len(self.cache), 0)
+        self.db.execute_write("DELETE FROM employees WHERE id = ?", (1,))
+        self.assertEqual(self.cache.stats().invalidations, 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(InvalidDataError):
+            EmployeeCache(self.db, max_size=0)
+        with self.assertRaises(InvalidDataError):
+            EmployeeCache(self.db, ttl=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from datetime import datetime
+from core_OOP.ChangeFeed import ChangeFeed
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee
+from core_OOP.Project import Project
+from core_OOP.exceptions import ChangeFeedGapError, InvalidDataError
+from tests.test_company import make_company
+
+
+class ChangeFeedTest(unittest.TestCase):
+    def test_sequence_and_read(self):
+        feed = ChangeFeed()
+        for emp_id in range(1, 6):
+            feed.publish(ChangeFeed.HIRED, emp_id, {})
+        self.assertEqual(feed.last_seq, 5)
+        self.assertEqual([event.entity_id for event in feed.read(2)], [3, 4, 5])
+        self.assertEqual([event.seq for event in feed.read(0, limit=2)], [1, 2])
+        self.assertEqual(feed.read(5), [])
+        with self.assertRaises(InvalidDataError):
+            feed.publish("fired", 1, {})
+
+    def test_subscribe_with_catch_up(self):
+        feed = ChangeFeed()
+        feed.publish(ChangeFeed.HIRED, 1, {})
+        feed.publish(ChangeFeed.HIRED, 2, {})
+        seen = []
+        feed.subscribe(lambda event: seen.append(event.seq), after_seq=1)
+        feed.publish(ChangeFeed.REMOVED, 2, {})
+        self.assertEqual(seen, [2, 3])
+
+    def test_retention_gap(self):
+        feed = ChangeFeed(retention=3)
+        for emp_id in range(1, 6):
+            feed.publish(ChangeFeed.HIRED, emp_id, {})
+        self.assertEqual(feed.first_seq, 3)
+        self.assertEqual([event.seq for event in feed.read(2)], [3, 4, 5])
+        with self.assertRaises(ChangeFeedGapError):
+            feed.read(1)
+
+
+class CompanyEventsTest(unittest.TestCase):
+    def events(self, company, after):
+        return [(event.type, event.entity_id) for event in company.change_feed.read(after)]
+
+    def test_mutations_publish_events(self):
+        company = make_company()
+        start = company.change_feed.last_seq
+        company.get_department("IT").add_employee(Employee(4, "Петр", "IT", 800))
+        company.update_salary(4, 850)
+        company.transfer_employee(4, "IT", "HR")
+        company.remove_employee(4)
+        company.add_department(Department("Sales"))
+        company.get_department("Sales").name = "Retail"
+        company.remove_department("Retail")
+        project = Project(1, "CRM", "", datetime(2030, 1, 1))
+        company.add_project(project)
+        project.add_team_member(company.find_employee_by_id(1))
+        project.change_status("active")
+        company.remove_project(1, force=True)
+
+        self.assertEqual(self.events(company, start), [
+            (ChangeFeed.HIRED, 4),
+            (ChangeFeed.SALARY_CHANGED, 4),
+            (ChangeFeed.TRANSFERRED, 4),
+            (ChangeFeed.REMOVED, 4),
+            (ChangeFeed.DEPARTMENT_ADDED, 0),
+            (ChangeFeed.DEPARTMENT_RENAMED, 0),
+            (ChangeFeed.DEPARTMENT_REMOVED, 0),
+            (ChangeFeed.PROJECT_ADDED, 1),
+            (ChangeFeed.TEAM_CHANGED, 1),
+            (ChangeFeed.STATUS_CHANGED, 1),
+            (ChangeFeed.PROJECT_REMOVED, 1),
+        ])
+        salary = company.change_feed.read(start)[1]
+        self.assertEqual(salary.data, {"old_salary": 800, "new_salary": 850})
+
+    def test_transaction_publishes_on_commit_only(self):
+        company = make_company()
+        start = company.change_feed.last_seq
+        seen = []
+        company.change_feed.subscribe(seen.append)
+        with self.assertRaises(RuntimeError):
+            with company.transaction():
+                company.update_salary(2, 950)
+                raise RuntimeError("отмена")
+        self.assertEqual(seen, [])
+
+        with company.transaction():
+            company.update_salary(2, 950)
+            self.assertEqual(seen, [])
+            company.transfer_employee(2, "IT", "HR")
+        self.assertEqual(self.events(company, start),
+                         [(ChangeFeed.SALARY_CHANGED, 2), (ChangeFeed.TRANSFERRED, 2)])
+
+    def test_failing_subscriber_keeps_company_consistent(self):
+        company = make_company()
+        seen = []
+
+        def broken(event):
+            raise RuntimeError("сбой потребителя")
+
+        company.change_feed.subscribe(broken)
+        company.change_feed.subscribe(seen.append)
+        department = company.get_department("HR")
+        department.add_employee(Employee(4, "Петр", "HR", 800))
+        self.assertIs(company.find_employee_by_id(4), department.find_employee_by_id(4))
+        self.assertEqual((len(company), len(department)), (4, 2))
+        # остальные подписчики получают событие
+        self.assertEqual([(event.type, event.entity_id) for event in seen], [(ChangeFeed.HIRED, 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,318 @@
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime
+from core_OOP.Company import Company
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee, Manager, Developer
+from core_OOP.Project import Project
+from core_OOP.exceptions import DepartmentNotFoundError, DuplicateIdError, EmployeeNotFoundError, VersionConflictError
+from data_base.connection import DatabaseConnection
+
+
+def make_company(thread_safe: bool = False) -> Company:
+    """Компания с отделами IT (1, 2) и HR (3)"""
+    company = Company("Test", thread_safe=thread_safe)
+    it, hr = Department("IT"), Department("HR")
+    it.add_employee(Developer(1, "Олег", "IT", 1000, ["python"], "middle"))
+    it.add_employee(Employee(2, "Анна", "IT", 900))
+    hr.add_employee(Manager(3, "Иван", "HR", 1200, 300))
+    company.add_department(it)
+    company.add_department(hr)
+    return company
+
+
+class EmployeeIndexTest(unittest.TestCase):
+    def test_lookup_by_id(self):
+        company = make_company()
+        self.assertEqual(company.find_employee_by_id(3).name, "Иван")
+        self.assertIsNone(company.find_employee_by_id(99))
+        self.assertEqual(sorted(company.find_many([1, 3, 99])), [1, 3])
+        self.assertIs(company.get_employee_department(2), company.get_department("IT"))
+        with self.assertRaises(EmployeeNotFoundError):
+            company.find_employee_company_wide(99)
+
+    def test_index_follows_department_changes(self):
+        company = make_company()
+        company.get_department("HR").add_employee(Employee(4, "Петр", "HR", 800))
+        self.assertIs(company.get_employee_department(4), company.get_department("HR"))
+        company.get_department("IT").remove_employee(2)
+        self.assertIsNone(company.find_employee_by_id(2))
+        self.assertEqual(len(company), 3)
+
+    def test_id_is_unique_across_departments(self):
+        company = make_company()
+        with self.assertRaises(DuplicateIdError):
+            company.get_department("HR").add_employee(Employee(1, "Дубль", "HR", 800))
+        self.assertNotIn(1, company.get_department("HR").get_employee_ids())
+        other = Department("Sales")
+        other.add_employee(Employee(2, "Дубль", "Sales", 800))
+        with self.assertRaises(DuplicateIdError):
+            company.add_department(other)
+
+    def test_removed_department_leaves_index(self):
+        company = make_company()
+        company.remove_department("HR", force=True)
+        self.assertIsNone(company.find_employee_by_id(3))
+        with self.assertRaises(RuntimeError):
+            company.remove_department("IT")
+
+
+class DepartmentRegistryTest(unittest.TestCase):
+    def test_get_department_by_name(self):
+        company = make_company()
+        self.assertEqual(company.get_department("HR").name, "HR")
+        with self.assertRaises(DepartmentNotFoundError):
+            company.get_department("Sales")
+        with self.assertRaises(DuplicateIdError):
+            company.add_department(Department("IT"))
+
+    def test_rename_keeps_order_and_rejects_duplicates(self):
+        company = make_company()
+        company.add_department(Department("Sales"))
+        company.get_department("HR").name = "People"
+        self.assertEqual([dept.name for dept in company.get_departments()], ["IT", "People", "Sales"])
+        with self.assertRaises(DepartmentNotFoundError):
+            company.get_department("HR")
+        with self.assertRaises(DuplicateIdError):
+            company.get_department("People").name = "IT"
+        self.assertEqual(company.get_department("People").name, "People")
+
+
+class LazyIterationTest(unittest.TestCase):
+    def test_iterators(self):
+        company = make_company()
+        iterator = company.iter_employees()
+        self.assertIs(iter(iterator), iterator)
+        self.assertEqual([emp.id for emp in iterator], [1, 2, 3])
+        self.assertEqual([emp.id for emp in company.get_all_employees()], [1, 2, 3])
+
+    def test_filters(self):
+        company = make_company()
+        self.assertEqual([emp.id for emp in company.iter_employees_by_type(Employee)], [1, 2, 3])
+        self.assertEqual([emp.id for emp in company.iter_employees_by_type("Employee")], [2])
+        self.assertEqual([emp.id for emp in company.iter_employees_by_type(Manager)], [3])
+        self.assertEqual([emp.id for emp in company.iter_employees_by_department("HR", "IT")], [3, 1, 2])
+        with self.assertRaises(DepartmentNotFoundError):
+            company.iter_employees_by_department("Sales")
+
+    def test_total_cost(self):
+        self.assertEqual(make_company().calculate_total_monthly_cost(), 1500 + 900 + 1500)
+        self.assertEqual(make_company(thread_safe=True).calculate_total_monthly_cost(), 3900)
+
+
+class VersionConflictTest(unittest.TestCase):
+    def test_update_salary_returns_new_version(self):
+        company = make_company()
+        version = company.find_employee_by_id(2).version
+        self.assertEqual(company.update_salary(2, 950, expected_version=version), version + 1)
+
+    def test_stale_version_is_rejected(self):
+        company = make_company()
+        employee = company.find_employee_by_id(2)
+        version = employee.version
+        company.update_salary(2, 950)
+        with self.assertRaises(VersionConflictError) as ctx:
+            company.update_salary(2, 1000, expected_version=version)
+        self.assertEqual(ctx.exception.expected_version, version)
+        self.assertEqual(ctx.exception.actual_version, employee.version)
+        self.assertEqual(employee.base_salary, 950)
+
+    def test_transfer_checks_version(self):
+        company = make_company()
+        employee = company.find_employee_by_id(2)
+        version = employee.version
+        employee.name = "Анна Петрова"
+        with self.assertRaises(VersionConflictError):
+            company.transfer_employee(2, "IT", "HR", expected_version=version)
+        self.assertIs(company.get_employee_department(2), company.get_department("IT"))
+        company.transfer_employee(2, "IT", "HR", expected_version=employee.version)
+        self.assertEqual(employee.department, "HR")
+
+
+class DepartmentRenameTest(unittest.TestCase):
+    def test_rename_updates_members(self):
+        company = make_company()
+        company.get_department("IT").name = "Engineering"
+        self.assertEqual(company.get_department("Engineering").name, "Engineering")
+        for employee_id in (1, 2):
+            employee = company.find_employee_by_id(employee_id)
+            self.assertEqual(employee.department, "Engineering")
+            self.assertEqual(DatabaseConnection.employee_row(employee)[2], "Engineering")
+
+    def test_rolled_back_rename_restores_members(self):
+        company = make_company()
+        with self.assertRaises(RuntimeError):
+            with company.transaction():
+                company.get_department("IT").name = "Engineering"
+                raise RuntimeError("отмена")
+        self.assertEqual(company.get_department("IT").name, "IT")
+        self.assertEqual(company.find_employee_by_id(1).department, "IT")
+
+
+class ThreadSafeCompanyTest(unittest.TestCase):
+    def test_concurrent_transfers_keep_index_consistent(self):
+        company = make_company(thread_safe=True)
+        for index in range(4):
+            company.add_department(Department(f"D{index}"))
+        for emp_id in range(100, 140):
+            company.get_department("D0").add_employee(Employee(emp_id, f"Сотрудник {emp_id}", "D0", 1000))
+
+        def worker(offset):
+            for step in range(200):
+                emp_id = 100 + (offset * 7 + step) % 40
+                target = f"D{(offset + step) % 4}"
+                source = company.get_employee_department(emp_id).name
+                if source == target:
+                    continue
+                try:
+                    company.transfer_employee(emp_id, source, target)
+                except EmployeeNotFoundError:
+                    # сотрудника успел перевести другой поток
+                    pass
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(company), 43)
+        for department in company.get_departments():
+            for employee in department:
+                self.assertIs(company.get_employee_department(employee.id), department)
+                self.assertEqual(employee.department, department.name)
+
+    def test_department_added_in_transaction_is_locked(self):
+        company = make_company(thread_safe=True)
+        department = Department("New")
+        acquired = []
+
+        def try_lock():
+            acquired.append(department.lock.acquire(timeout=0.1))
+            if acquired[-1]:
+                department.lock.release()
+
+        with company.transaction():
+            company.add_department(department)
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+        try_lock()
+        self.assertEqual(acquired, [False, True])
+
+    def test_project_added_in_transaction_is_locked(self):
+        company = make_company(thread_safe=True)
+        project = Project(1, "CRM", "", datetime(2030, 1, 1))
+        with company.transaction():
+            company.add_project(project)
+            result = []
+            thread = threading.Thread(target=lambda: result.append(project.lock.acquire(timeout=0.1)))
+            thread.start()
+            thread.join()
+        self.assertEqual(result, [False])
+
+    def run_while_transferred(self, company, operation):
+        """Запускает операцию, пока сотрудника 1 переводят из IT в HR, и держит HR"""
+        it, hr = company.get_department("IT"), company.get_department("HR")
+        it.lock.acquire()
+        thread = threading.Thread(target=operation, daemon=True)
+        thread.start()
+        # операция нашла отдел IT и ждет его блокировку
+        time.sleep(0.1)
+        company.transfer_employee(1, "IT", "HR")
+        hr.lock.acquire()
+        it.lock.release()
+        try:
+            thread.join(timeout=0.2)
+            # сотрудник уже в HR, и операция должна ждать его блокировку
+            self.assertTrue(thread.is_alive())
+        finally:
+            hr.lock.release()
+        thread.join()
+
+    def test_update_salary_follows_transferred_employee(self):
+        company = make_company(thread_safe=True)
+        self.run_while_transferred(company, lambda: company.update_salary(1, 5000))
+        self.assertEqual(company.find_employee_by_id(1).base_salary, 5000)
+
+    def test_renumber_follows_transferred_employee(self):
+        company = make_company(thread_safe=True)
+        errors = []
+
+        def renumber():
+            try:
+                company.renumber_employee(1, 10)
+            except Exception as error:
+                errors.append(error)
+        self.run_while_transferred(company, renumber)
+        self.assertEqual(errors, [])
+        self.assertIs(company.get_employee_department(10), company.get_department("HR"))
+
+
+class BulkOperationsTest(unittest.TestCase):
+    def test_transfer_many_is_all_or_nothing(self):
+        company = make_company()
+        with self.assertRaises(EmployeeNotFoundError):
+            company.transfer_many([(1, "HR"), (99, "HR")])
+        self.assertEqual(company.get_department("IT").get_employee_ids(), [1, 2])
+        self.assertEqual(company.transfer_many([(1, "HR"), (2, "HR")]), 2)
+        self.assertEqual(company.get_department("HR").get_employee_ids(), [3, 1, 2])
+
+    def test_merge_and_split_departments(self):
+        company = make_company()
+        company.merge_departments("HR", "IT")
+        self.assertEqual([dept.name for dept in company.get_departments()], ["IT"])
+        self.assertEqual(company.find_employee_by_id(3).department, "IT")
+        company.split_department("IT", "Managers", lambda emp: isinstance(emp, Manager))
+        self.assertEqual(company.get_department("Managers").get_employee_ids(), [3])
+
+    def test_merge_company_policies(self):
+        def other_company():
+            other = Company("Other")
+            it = Department("IT")
+            it.add_employee(Employee(2, "Дубль", "IT", 500))
+            it.add_employee(Employee(10, "Новый", "IT", 500))
+            other.add_department(it)
+            return other
+
+        company, other = make_company(), other_company()
+        with self.assertRaises(DuplicateIdError):
+            company.merge_company(other)
+        self.assertEqual(len(company), 3)
+        self.assertEqual(len(other), 2)
+
+        company.merge_company(other, on_conflict="skip")
+        self.assertEqual(company.find_employee_by_id(10).name, "Новый")
+        self.assertEqual(other.get_department("IT").get_employee_ids(), [2])
+
+        company, other = make_company(), other_company()
+        company.merge_company(other, on_conflict="renumber")
+        self.assertEqual(len(company), 5)
+        self.assertEqual(len(other), 0)
+        self.assertEqual(sorted(emp.name for emp in company.iter_employees())[:2], ["Анна", "Дубль"])
+
+    def test_opposite_merges_do_not_deadlock(self):
+        # частое переключение потоков, чтобы встречные слияния пересекались
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        for attempt in range(200):
+            first, second = make_company(thread_safe=True), Company("Other", thread_safe=True)
+            sales = Department("Sales")
+            sales.add_employee(Employee(10, "Новый", "Sales", 500))
+            second.add_department(sales)
+            threads = [
+                threading.Thread(target=first.merge_company, args=(second, "skip"), daemon=True),
+                threading.Thread(target=second.merge_company, args=(first, "skip"), daemon=True),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+                self.assertFalse(thread.is_alive(), f"взаимная блокировка на попытке {attempt}")
+            self.assertEqual(len(first) + len(second), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import threading
+import unittest
+from core_OOP.exceptions import DatabaseError, InvalidDataError
+from core_OOP.Employee import Employee, Developer
+from data_base.connection import STORAGE_PROFILES
+from data_base.repository import EmployeeRepository
+from tests.support import DatabaseTestCase, make_employee
+
+
+class BulkSaveTest(DatabaseTestCase):
+    def test_save_and_load_round_trip(self):
+        employees = [make_employee(emp_id) for emp_id in range(1, 101)]
+        self.assertEqual(self.db.save_employees(employees, batch_size=7), 100)
+        loaded = self.db.load_employees()
+        self.assertEqual([emp.to_dict() for emp in loaded], [emp.to_dict() for emp in employees])
+
+    def test_save_updates_existing_rows(self):
+        employee = make_employee(1)
+        self.db.save_employees([employee])
+        employee.bonus = 900
+        self.db.save_employees([employee])
+        [loaded] = self.db.load_employees()
+        self.assertEqual(loaded.bonus, 900)
+
+    def test_filters(self):
+        self.db.save_employees([make_employee(emp_id, "IT" if emp_id <= 8 else "HR")
+                                for emp_id in range(1, 17)])
+        self.assertEqual([emp.id for emp in self.db.load_employees(department="HR",
+                                                                   employee_type="Developer")],
+                         [10, 14])
+        self.assertEqual(len(self.db.load_employees(department="IT")), 8)
+
+    def test_dicts_and_subclasses_use_to_dict(self):
+        class Intern(Employee):
+            pass
+
+        self.db.save_employees([Intern(1, "Анна", "IT", 500),
+                                {"id": 2, "name": "Иван", "department": "HR", "base_salary": 700,
+                                 "type": "Developer", "tech_stack": ["go"], "seniority_level": "senior"}])
+        self.assertEqual([(row["employee_type"], row["tech_stack"]) for row in
+                          self.db.get_connection().execute("SELECT * FROM employees ORDER BY id")],
+                         [("Intern", None), ("Developer", '["go"]')])
+
+    def test_bulk_save_maintains_skills_and_search(self):
+        repository = EmployeeRepository(self.db)
+        developers = [Developer(emp_id, f"Разработчик {emp_id}", "IT", 1000, ["python"], "junior")
+                      for emp_id in range(1, 21)]
+        self.db.save_employees(developers, batch_size=6)
+        developers[0].name = "Ольга Сидорова"
+        developers[0].add_skill("rust")
+        self.db.save_employees(developers, batch_size=6)
+
+        self.assertEqual(repository.skill_counts(), [("python", 20), ("rust", 1)])
+        self.assertEqual([emp.id for emp in repository.search_by_name("сидорова")], [1])
+        self.assertEqual(len(repository.search_by_name("разработчик")), 19)
+        # внешнее содержимое FTS совпадает с employees
+        self.db.execute_write("INSERT INTO employees_fts (employees_fts, rank) VALUES ('integrity-check', 1)")
+        conn = self.db.get_connection()
+
+        # построчные триггеры восстановлены после пакетной записи
+        triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        self.assertTrue(set(self.db.BULK_TRIGGERS) <= triggers)
+        repository.save(Developer(50, "Павел", "IT", 1000, ["go"], "junior"))
+        self.assertEqual([emp.id for emp in repository.search_by_name("павел")], [50])
+        self.assertEqual([emp.id for emp in repository.find_by_skills(["go"])], [50])
+
+    def test_failed_bulk_save_restores_triggers(self):
+        self.db.save_employees([make_employee(1)])
+        with self.assertRaises(DatabaseError):
+            self.db.submit_write(lambda conn: self.db.upsert_employees(
+                conn, [self.db.employee_row(make_employee(2)), (3, None, "IT", 1, "Employee",
+                                                                 None, None, None, None, None)])).result()
+        conn = self.db.get_connection()
+        triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        self.assertTrue(set(self.db.BULK_TRIGGERS) <= triggers)
+        self.assertEqual([emp.id for emp in self.db.load_employees()], [1])
+
+    def test_missing_field(self):
+        with self.assertRaises(InvalidDataError):
+            self.db.save_employees([{"id": 1, "name": "Анна", "department": "IT"}])
+        self.assertEqual(self.db.load_employees(), [])
+
+
+class WriterThreadTest(DatabaseTestCase):
+    def count(self) -> int:
+        return self.db.get_connection().execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def test_concurrent_writes_are_serialised(self):
+        def worker(start):
+            self.db.save_employees([make_employee(emp_id) for emp_id in range(start, start + 50)],
+                                   batch_size=5)
+        threads = [threading.Thread(target=worker, args=(start,)) for start in range(1, 401, 50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.count(), 400)
+
+    def test_failed_operation_rolls_back_only_itself(self):
+        def failing(conn):
+            conn.execute(self.db.EMPLOYEE_UPSERT, self.db.employee_row(make_employee(2)))
+            raise ValueError("ошибка операции")
+        ok = self.db.submit_write(lambda conn: conn.execute(
+            self.db.EMPLOYEE_UPSERT, self.db.employee_row(make_employee(1))).rowcount)
+        failed = self.db.submit_write(failing)
+        self.assertEqual(ok.result(), 1)
+        with self.assertRaises(ValueError):
+            failed.result()
+        self.assertEqual([emp.id for emp in self.db.load_employees()], [1])
+
+    def test_writer_survives_broken_savepoint(self):
+        def end_transaction(conn):
+            conn.execute("ROLLBACK")
+            raise ValueError("транзакция уже закрыта")
+        with self.assertRaises(DatabaseError):
+            self.db.submit_write(end_transaction).result(timeout=5)
+        self.db.save_employees([make_employee(1)])
+        self.assertEqual(self.count(), 1)
+
+    def test_unusable_connection_fails_pending_writes(self):
+        with self.assertRaises(DatabaseError):
+            self.db.submit_write(lambda conn: conn.close()).result(timeout=5)
+        with self.assertRaises(DatabaseError):
+            self.db.save_employees([make_employee(1)])
+        # писатель перезапускается заново открытой базой
+        self.db.close_connection()
+        self.db.configure(self.db_path)
+        self.db.save_employees([make_employee(1)])
+        self.assertEqual(self.count(), 1)
+
+
+class StorageProfileTest(DatabaseTestCase):
+    profile = "durable"
+
+    def test_profile_is_applied(self):
+        connection = self.db.get_connection()
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        # FULL = 2
+        self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 2)
+
+    def test_same_profile_is_accepted(self):
+        self.db.configure(self.db_path, profile=STORAGE_PROFILES["durable"])
+
+    def test_other_profile_is_rejected(self):
+        with self.assertRaises(DatabaseError):
+            self.db.configure(self.db_path, profile="bulk-load")
+        self.assertEqual(self.db.profile, STORAGE_PROFILES["durable"])
+
+    def test_profile_changes_after_reopen(self):
+        self.db.close_connection()
+        self.db.configure(self.db_path, profile="read-mostly")
+        self.assertEqual(self.db.get_connection().execute("PRAGMA synchronous").fetchone()[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
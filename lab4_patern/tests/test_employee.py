@@ -0,0 +1,79 @@
+import unittest
+from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+from core_OOP.exceptions import InvalidDataError, FinancialValidationError
+
+
+class EmployeeVersionTest(unittest.TestCase):
+    def test_new_employee_has_version_one(self):
+        self.assertEqual(Employee(1, "Анна", "IT", 1000).version, 1)
+
+    def test_setters_bump_version(self):
+        employee = Employee(1, "Анна", "IT", 1000)
+        employee.name = "Анна Петрова"
+        employee.department = "HR"
+        employee.base_salary = 1200
+        employee.id = 2
+        self.assertEqual(employee.version, 5)
+
+    def test_invalid_value_keeps_version(self):
+        employee = Employee(1, "Анна", "IT", 1000)
+        with self.assertRaises(FinancialValidationError):
+            employee.base_salary = -1
+        with self.assertRaises(InvalidDataError):
+            employee.name = " "
+        self.assertEqual(employee.version, 1)
+        self.assertEqual(employee.base_salary, 1000)
+
+    def test_subclass_mutators_bump_version(self):
+        manager = Manager(1, "Иван", "Sales", 1000, 200)
+        manager.bonus = 300
+        self.assertEqual(manager.version, 2)
+
+        developer = Developer(2, "Олег", "IT", 1000, ["python"], "junior")
+        developer.seniority_level = "senior"
+        developer.add_skill("sql")
+        developer.add_skill("sql")
+        self.assertEqual(developer.version, 3)
+
+        salesperson = Salesperson(3, "Ольга", "Sales", 1000, 0.1)
+        salesperson.commission_rate = 0.2
+        salesperson.update_sales(500)
+        self.assertEqual(salesperson.version, 3)
+
+
+class EmployeeSubclassTest(unittest.TestCase):
+    def test_calculate_salary(self):
+        self.assertEqual(Manager(1, "Иван", "Sales", 1000, 200).calculate_salary(), 1200)
+        self.assertEqual(Developer(2, "Олег", "IT", 1000, seniority_level="middle").calculate_salary(), 1500)
+        self.assertEqual(Salesperson(3, "Ольга", "Sales", 1000, 0.1, 2000).calculate_salary(), 1200)
+
+    def test_round_trip_through_dict(self):
+        employees = [
+            Employee(1, "Анна", "IT", 1000),
+            Manager(2, "Иван", "Sales", 1000, 200),
+            Developer(3, "Олег", "IT", 1000, ["python", "sql"], "senior"),
+            Salesperson(4, "Ольга", "Sales", 1000, 0.1, 2000),
+        ]
+        for employee in employees:
+            with self.subTest(type=type(employee).__name__):
+                restored = type(employee).from_dict(employee.to_dict())
+                self.assertEqual(restored.to_dict(), employee.to_dict())
+
+    def test_tech_stack_is_copied(self):
+        skills = ["python"]
+        developer = Developer(1, "Олег", "IT", 1000, skills)
+        skills.append("go")
+        developer.tech_stack.append("rust")
+        self.assertEqual(developer.tech_stack, ["python"])
+
+    def test_invalid_data_error_fields(self):
+        with self.assertRaises(InvalidDataError) as ctx:
+            Developer(1, "Олег", "IT", 1000, seniority_level="lead")
+        self.assertEqual(ctx.exception.field, "seniority_level")
+        self.assertEqual(ctx.exception.value, "lead")
+        with self.assertRaises(InvalidDataError):
+            Manager.from_dict({"id": 1, "name": "Иван", "department": "IT", "base_salary": 1000})
+
+
+if __name__ == "__main__":
+    unittest.main()
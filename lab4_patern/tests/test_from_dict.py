@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from core_OOP.Project import Project
+from core_OOP.exceptions import InvalidDataError
+from Paterns.creational.factory_method import EmployeeFactory
+from data_base.journal import CompanyJournal
+
+
+class ProjectFromDictTest(unittest.TestCase):
+    def test_round_trip(self):
+        project = Project(1, "CRM", "Внедрение", datetime(2030, 1, 1), "active")
+        restored = Project.from_dict(project.to_dict())
+        self.assertEqual(restored.to_dict(), project.to_dict())
+
+    def test_missing_field(self):
+        with self.assertRaises(InvalidDataError) as ctx:
+            Project.from_dict({"project_id": 1, "name": "CRM", "description": ""})
+        self.assertIn("deadline", ctx.exception.field)
+
+    def test_bad_deadline(self):
+        with self.assertRaises(InvalidDataError) as ctx:
+            Project.from_dict({"project_id": 1, "name": "CRM", "description": "",
+                               "deadline": "завтра"})
+        self.assertEqual(ctx.exception.field, "deadline")
+        self.assertEqual(ctx.exception.value, "завтра")
+
+
+class EmployeeFactoryFromDictTest(unittest.TestCase):
+    def test_missing_type(self):
+        with self.assertRaises(InvalidDataError) as ctx:
+            EmployeeFactory.from_dict({"id": 1, "name": "Анна", "department": "IT", "base_salary": 1})
+        self.assertIn("type", ctx.exception.field)
+
+    def test_unknown_type(self):
+        with self.assertRaises(InvalidDataError) as ctx:
+            EmployeeFactory.from_dict({"type": "Intern", "id": 1, "name": "Анна",
+                                       "department": "IT", "base_salary": 1})
+        self.assertEqual(ctx.exception.value, "Intern")
+
+
+class JournalSnapshotTest(unittest.TestCase):
+    def test_snapshot_without_required_field(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, CompanyJournal.SNAPSHOT_FILE), "w", encoding="utf-8") as f:
+                json.dump({"lsn": 0, "name": "Test", "departments": []}, f)
+            with self.assertRaises(InvalidDataError) as ctx:
+                CompanyJournal(directory).recover()
+            self.assertIn("projects", ctx.exception.field)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee
+from core_OOP.Project import Project
+from core_OOP.exceptions import InvalidDataError
+from data_base.journal import CompanyJournal
+from tests.test_company import make_company
+from tests.test_transactions import state
+
+
+def mutate(company):
+    """Изменения всех видов, которые журнал должен повторить"""
+    company.get_department("HR").add_employee(Employee(4, "Петр", "HR", 800))
+    company.update_salary(2, 950)
+    company.transfer_many([(1, "HR")])
+    company.add_department(Department("Sales"))
+    company.get_department("Sales").name = "Продажи"
+    project = Project(1, "CRM", "", datetime(2030, 1, 1))
+    company.add_project(project)
+    project.add_team_member(company.find_employee_by_id(3))
+    project.change_status("active")
+    company.get_department("IT").remove_employee(2)
+
+
+class CompanyJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def segments(self):
+        return sorted(name for name in os.listdir(self.directory)
+                      if name.startswith(CompanyJournal.SEGMENT_PREFIX))
+
+    def test_recover_replays_tail(self):
+        company = make_company()
+        with CompanyJournal(self.directory, commit_interval=0) as journal:
+            journal.attach(company)
+            mutate(company)
+            journal.flush()
+            self.assertEqual(journal.durable_lsn, journal.lsn)
+
+        with CompanyJournal(self.directory) as journal:
+            recovered = journal.recover()
+        self.assertEqual(state(recovered), state(company))
+        self.assertEqual(recovered.get_project(1).status, "active")
+
+    def test_recovered_journal_keeps_writing(self):
+        company = make_company()
+        with CompanyJournal(self.directory) as journal:
+            journal.attach(company)
+            company.update_salary(1, 2000)
+
+        with CompanyJournal(self.directory) as journal:
+            recovered = journal.recover()
+            recovered.update_salary(3, 1500)
+
+        with CompanyJournal(self.directory) as journal:
+            recovered = journal.recover()
+        self.assertEqual(recovered.find_employee_by_id(1).base_salary, 2000)
+        self.assertEqual(recovered.find_employee_by_id(3).base_salary, 1500)
+
+    def test_compaction_drops_covered_segments(self):
+        company = make_company()
+        with CompanyJournal(self.directory) as journal:
+            journal.attach(company)
+            mutate(company)
+            journal.compact()
+            company.update_salary(3, 1300)
+        # старые сегменты удалены, остался только начатый компактификацией
+        self.assertEqual(len(self.segments()), 1)
+
+        with CompanyJournal(self.directory) as journal:
+            recovered = journal.recover()
+        self.assertEqual(state(recovered), state(company))
+
+    def test_torn_last_line_is_skipped(self):
+        company = make_company()
+        with CompanyJournal(self.directory) as journal:
+            journal.attach(company)
+            company.update_salary(1, 2000)
+        with open(os.path.join(self.directory, self.segments()[-1]), 'a', encoding='utf-8') as f:
+            f.write('{"lsn": 99, "type": "sal')
+
+        with CompanyJournal(self.directory) as journal:
+            recovered = journal.recover()
+        self.assertEqual(recovered.find_employee_by_id(1).base_salary, 2000)
+
+    def test_attach_requires_empty_directory(self):
+        with CompanyJournal(self.directory) as journal:
+            journal.attach(make_company())
+        with self.assertRaises(InvalidDataError):
+            CompanyJournal(self.directory).attach(make_company())
+        # фоновая компактификация требует потокобезопасной компании
+        with self.assertRaises(InvalidDataError):
+            CompanyJournal(os.path.join(self.directory, "other"), compact_every=10).attach(make_company())
+
+
+if __name__ == "__main__":
+    unittest.main()
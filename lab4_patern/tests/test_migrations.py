@@ -0,0 +1,80 @@
+import sqlite3
+import unittest
+from core_OOP.exceptions import DatabaseError
+from data_base.migrations import MIGRATIONS, Migration, SchemaMigrator
+from data_base.repository import EmployeeRepository
+
+
+def tables(connection: sqlite3.Connection) -> set:
+    return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+class SchemaMigratorTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:", isolation_level=None)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_migrate_step_by_step(self):
+        migrator = SchemaMigrator()
+        self.assertEqual(migrator.latest_version, len(MIGRATIONS))
+        self.assertEqual(migrator.current_version(self.connection), 0)
+
+        self.assertEqual(migrator.migrate(self.connection, target=1), [1])
+        self.assertEqual(migrator.current_version(self.connection), 1)
+        self.assertIn("employees", tables(self.connection))
+        self.assertNotIn("projects", tables(self.connection))
+
+        applied = migrator.migrate(self.connection)
+        self.assertEqual(applied, list(range(2, migrator.latest_version + 1)))
+        self.assertIn("projects", tables(self.connection))
+        self.assertEqual(migrator.migrate(self.connection), [])
+
+    def test_type_lookup_keeps_id_order_without_sorting(self):
+        SchemaMigrator().migrate(self.connection)
+        plan = " / ".join(row[3] for row in self.connection.execute(
+            "EXPLAIN QUERY PLAN " + EmployeeRepository.BY_TYPE_SQL, ("Manager",)))
+        self.assertIn("idx_employees_type ", plan + " ")
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_existing_data_survives(self):
+        migrator = SchemaMigrator()
+        migrator.migrate(self.connection, target=1)
+        self.connection.execute(
+            "INSERT INTO employees (id, name, department, base_salary, employee_type, tech_stack) "
+            "VALUES (1, 'Олег Петров', 'IT', 1000, 'Developer', '[\"python\", \"sql\"]')"
+        )
+        migrator.migrate(self.connection)
+        # данные, записанные до появления навыков и поиска, переносятся миграциями
+        skills = self.connection.execute(
+            "SELECT skills.name FROM employee_skills JOIN skills ON skills.id = employee_skills.skill_id "
+            "ORDER BY skills.name"
+        ).fetchall()
+        self.assertEqual([row[0] for row in skills], ["python", "sql"])
+        found = self.connection.execute("SELECT rowid FROM employees_fts WHERE employees_fts MATCH 'олег'")
+        self.assertEqual(found.fetchall(), [(1,)])
+
+    def test_failed_migration_rolls_back(self):
+        migrator = SchemaMigrator([
+            MIGRATIONS[0],
+            Migration(2, "ошибка", ("CREATE TABLE extra (id INTEGER)", "SELECT * FROM missing")),
+        ])
+        with self.assertRaises(DatabaseError):
+            migrator.migrate(self.connection)
+        self.assertEqual(migrator.current_version(self.connection), 1)
+        self.assertNotIn("extra", tables(self.connection))
+        self.assertFalse(self.connection.in_transaction)
+
+    def test_versions_must_be_consecutive(self):
+        with self.assertRaises(DatabaseError):
+            SchemaMigrator([MIGRATIONS[0], MIGRATIONS[2]])
+
+    def test_newer_database_is_rejected(self):
+        SchemaMigrator().migrate(self.connection)
+        with self.assertRaises(DatabaseError):
+            SchemaMigrator(MIGRATIONS[:1]).migrate(self.connection)
+
+
+if __name__ == "__main__":
+    unittest.main()
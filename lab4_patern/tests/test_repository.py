@@ -0,0 +1,288 @@
+import unittest
+from datetime import datetime
+from core_OOP.Company import Company
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee, Manager, Developer, Salesperson
+from core_OOP.Project import Project
+from core_OOP.exceptions import DatabaseError, EmployeeNotFoundError, InvalidDataError, ProjectNotFoundError
+from data_base.repository import EmployeeRepository, EmployeeRow, PayrollRow, ProjectRepository
+from tests.support import DatabaseTestCase, make_employee
+
+
+def company_of(*employees) -> Company:
+    """Компания, в которой сотрудники распределены по своим отделам"""
+    company = Company("Test")
+    departments = {}
+    for employee in employees:
+        if employee.department not in departments:
+            departments[employee.department] = Department(employee.department)
+            company.add_department(departments[employee.department])
+        departments[employee.department].add_employee(employee)
+    return company
+
+
+class EmployeeRepositoryTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = EmployeeRepository(self.db)
+        self.employees = [make_employee(emp_id, ("IT", "HR")[emp_id % 2]) for emp_id in range(1, 21)]
+        self.repository.save_many(self.employees)
+
+    def test_get_builds_each_class(self):
+        for employee in self.employees[:4]:
+            with self.subTest(type(employee).__name__):
+                loaded = self.repository.get(employee.id)
+                self.assertIs(type(loaded), type(employee))
+                self.assertEqual(loaded.to_dict(), employee.to_dict())
+        with self.assertRaises(EmployeeNotFoundError):
+            self.repository.get(99)
+
+    def test_get_many_skips_missing(self):
+        found = self.repository.get_many([3, 5, 99])
+        self.assertEqual(sorted(found), [3, 5])
+        self.assertEqual(found[5].name, self.employees[4].name)
+        self.assertEqual(self.repository.get_many([]), {})
+
+    def test_find_by_department(self):
+        self.assertEqual([employee.id for employee in self.repository.find_by_department("HR")],
+                         list(range(1, 21, 2)))
+        self.assertEqual(self.repository.find_by_department("Sales"), [])
+
+    def test_iter_by_type(self):
+        developers = list(self.repository.iter_by_type(Developer, batch_size=2))
+        self.assertEqual([employee.id for employee in developers], [2, 6, 10, 14, 18])
+        self.assertTrue(all(isinstance(employee, Developer) for employee in developers))
+        self.assertEqual(len(list(self.repository.iter_by_type("Manager"))), 5)
+
+    def test_find_by_salary_range(self):
+        found = self.repository.find_by_salary_range("Manager", 2000, 2010)
+        self.assertEqual([employee.id for employee in found], [1, 5, 9])
+        self.assertEqual(self.repository.find_by_salary_range(Manager, 0, 100), [])
+
+
+class StreamTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = EmployeeRepository(self.db)
+        self.employees = [make_employee(emp_id, ("IT", "HR")[emp_id % 2]) for emp_id in range(1, 26)]
+        self.repository.save_many(self.employees)
+
+    def test_pages_cover_table(self):
+        for batch_size in (1, 7, 25, 100):
+            with self.subTest(batch_size=batch_size):
+                ids = [employee.id for employee in self.repository.stream(batch_size=batch_size)]
+                self.assertEqual(ids, list(range(1, 26)))
+
+    def test_filters(self):
+        expected = [employee.id for employee in self.employees
+                    if employee.department == "IT" and isinstance(employee, Developer)
+                    and 1505 <= employee.base_salary <= 1520]
+        found = self.repository.stream(department="IT", employee_type=Developer,
+                                       min_salary=1505, max_salary=1520, batch_size=2)
+        self.assertEqual([employee.id for employee in found], expected)
+        self.assertEqual(list(self.repository.stream(department="Sales")), [])
+
+    def test_rows(self):
+        rows = list(self.repository.stream(employee_type="Manager", rows=True, batch_size=2))
+        self.assertTrue(all(isinstance(row, EmployeeRow) for row in rows))
+        self.assertEqual([row.id for row in rows], [1, 5, 9, 13, 17, 21, 25])
+        self.assertEqual(rows[0].bonus, 500)
+
+    def test_rows_added_during_stream(self):
+        stream = self.repository.stream(batch_size=10)
+        seen = [next(stream).id]
+        self.repository.save(make_employee(30))
+        seen.extend(employee.id for employee in stream)
+        self.assertEqual(seen, list(range(1, 26)) + [30])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(InvalidDataError):
+            next(self.repository.stream(batch_size=0))
+
+
+class SkillSearchTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = EmployeeRepository(self.db)
+        self.repository.save_many([
+            Developer(1, "Олег", "IT", 1000, ["python", "sql"], "middle"),
+            Developer(2, "Петр", "IT", 1000, ["python", "go"], "senior"),
+            Developer(3, "Мария", "IT", 1000, ["Python"], "junior"),
+            Manager(4, "Иван", "HR", 1000, 100),
+        ])
+
+    def ids(self, skills, match_all=True):
+        return [employee.id for employee in self.repository.find_by_skills(skills, match_all)]
+
+    def test_find_by_skills(self):
+        self.assertEqual(self.ids(["python"]), [1, 2])
+        self.assertEqual(self.ids(["python", "sql"]), [1])
+        self.assertEqual(self.ids(["sql", "go"], match_all=False), [1, 2])
+        # регистр учитывается
+        self.assertEqual(self.ids(["Python"]), [3])
+        self.assertEqual(self.ids([]), [])
+
+    def test_skill_counts(self):
+        self.assertEqual(self.repository.skill_counts(),
+                         [("python", 2), ("Python", 1), ("go", 1), ("sql", 1)])
+
+    def test_skills_follow_updates(self):
+        developer = self.repository.get(1)
+        developer.add_skill("rust")
+        self.repository.save(developer)
+        self.assertEqual(self.ids(["rust", "sql"]), [1])
+
+        self.repository.save(Developer(2, "Петр", "IT", 1000, ["go"], "senior"))
+        self.assertEqual(self.ids(["python"]), [1])
+
+        self.db.execute_write("DELETE FROM employees WHERE id = ?", (1,))
+        self.assertEqual(self.ids(["python", "rust", "sql"], match_all=False), [])
+        # сотрудник сменил класс - навыки разработчика больше не хранятся
+        self.repository.save(Manager(3, "Мария", "IT", 1000, 100))
+        self.assertEqual(self.repository.skill_counts(), [("go", 1)])
+
+
+class NameSearchTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = EmployeeRepository(self.db)
+        self.repository.save_many([
+            Employee(1, "Александр Петров", "IT", 1000),
+            Employee(2, "Александра Смирнова", "IT", 1000),
+            Employee(3, "Петр Александров", "HR", 1000),
+            Employee(4, "John Smith", "HR", 1000),
+        ])
+
+    def ids(self, query, **kwargs):
+        return sorted(employee.id for employee in self.repository.search_by_name(query, **kwargs))
+
+    def test_prefix_and_whole_words(self):
+        self.assertEqual(self.ids("алекс"), [1, 2, 3])
+        self.assertEqual(self.ids("алекс пет"), [1, 3])
+        self.assertEqual(self.ids("александр", prefix=False), [1])
+        self.assertEqual(len(self.repository.search_by_name("алекс", limit=2)), 2)
+
+    def test_case_insensitive(self):
+        self.assertEqual(self.ids("ПЕТРОВ"), [1])
+        self.assertEqual(self.ids("smith"), [4])
+
+    def test_query_syntax_is_literal(self):
+        self.assertEqual(self.ids('петр OR "john" NOT'), [])
+        self.assertEqual(self.ids("*"), [])
+
+    def test_index_follows_updates(self):
+        self.repository.save(Employee(4, "Иван Петров", "HR", 1000))
+        self.assertEqual(self.ids("smith"), [])
+        self.assertEqual(self.ids("петров"), [1, 4])
+        self.db.execute_write("DELETE FROM employees WHERE id = ?", (1,))
+        self.assertEqual(self.ids("петров"), [4])
+
+
+class ProjectRepositoryTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.employees = {emp_id: make_employee(emp_id) for emp_id in range(1, 6)}
+        self.db.save_employees(self.employees.values())
+        self.repository = ProjectRepository(self.db)
+        self.crm = Project(1, "CRM", "Учет клиентов", datetime(2030, 1, 1))
+        self.site = Project(2, "Сайт", "", datetime(2030, 6, 1))
+        for emp_id in (1, 2, 3):
+            self.crm.add_team_member(self.employees[emp_id])
+        self.site.add_team_member(self.employees[3])
+        self.crm.change_status("completed")
+        self.repository.save_many([self.crm, self.site])
+
+    def test_get_restores_team_and_status(self):
+        project = self.repository.get(1)
+        self.assertEqual((project.name, project.description, project.deadline, project.status),
+                         ("CRM", "Учет клиентов", datetime(2030, 1, 1), "completed"))
+        self.assertEqual(project.get_team_member_ids(), [1, 2, 3])
+        with self.assertRaises(ProjectNotFoundError):
+            self.repository.get(99)
+
+    def test_team_queries(self):
+        self.assertEqual([project.project_id for project in self.repository.find_by_employee(3)], [1, 2])
+        self.assertEqual(self.repository.get_team_ids(1), [1, 2, 3])
+        self.assertEqual(self.repository.get_employee_project_ids(3), [1, 2])
+        self.assertTrue(self.repository.is_employee_in_projects(2))
+        self.assertFalse(self.repository.is_employee_in_projects(5))
+        self.assertEqual([project.project_id for project in self.repository.find_by_status("planning")], [2])
+
+    def test_save_replaces_team(self):
+        self.site.remove_team_member(3)
+        self.site.add_team_member(self.employees[4])
+        self.repository.save(self.site)
+        self.assertEqual(self.repository.get_team_ids(2), [4])
+        self.assertEqual(self.repository.get_employee_project_ids(3), [1])
+
+    def test_unknown_member_is_rejected(self):
+        self.site.add_team_member(Employee(99, "Чужой", "IT", 100))
+        with self.assertRaises(DatabaseError):
+            self.repository.save(self.site)
+        self.assertEqual(self.repository.get_team_ids(2), [3])
+
+    def test_delete_cascades_to_team(self):
+        self.repository.delete(1)
+        self.assertEqual(self.repository.get_team_ids(1), [])
+        self.assertEqual(self.repository.get_employee_project_ids(3), [2])
+
+
+class PayrollTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = EmployeeRepository(self.db)
+
+    def assertPayrollMatches(self, company: Company):
+        self.db.save_employees(company.iter_employees())
+        # SQLite складывает в порядке ID, компания - по отделам, поэтому итог
+        # может разойтись в последних битах; зарплата каждого сотрудника - точно
+        self.assertAlmostEqual(self.repository.total_payroll(),
+                               company.calculate_total_monthly_cost(), places=6)
+
+    def test_empty_company(self):
+        company = Company("Empty")
+        self.assertPayrollMatches(company)
+        self.assertEqual(self.repository.total_payroll(), 0.0)
+        self.assertEqual(self.repository.payroll_by_department(), [])
+
+    def test_each_employee_type(self):
+        cases = {
+            "Employee": Employee(1, "Анна", "IT", 1000.1),
+            "Manager": Manager(2, "Иван", "IT", 1000.1, 250.7),
+            "Developer junior": Developer(3, "Олег", "IT", 1000.1, [], "junior"),
+            "Developer middle": Developer(4, "Петр", "IT", 1000.1, [], "middle"),
+            "Developer senior": Developer(5, "Мария", "IT", 1000.1, [], "senior"),
+            "Salesperson": Salesperson(6, "Ольга", "IT", 1000.1, 0.15, 3333.3),
+            "Salesperson без продаж": Salesperson(7, "Ирина", "IT", 1000.1, 0.2),
+        }
+        for name, employee in cases.items():
+            with self.subTest(name):
+                self.db.execute_write("DELETE FROM employees")
+                self.db.save_employees([employee])
+                # формула в SQL повторяет calculate_salary операция в операцию
+                self.assertEqual(self.repository.total_payroll(), employee.calculate_salary())
+
+    def test_mixed_company(self):
+        company = company_of(*(make_employee(emp_id, ("IT", "HR", "Sales")[emp_id % 3])
+                               for emp_id in range(1, 201)))
+        self.assertPayrollMatches(company)
+
+    def test_fractional_salaries(self):
+        company = company_of(*(Salesperson(emp_id, f"Продавец {emp_id}", ("IT", "HR")[emp_id % 2],
+                                           1000.1 + emp_id * 0.37, 0.07, 1234.5 + emp_id)
+                               for emp_id in range(1, 101)))
+        self.assertPayrollMatches(company)
+
+    def test_payroll_by_department(self):
+        company = company_of(Manager(1, "Иван", "HR", 1000, 200),
+                             Manager(2, "Петр", "HR", 1000, 300),
+                             Developer(3, "Олег", "IT", 1000, [], "senior"))
+        self.db.save_employees(company.iter_employees())
+        self.assertEqual(self.repository.payroll_by_department(), [
+            PayrollRow("HR", "Manager", 2, 2500.0),
+            PayrollRow("IT", "Developer", 1, 2000.0),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from core_OOP.Employee import Employee
+from core_OOP.exceptions import EmployeeNotFoundError, InvalidDataError
+from data_base.sharding import ShardedStorage, ShardConnection, jump_hash
+from tests.support import make_employee
+
+
+class JumpHashTest(unittest.TestCase):
+    def test_growing_moves_few_keys(self):
+        moved = sum(jump_hash(key, 4) != jump_hash(key, 5) for key in range(10_000))
+        self.assertLess(abs(moved / 10_000 - 1 / 5), 0.03)
+        for key in range(1000):
+            self.assertIn(jump_hash(key, 5), (jump_hash(key, 4), 4))
+
+
+class ShardingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def open(self, **kwargs) -> ShardedStorage:
+        storage = ShardedStorage(self.directory, **kwargs)
+        self.addCleanup(storage.close)
+        return storage
+
+
+class ShardedStorageTest(ShardingTestCase):
+    def test_save_and_read_by_id(self):
+        storage = self.open(shards=4)
+        employees = [make_employee(emp_id, ("IT", "HR")[emp_id % 2]) for emp_id in range(1, 201)]
+        self.assertEqual(storage.save_employees(employees, batch_size=33), 200)
+        self.assertEqual(storage.count(), 200)
+        self.assertTrue(all(size > 0 for size in storage.shard_sizes()))
+        self.assertEqual(storage.get_employee(77).to_dict(), employees[76].to_dict())
+        self.assertEqual([emp.id for emp in storage.load_employees()], list(range(1, 201)))
+        self.assertEqual(len(storage.load_employees(department="HR")), 100)
+        self.assertAlmostEqual(storage.total_payroll(),
+                               sum(emp.calculate_salary() for emp in employees), places=6)
+        self.assertTrue(storage.delete_employee(77))
+        with self.assertRaises(EmployeeNotFoundError):
+            storage.get_employee(77)
+
+    def test_manifest_is_kept(self):
+        self.open(shards=3, key="department").close()
+        storage = ShardedStorage(self.directory, key="department")
+        self.addCleanup(storage.close)
+        self.assertEqual(storage.shard_count, 3)
+        with self.assertRaises(InvalidDataError):
+            ShardedStorage(self.directory, shards=2, key="department")
+
+
+class DepartmentKeyTest(ShardingTestCase):
+    def departments_on_different_shards(self, storage):
+        names = {}
+        for index in range(100):
+            name = f"D{index}"
+            names.setdefault(storage.shard_for(0, name), name)
+        return names
+
+    def test_department_change_moves_employee(self):
+        storage = self.open(shards=4, key="department")
+        names = self.departments_on_different_shards(storage)
+        first, second = names[0], names[1]
+        storage.save_employees([Employee(1, "Анна", first, 1000), Employee(2, "Иван", first, 1000)])
+        storage.save_employees([Employee(1, "Анна", second, 1000)])
+        self.assertEqual(storage.count(), 2)
+        self.assertEqual(storage.get_employee(1, second).department, second)
+        self.assertEqual(storage.get_employee(1).department, second)
+        self.assertEqual([emp.id for emp in storage.load_employees(department=first)], [2])
+
+    def test_batch_without_moves_writes_only_its_shards(self):
+        storage = self.open(shards=4, key="department")
+        name = self.departments_on_different_shards(storage)[2]
+        storage.save_employees([Employee(emp_id, "Сотрудник", name, 1000) for emp_id in range(1, 11)])
+
+        original = ShardConnection.submit_write
+        with mock.patch.object(ShardConnection, "submit_write", autospec=True,
+                               side_effect=original) as submit_write:
+            storage.save_employees([Employee(emp_id, "Сотрудник", name, 2000) for emp_id in range(1, 11)])
+        self.assertEqual(submit_write.call_count, 1)
+        self.assertEqual(storage.count(), 10)
+
+
+class RebalanceTest(ShardingTestCase):
+    def test_grow_and_shrink(self):
+        storage = self.open(shards=2)
+        employees = [make_employee(emp_id) for emp_id in range(1, 501)]
+        storage.save_employees(employees)
+
+        expected = sum(jump_hash(emp_id, 2) != jump_hash(emp_id, 5) for emp_id in range(1, 501))
+        self.assertEqual(storage.rebalance(5, batch_size=40), expected)
+        self.assertEqual(storage.shard_count, 5)
+        self.assertEqual(storage.count(), 500)
+        for emp_id in (1, 250, 500):
+            self.assertEqual(storage.get_employee(emp_id).to_dict(), employees[emp_id - 1].to_dict())
+
+        storage.rebalance(3)
+        self.assertEqual(storage.count(), 500)
+        self.assertEqual(sorted(name for name in os.listdir(self.directory) if name.endswith(".db")),
+                         ["shard-000.db", "shard-001.db", "shard-002.db"])
+        storage.close()
+        reopened = self.open()
+        self.assertEqual(reopened.shard_count, 3)
+        self.assertEqual(reopened.get_employee(250).id, 250)
+
+    def test_rebalance_by_department(self):
+        storage = self.open(shards=1, key="department")
+        storage.save_employees([make_employee(emp_id, f"D{emp_id % 7}") for emp_id in range(1, 101)])
+        storage.rebalance(4)
+        for department in (f"D{index}" for index in range(7)):
+            index = storage.shard_for(0, department)
+            self.assertEqual(len(storage.load_employees(department=department)),
+                             sum(1 for emp_id in range(1, 101) if f"D{emp_id % 7}" == department))
+            self.assertIsNotNone(index)
+        self.assertEqual(storage.count(), 100)
+
+    def test_interrupted_before_manifest(self):
+        storage = self.open(shards=2)
+        storage.save_employees(make_employee(emp_id) for emp_id in range(1, 201))
+        with mock.patch.object(ShardedStorage, "_ShardedStorage__write_manifest", side_effect=OSError("диск")):
+            with self.assertRaises(OSError):
+                storage.rebalance(3)
+        storage.close()
+
+        # shards.json не сменился: все строки доступны по старой раскладке
+        reopened = self.open()
+        self.assertEqual(reopened.shard_count, 2)
+        self.assertEqual(reopened.count(), 200)
+        for emp_id in range(1, 201):
+            self.assertEqual(reopened.get_employee(emp_id).id, emp_id)
+
+        reopened.rebalance(3)
+        self.assertEqual(reopened.count(), 200)
+        self.assertEqual([emp.id for emp in reopened.load_employees()], list(range(1, 201)))
+
+    def test_interrupted_cleanup_is_redone(self):
+        storage = self.open(shards=2)
+        storage.save_employees(make_employee(emp_id) for emp_id in range(1, 201))
+        with mock.patch.object(ShardedStorage, "_ShardedStorage__drop_foreign", side_effect=OSError("сбой")):
+            with self.assertRaises(OSError):
+                storage.rebalance(3)
+        storage.close()
+
+        # новая раскладка уже действует, в старых шардах остались копии
+        reopened = self.open()
+        self.assertEqual(reopened.shard_count, 3)
+        for emp_id in range(1, 201):
+            self.assertEqual(reopened.get_employee(emp_id).id, emp_id)
+        self.assertGreater(reopened.count(), 200)
+
+        reopened.rebalance(3)
+        self.assertEqual(reopened.count(), 200)
+        for index, size in enumerate(reopened.shard_sizes()):
+            self.assertEqual(size, sum(jump_hash(emp_id, 3) == index for emp_id in range(1, 201)))
+
+
+if __name__ == "__main__":
+    unittest.main()
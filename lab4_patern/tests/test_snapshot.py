@@ -0,0 +1,71 @@
+import threading
+import unittest
+from datetime import datetime
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee
+from core_OOP.Project import Project
+from core_OOP.exceptions import EmployeeNotFoundError
+from tests.test_company import make_company
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_snapshot_does_not_see_later_changes(self):
+        company = make_company()
+        snapshot = company.snapshot()
+        company.get_department("IT").add_employee(Employee(4, "Петр", "IT", 800))
+        company.transfer_employee(1, "IT", "HR")
+        company.remove_employee(3)
+        company.add_department(Department("Sales"))
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertIsNone(snapshot.find_employee_by_id(4))
+        self.assertEqual(snapshot.get_employee_department_name(1), "IT")
+        self.assertEqual(snapshot.get_employee_department_name(3), "HR")
+        self.assertEqual(snapshot.get_department_names(), ["IT", "HR"])
+        self.assertEqual([emp.id for emp in snapshot.iter_department_employees("IT")], [1, 2])
+        with self.assertRaises(EmployeeNotFoundError):
+            snapshot.get_employee_department_name(4)
+
+        self.assertEqual(len(company), 3)
+        self.assertEqual(company.get_employee_department(1).name, "HR")
+
+    def test_employee_fields_are_shared(self):
+        company = make_company()
+        snapshot = company.snapshot()
+        company.update_salary(2, 950)
+        self.assertEqual(snapshot.find_employee_by_id(2).base_salary, 950)
+        self.assertEqual(snapshot.calculate_total_monthly_cost(), company.calculate_total_monthly_cost())
+
+    def test_project_membership(self):
+        company = make_company()
+        project = Project(1, "CRM", "", datetime(2030, 1, 1))
+        company.add_project(project)
+        project.add_team_member(company.find_employee_by_id(1))
+        snapshot = company.snapshot()
+        project.remove_team_member(1)
+        self.assertEqual([proj.project_id for proj in snapshot.get_employee_projects(1)], [1])
+        self.assertEqual(company.get_employee_projects(1), [])
+
+    def test_snapshots_are_consistent_under_concurrent_transfers(self):
+        company = make_company(thread_safe=True)
+        stop = threading.Event()
+
+        def mover():
+            while not stop.is_set():
+                company.transfer_employee(2, "IT", "HR")
+                company.transfer_employee(2, "HR", "IT")
+        thread = threading.Thread(target=mover)
+        thread.start()
+        try:
+            for _ in range(2000):
+                snapshot = company.snapshot()
+                entries = list(snapshot.iter_employee_entries())
+                self.assertEqual(sorted(emp_id for emp_id, _, _ in entries), [1, 2, 3])
+                self.assertIn(snapshot.get_employee_department_name(2), ("IT", "HR"))
+        finally:
+            stop.set()
+            thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
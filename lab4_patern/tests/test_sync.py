@@ -0,0 +1,114 @@
+import unittest
+from datetime import datetime
+from core_OOP.Employee import Employee
+from core_OOP.Project import Project
+from core_OOP.exceptions import DatabaseError, InvalidDataError
+from data_base.repository import EmployeeRepository, ProjectRepository
+from data_base.sync import CompanySync
+from tests.support import DatabaseTestCase
+from tests.test_company import make_company
+
+
+class CompanySyncTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.company = make_company(thread_safe=True)
+        self.employees = EmployeeRepository(self.db)
+        self.projects = ProjectRepository(self.db, self.employees)
+        # фоновый поток не успевает сработать, записи идут только через flush
+        self.sync = CompanySync(self.company, self.db, interval=60)
+
+    def tearDown(self):
+        self.sync.close()
+        super().tearDown()
+
+    def saved_ids(self):
+        return sorted(row[0] for row in self.db.get_connection().execute("SELECT id FROM employees"))
+
+    def test_full_sync(self):
+        self.assertEqual(self.sync.pending, 5)
+        self.assertEqual(self.sync.flush(), 5)
+        self.assertEqual(self.sync.pending, 0)
+        self.assertEqual(self.sync.flushed, 5)
+        self.assertEqual(self.saved_ids(), [1, 2, 3])
+        self.assertEqual(self.employees.get(3).to_dict(), self.company.find_employee_by_id(3).to_dict())
+
+    def test_changes_are_written_on_flush(self):
+        self.sync.flush()
+        self.company.get_department("HR").add_employee(Employee(4, "Петр", "HR", 800))
+        self.company.update_salary(1, 5000)
+        self.company.get_department("IT").remove_employee(2)
+        project = Project(1, "CRM", "", datetime(2030, 1, 1))
+        self.company.add_project(project)
+        project.add_team_member(self.company.find_employee_by_id(4))
+        self.assertEqual(self.saved_ids(), [1, 2, 3])
+
+        self.sync.flush()
+        self.assertEqual(self.saved_ids(), [1, 3, 4])
+        self.assertEqual(self.employees.get(1).base_salary, 5000)
+        self.assertEqual(self.projects.get_team_ids(1), [4])
+
+    def test_rename_moves_employees(self):
+        self.sync.flush()
+        self.company.get_department("IT").name = "Разработка"
+        self.sync.flush()
+        self.assertEqual([employee.id for employee in self.employees.find_by_department("Разработка")], [1, 2])
+        names = [row[0] for row in self.db.get_connection().execute("SELECT name FROM departments ORDER BY name")]
+        self.assertEqual(names, ["HR", "Разработка"])
+
+    def test_failed_flush_keeps_changes(self):
+        self.db.execute_write(
+            "CREATE TRIGGER reject_insert BEFORE INSERT ON employees BEGIN SELECT RAISE(ABORT, 'нельзя'); END"
+        )
+        with self.assertRaises(DatabaseError):
+            self.sync.flush()
+        self.assertEqual(self.sync.pending, 5)
+        self.assertIsNotNone(self.sync.last_error)
+
+        self.db.execute_write("DROP TRIGGER reject_insert")
+        self.sync.flush()
+        self.assertIsNone(self.sync.last_error)
+        self.assertEqual(self.saved_ids(), [1, 2, 3])
+
+    def test_close_flushes_remaining(self):
+        self.company.update_salary(2, 1234)
+        self.sync.close()
+        self.assertEqual(self.employees.get(2).base_salary, 1234)
+        # после закрытия изменения не отслеживаются
+        self.company.update_salary(2, 1)
+        self.assertEqual(self.sync.pending, 0)
+
+    def test_direct_edits_are_written(self):
+        self.sync.flush()
+        manager = self.company.find_employee_by_id(3)
+        developer = self.company.find_employee_by_id(1)
+        manager.bonus = 999
+        developer.add_skill("rust")
+        developer.seniority_level = "senior"
+        self.assertEqual(self.sync.flush(), 2)
+        self.assertEqual(self.employees.get(3).bonus, 999)
+        self.assertEqual(self.employees.get(1).tech_stack, ["python", "rust"])
+        self.assertEqual(self.employees.get(1).seniority_level, "senior")
+        # без новых изменений повторно не пишется
+        self.assertEqual(self.sync.flush(), 0)
+
+        manager.bonus = 1
+        self.sync.close()
+        self.assertEqual(self.employees.get(3).bonus, 1)
+
+    def test_without_full_sync_only_changes_are_written(self):
+        self.sync.close()
+        self.db.execute_write("DELETE FROM employees")
+        sync = CompanySync(self.company, self.db, interval=60, full_sync=False)
+        self.addCleanup(sync.close)
+        self.company.find_employee_by_id(2).base_salary = 1111
+        self.assertEqual(sync.flush(), 1)
+        self.assertEqual(self.saved_ids(), [2])
+
+    def test_requires_thread_safe_company(self):
+        with self.assertRaises(InvalidDataError):
+            CompanySync(make_company(), self.db)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import threading
+import unittest
+from datetime import datetime
+from core_OOP.Department import Department
+from core_OOP.Employee import Employee
+from core_OOP.Project import Project
+from tests.test_company import make_company
+
+
+class Abort(Exception):
+    pass
+
+
+def state(company):
+    """Состав компании, который должен восстановиться после отката"""
+    return (
+        [(dept.name, dept.get_employee_ids()) for dept in company.get_departments()],
+        {emp.id: (emp.department, emp.base_salary) for emp in company.iter_employees()},
+        [(proj.project_id, proj.status, proj.get_team_member_ids()) for proj in company.get_projects()],
+    )
+
+
+class TransactionTest(unittest.TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.project = Project(1, "CRM", "", datetime(2030, 1, 1))
+        self.company.add_project(self.project)
+        self.project.add_team_member(self.company.find_employee_by_id(3))
+
+    def test_commit_applies_changes(self):
+        with self.company.transaction():
+            self.company.update_salary(2, 950)
+            self.company.transfer_employee(2, "IT", "HR")
+        self.assertEqual(self.company.get_employee_department(2).name, "HR")
+        self.assertEqual(self.company.find_employee_by_id(2).base_salary, 950)
+
+    def test_rollback_restores_everything(self):
+        before = state(self.company)
+        with self.assertRaises(Abort):
+            with self.company.transaction():
+                self.company.get_department("IT").add_employee(Employee(4, "Петр", "IT", 800))
+                self.company.update_salary(2, 950)
+                self.company.transfer_employee(2, "IT", "HR")
+                self.company.remove_employee(3, force=True)
+                self.company.add_department(Department("Sales"))
+                self.company.remove_department("IT", force=True)
+                self.project.change_status("active")
+                self.project.add_team_member(self.company.find_employee_by_id(2))
+                raise Abort()
+        self.assertEqual(state(self.company), before)
+        self.assertIsNone(self.company.find_employee_by_id(4))
+        self.assertEqual(len(self.company), 3)
+        self.assertEqual([proj.project_id for proj in self.company.get_employee_projects(3)], [1])
+
+    def test_nested_transaction_is_a_savepoint(self):
+        with self.company.transaction():
+            self.company.update_salary(1, 1100)
+            with self.assertRaises(Abort):
+                with self.company.transaction():
+                    self.company.update_salary(2, 950)
+                    raise Abort()
+        self.assertEqual(self.company.find_employee_by_id(1).base_salary, 1100)
+        self.assertEqual(self.company.find_employee_by_id(2).base_salary, 900)
+
+    def test_transaction_blocks_other_threads(self):
+        company = make_company(thread_safe=True)
+        order = []
+        with company.transaction():
+            thread = threading.Thread(target=lambda: (company.update_salary(2, 950), order.append("thread")))
+            thread.start()
+            thread.join(timeout=0.1)
+            order.append("transaction")
+            self.assertTrue(thread.is_alive())
+        thread.join()
+        self.assertEqual(order, ["transaction", "thread"])
+
+
+if __name__ == "__main__":
+    unittest.main()